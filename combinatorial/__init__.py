@@ -1,6 +1,8 @@
 """Combinatorial algorithms module"""
 
 from .int_perm import perm_to_int
+from .multinomial import multinomial
+from .binomial import Binomial
 
-__all__ = ['perm_to_int']
+__all__ = ['perm_to_int', 'multinomial', 'Binomial']
 
@@ -3,25 +3,61 @@ Author: Mattias de Zalenski, Fredrik Niemelä, Per Austrin, Simon Lindholm
 Date: 2002-09-26
 Source: Max Bennedich
 Description: Computes multinomial coefficient (k1 + ... + kn)! / (k1! * k2! * ... * kn!)
+Small results are a product of binomials C(k1 + ... + ki, ki) (math.comb).
+For large n = k1 + ... + kn the result is built from its prime factorization
+instead: by Legendre's formula, p occurs in m! exactly
+floor(m/p) + floor(m/p^2) + ... times, so p occurs
+e_p = e_p(n!) - sum e_p(ki!) times, and the prime powers are multiplied
+pairwise in a balanced tree so that the big multiplications have similar sizes.
+For results modulo a prime, see Binomial.multinomial.
+Time: O(n log log n + (big-int product of the result))
 Status: Tested on kattis:lexicography
 """
 
+import math
 from typing import List
 
+from number_theory.fast_eratosthenes import fast_eratosthenes
+
+def _product(xs: List[int]) -> int:
+    """Product of xs, multiplied pairwise"""
+    while len(xs) > 1:
+        if len(xs) & 1:
+            xs.append(1)
+        xs = [a * b for a, b in zip(xs[::2], xs[1::2])]
+    return xs[0] if xs else 1
+
+def _legendre(m: int, p: int) -> int:
+    """Exponent of p in m!"""
+    e = 0
+    while m:
+        m //= p
+        e += m
+    return e
+
 def multinomial(v: List[int]) -> int:
     """
     Compute multinomial coefficient.
     v = list of partition sizes
     Returns (sum v_i)! / (v_1! * v_2! * ... * v_n!)
     """
-    if not v:
-        return 1
-    
-    c = 1
-    m = v[0]
-    for i in range(1, len(v)):
-        for j in range(v[i]):
-            m += 1
-            c = c * m // (j + 1)
-    return c
+    n = sum(v)
+    if n < 2048:
+        c = 1
+        s = 0
+        for k in v:
+            s += k
+            c *= math.comb(s, k)
+        return c
 
+    ks = sorted((k for k in v if k > 1), reverse=True)
+    pw = []
+    for p in fast_eratosthenes(n + 1):
+        e = _legendre(n, p)
+        for k in ks:
+            if k < p:
+                break
+            e -= _legendre(k, p)
+        if e:
+            pw.append(p ** e if e > 1 else p)
+    return _product(pw)
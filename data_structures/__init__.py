@@ -4,10 +4,12 @@ from .rmq import RMQ
 from .fenwick_tree import FenwickTree
 from .fenwick_tree_2d import FenwickTree2D
 from .union_find import UnionFind
+from .dynamic_connectivity import DynamicConnectivity, dynamic_connectivity
 from .segment_tree import SegmentTree
-from .lazy_segment_tree import LazySegmentTreeNode
+from .lazy_segment_tree import LazySegmentTreeNode, LazySegmentTree
 from .treap import TreapNode, split, merge, insert, move
 
-__all__ = ['RMQ', 'FenwickTree', 'FenwickTree2D', 'UnionFind', 'SegmentTree',
-           'LazySegmentTreeNode', 'TreapNode', 'split', 'merge', 'insert', 'move']
+__all__ = ['RMQ', 'FenwickTree', 'FenwickTree2D', 'UnionFind',
+           'DynamicConnectivity', 'dynamic_connectivity', 'SegmentTree',
+           'LazySegmentTreeNode', 'LazySegmentTree', 'TreapNode', 'split', 'merge', 'insert', 'move']
 
@@ -0,0 +1,127 @@
+"""
+Author: Unknown
+Date: 2026-10-19
+License: CC0
+Source: https://cp-algorithms.com/data_structures/deleting_in_log_n.html
+Description: Offline dynamic connectivity. Record edge insertions, deletions
+and connectivity queries in order, then solve() answers all queries at once.
+Every edge is alive on an interval of query indices; the interval is stored in
+O(log Q) nodes of a segment tree over time, and a DFS over that tree joins the
+edges of a node on entry and rolls them back on exit (UnionFindRollback).
+Multi-edges are supported; removing an edge that is not present raises KeyError.
+Usage: dc = DynamicConnectivity(n); dc.add_edge(0, 1); dc.connected(0, 1)
+       dc.remove_edge(0, 1); dc.components(); ans = dc.solve()
+Time: O((N + Q) log Q log N)
+Status: stress-tested against rebuilding UnionFind per query
+"""
+
+from typing import Dict, List, Tuple
+
+from .union_find_rollback import UnionFindRollback
+
+class DynamicConnectivity:
+    def __init__(self, n: int):
+        self.n = n
+        self.qs: List[Tuple[int, int]] = []
+        self.open: Dict[Tuple[int, int], List[int]] = {}
+        self.spans: List[Tuple[int, int, int, int]] = []
+
+    def add_edge(self, a: int, b: int):
+        """Insert edge a-b"""
+        key = (a, b) if a < b else (b, a)
+        self.open.setdefault(key, []).append(len(self.qs))
+
+    def remove_edge(self, a: int, b: int):
+        """Delete one copy of edge a-b"""
+        key = (a, b) if a < b else (b, a)
+        starts = self.open[key]
+        l = starts.pop()
+        if not starts:
+            del self.open[key]
+        if l < len(self.qs):
+            self.spans.append((l, len(self.qs), key[0], key[1]))
+
+    def connected(self, a: int, b: int) -> int:
+        """Ask whether a and b are connected now. Returns the query index"""
+        self.qs.append((a, b))
+        return len(self.qs) - 1
+
+    def components(self) -> int:
+        """Ask for the number of components now. Returns the query index"""
+        self.qs.append((-1, -1))
+        return len(self.qs) - 1
+
+    def solve(self) -> List[int]:
+        """
+        Answer all recorded queries: bool for connected(), int for components().
+        Edges that were never removed stay alive until the end.
+        """
+        Q = len(self.qs)
+        if not Q:
+            return []
+        spans = self.spans + [(l, Q, a, b) for (a, b), starts in self.open.items()
+                              for l in starts if l < Q]
+
+        size = 1
+        while size < Q:
+            size *= 2
+        node_eds: List[List[Tuple[int, int]]] = [[] for _ in range(2 * size)]
+        for l, r, a, b in spans:
+            l += size
+            r += size
+            while l < r:
+                if l & 1:
+                    node_eds[l].append((a, b))
+                    l += 1
+                if r & 1:
+                    r -= 1
+                    node_eds[r].append((a, b))
+                l //= 2
+                r //= 2
+
+        uf = UnionFindRollback(self.n)
+        e = uf.e
+        ans = [0] * Q
+        # Iterative DFS; a negative entry means "roll back to time ~x"
+        stack = [1]
+        while stack:
+            v = stack.pop()
+            if v < 0:
+                uf.rollback(~v)
+                continue
+            if v >= size + Q:
+                continue
+            stack.append(~uf.time())
+            for a, b in node_eds[v]:
+                uf.join(a, b)
+            if v >= size:
+                a, b = self.qs[v - size]
+                if a < 0:
+                    ans[v - size] = self.n - uf.time() // 2
+                else:
+                    while e[a] >= 0:
+                        a = e[a]
+                    while e[b] >= 0:
+                        b = e[b]
+                    ans[v - size] = a == b
+            else:
+                stack.append(2 * v + 1)
+                stack.append(2 * v)
+        return ans
+
+def dynamic_connectivity(n: int, ops: List[Tuple[int, int, int]]) -> List[int]:
+    """
+    Bulk interface. ops[i] = (t, a, b) with t = 0 add, 1 remove, 2 connected query,
+    3 component-count query (a, b ignored). Returns answers in query order.
+    """
+    dc = DynamicConnectivity(n)
+    for t, a, b in ops:
+        if t == 0:
+            dc.add_edge(a, b)
+        elif t == 1:
+            dc.remove_edge(a, b)
+        elif t == 2:
+            dc.connected(a, b)
+        else:
+            dc.components()
+    return dc.solve()
@@ -5,10 +5,16 @@ License: CC0
 Source: me
 Description: Segment tree with ability to add or set values of large intervals, and compute max of intervals.
 Can be changed to other things.
+LazySegmentTree is a flat-array, non-recursive version with the same add/set
+updates and a choice of aggregate: kind = 'max', 'min' or 'sum'. f and unit
+are exposed so callers (e.g. HLD) can combine partial query results; unit is
+-inf/inf for max/min, so values of any size are aggregated correctly.
+Usage: st = LazySegmentTree(n, 'sum'); st.add(l, r, x); st.query(l, r)
 Time: O(log N).
 Status: stress-tested a bit
 """
 
+from operator import add
 from typing import List, Optional
 
 INF = 10**9
@@ -87,3 +93,120 @@ class LazySegmentTreeNode:
             self.r.add(self.lo, self.hi, self.madd)
             self.madd = 0
 
+
+_NOSET = object()
+
+class LazySegmentTree:
+    def __init__(self, n: int, kind: str = 'max', v: Optional[List[int]] = None):
+        """
+        Array-backed lazy segment tree over n elements (default all 0).
+        kind = 'max', 'min' or 'sum'
+        """
+        self.n = n
+        self.kind = kind
+        self.f = {'max': max, 'min': min, 'sum': add}[kind]
+        self.unit = {'max': -float('inf'), 'min': float('inf'), 'sum': 0}[kind]
+        self.log = max(n - 1, 0).bit_length()
+        self.size = size = 1 << self.log
+        self.d = [self.unit] * (2 * size)
+        self.mset = [_NOSET] * size
+        self.madd = [0] * size
+        # Number of leaves below each node (only needed for sums)
+        self.ln = [size >> (k.bit_length() - 1) if k else 0 for k in range(2 * size)]
+
+        self.d[size:size + n] = v if v is not None else [0] * n
+        for k in range(size - 1, 0, -1):
+            self.d[k] = self.f(self.d[2 * k], self.d[2 * k + 1])
+
+    def _set_node(self, k: int, x: int):
+        self.d[k] = x * self.ln[k] if self.kind == 'sum' else x
+        if k < self.size:
+            self.mset[k] = x
+            self.madd[k] = 0
+
+    def _add_node(self, k: int, x: int):
+        self.d[k] += x * self.ln[k] if self.kind == 'sum' else x
+        if k < self.size:
+            if self.mset[k] is not _NOSET:
+                self.mset[k] += x
+            else:
+                self.madd[k] += x
+
+    def _push(self, k: int):
+        """Lazy propagation"""
+        if self.mset[k] is not _NOSET:
+            self._set_node(2 * k, self.mset[k])
+            self._set_node(2 * k + 1, self.mset[k])
+            self.mset[k] = _NOSET
+        elif self.madd[k]:
+            self._add_node(2 * k, self.madd[k])
+            self._add_node(2 * k + 1, self.madd[k])
+            self.madd[k] = 0
+
+    def _push_bounds(self, l: int, r: int):
+        """Push lazies on the paths from the root to leaves l and r - 1"""
+        mset, madd = self.mset, self.madd
+        # Below level lo (resp. ro), l (resp. r) is a node boundary
+        lo = (l & -l).bit_length()
+        ro = (r & -r).bit_length()
+        for i in range(self.log, 0, -1):
+            if i >= lo:
+                k = l >> i
+                if madd[k] or mset[k] is not _NOSET:
+                    self._push(k)
+            if i >= ro:
+                k = (r - 1) >> i
+                if madd[k] or mset[k] is not _NOSET:
+                    self._push(k)
+
+    def _apply(self, l: int, r: int, x: int, node_op):
+        if l >= r:
+            return
+        l += self.size
+        r += self.size
+        self._push_bounds(l, r)
+        l2, r2 = l, r
+        while l < r:
+            if l & 1:
+                node_op(l, x)
+                l += 1
+            if r & 1:
+                r -= 1
+                node_op(r, x)
+            l >>= 1
+            r >>= 1
+        d, f = self.d, self.f
+        for i in range((l2 & -l2).bit_length(), self.log + 1):
+            k = l2 >> i
+            d[k] = f(d[2 * k], d[2 * k + 1])
+        for i in range((r2 & -r2).bit_length(), self.log + 1):
+            k = (r2 - 1) >> i
+            d[k] = f(d[2 * k], d[2 * k + 1])
+
+    def add(self, L: int, R: int, x: int):
+        """Add x to all elements in range [L, R)"""
+        self._apply(L, R, x, self._add_node)
+
+    def set(self, L: int, R: int, x: int):
+        """Set all elements in range [L, R) to x"""
+        self._apply(L, R, x, self._set_node)
+
+    def query(self, L: int, R: int) -> int:
+        """Aggregate of range [L, R) (unit if empty)"""
+        if L >= R:
+            return self.unit
+        L += self.size
+        R += self.size
+        self._push_bounds(L, R)
+        d, f = self.d, self.f
+        ra = rb = self.unit
+        while L < R:
+            if L & 1:
+                ra = f(ra, d[L])
+                L += 1
+            if R & 1:
+                R -= 1
+                rb = f(d[R], rb)
+            L >>= 1
+            R >>= 1
+        return f(ra, rb)
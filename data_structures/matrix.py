@@ -4,13 +4,38 @@ Date: 2009-08-03
 License: CC0
 Source: My head
 Description: Basic operations on square matrices.
+TropicalMatrix uses the (min, +) semiring instead, with INF for "no edge":
+(A ** k).d[i][j] is then the cheapest walk from i to j using exactly k edges.
+min_plus computes a single such product row by row.
 Usage: A = Matrix(3); A.d = [[1,2,3],[4,5,6],[7,8,9]]
        vec = [1,2,3]; vec = (A ** N) * vec
+Time: O(N^3) per product
 Status: tested
 """
 
 from typing import List
 
+INF = 10**18
+
+def min_plus(a: List[List[int]], b: List[List[int]]) -> List[List[int]]:
+    """
+    (min, +) product: c[i][j] = min over k of a[i][k] + b[k][j].
+    Missing entries are INF and stay INF in the result.
+    """
+    res = []
+    for ra in a:
+        rc = [INF] * len(b[0])
+        for aik, rb in zip(ra, b):
+            if aik == INF:
+                continue
+            if aik >= 0:
+                # INF + aik >= INF, so missing entries never win the min
+                rc = [y + aik if y + aik < x else x for x, y in zip(rc, rb)]
+            else:
+                rc = [y + aik if y + aik < x and y != INF else x for x, y in zip(rc, rb)]
+        res.append(rc)
+    return res
+
 class Matrix:
     def __init__(self, n: int):
         self.n = n
@@ -53,3 +78,36 @@ class Matrix:
             p >>= 1
         return result
 
+
+class TropicalMatrix(Matrix):
+    def __init__(self, n: int):
+        self.n = n
+        self.d = [[INF] * n for _ in range(n)]
+
+    def __mul__(self, other):
+        """(min, +) product with another TropicalMatrix or with a vector"""
+        if isinstance(other, TropicalMatrix):
+            result = TropicalMatrix(self.n)
+            result.d = min_plus(self.d, other.d)
+            return result
+        elif isinstance(other, list):
+            return [row[0] for row in min_plus(self.d, [[x] for x in other])]
+        else:
+            raise TypeError("Can only multiply TropicalMatrix by TropicalMatrix or list")
+
+    def __pow__(self, p: int):
+        """Tropical exponentiation; the identity has 0 on the diagonal"""
+        assert p >= 0
+        result = TropicalMatrix(self.n)
+        for i in range(self.n):
+            result.d[i][i] = 0
+
+        base = TropicalMatrix(self.n)
+        base.d = [row[:] for row in self.d]
+
+        while p:
+            if p & 1:
+                result = result * base
+            base = base * base
+            p >>= 1
+        return result
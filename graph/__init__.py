@@ -4,19 +4,22 @@ from .lca import LCA
 from .binary_lifting import tree_jump, jump, lca
 from .bellman_ford import bellman_ford, Node, Edge
 from .floyd_warshall import floyd_warshall
-from .topo_sort import topo_sort
-from .scc import scc
+from .shortest_paths import csr_graph, dijkstra, dijkstra_many, zero_one_bfs, bidirectional_dijkstra, spfa
+from .topo_sort import topo_sort, topo_sort_edges
+from .scc import scc, scc_edges
 from .dinic import Dinic
 from .edmonds_karp import edmonds_karp
 from .two_sat import TwoSat
-from .euler_walk import euler_walk
+from .euler_walk import euler_walk, euler_walk_edges
 from .biconnected_components import biconnected_components
 
 __all__ = [
     'LCA', 'tree_jump', 'jump', 'lca',
     'bellman_ford', 'Node', 'Edge',
-    'floyd_warshall', 'topo_sort', 'scc',
+    'floyd_warshall', 'csr_graph', 'dijkstra', 'dijkstra_many',
+    'zero_one_bfs', 'bidirectional_dijkstra', 'spfa',
+    'topo_sort', 'topo_sort_edges', 'scc', 'scc_edges',
     'Dinic', 'edmonds_karp', 'TwoSat',
-    'euler_walk', 'biconnected_components'
+    'euler_walk', 'euler_walk_edges', 'biconnected_components'
 ]
 
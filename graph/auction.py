@@ -0,0 +1,71 @@
+"""
+Author: Unknown
+Date: 2026-10-19
+License: CC0
+Source: D.P. Bertsekas, "The auction algorithm: a distributed relaxation method
+for the assignment problem" (1988)
+Description: Min-cost perfect matching on a sparse bipartite graph with
+integer costs, via epsilon-scaling auction. adj[i] = list of (j, cost) for
+left node i; there are n left and n right nodes. Returns (min cost, match)
+like hungarian, or None if no perfect matching exists (checked up front with
+Hopcroft-Karp). Costs are scaled by n + 1 so the final eps = 1 phase is exact.
+Prefer hungarian for dense inputs; this only touches the listed edges.
+Time: O(n E log(n C)) worst case, much faster in practice
+Status: stress-tested against hungarian
+"""
+
+from typing import List, Optional, Tuple
+
+from .hopcroft_karp import hopcroft_karp
+
+def auction(adj: List[List[Tuple[int, int]]]) -> Optional[Tuple[int, List[int]]]:
+    """
+    Auction algorithm for minimum cost perfect matching.
+    adj[i] = list of (j, cost) pairs, right nodes 0..n-1
+    Returns (min_cost, match) where L[i] is matched with R[match[i]], or None
+    """
+    n = len(adj)
+    if hopcroft_karp([[j for j, _ in row] for row in adj], [-1] * n) < n:
+        return None
+    if not n:
+        return (0, [])
+
+    # Benefits (to maximize) scaled so that n * eps < 1 in original units
+    ben = [[-c * (n + 1) for _, c in row] for row in adj]
+    tgt = [[j for j, _ in row] for row in adj]
+    big = 2 * max(abs(b) for row in ben for b in row) + 1
+    price = [0] * n
+    eps = max(1, big // 4)
+
+    while True:
+        owner = [-1] * n
+        match = [-1] * n
+        todo = list(range(n))
+        while todo:
+            i = todo.pop()
+            best = second = float('-inf')
+            bj = -1
+            for j, b in zip(tgt[i], ben[i]):
+                val = b - price[j]
+                if val > best:
+                    second = best
+                    best = val
+                    bj = j
+                elif val > second:
+                    second = val
+            if second == float('-inf'):
+                second = best - big
+            price[bj] += best - second + eps
+            if owner[bj] != -1:
+                match[owner[bj]] = -1
+                todo.append(owner[bj])
+            owner[bj] = i
+            match[i] = bj
+        if eps == 1:
+            break
+        eps = max(1, eps // 4)
+
+    cost = 0
+    for i in range(n):
+        cost += min(c for j, c in adj[i] if j == match[i])
+    return (cost, match)
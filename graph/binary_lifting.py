@@ -6,11 +6,20 @@ Source: Folklore
 Description: Calculate power of two jumps in a tree,
 to support fast upward jumps and LCAs.
 Assumes the root node points to itself.
-Time: construction O(N log N), queries O(log N)
+Each level of the table is one gather of the previous level (jmp[i] = jmp[i-1][jmp[i-1]]).
+BinaryLifting keeps the levels as int32 arrays together with depths, and answers
+whole batches with jump_many (one pass over the batch per level) and lca_many.
+lca_many is a convenience loop over the queries with the per-query lifting
+inlined; a lockstep version (one comprehension per level) was slower in CPython.
+LevelAncestor adds ladders (long-path decomposition) for O(1) k-th ancestor queries.
+Jumps past the root stop at the root.
+Time: construction O(N log N), queries O(log N), LevelAncestor.ancestor O(1)
 Status: Tested at Petrozavodsk, also stress-tested via LCA.cpp
 """
 
-from typing import List
+from array import array
+from operator import add
+from typing import List, Sequence
 
 def tree_jump(P: List[int]) -> List[List[int]]:
     """
@@ -23,12 +32,12 @@ def tree_jump(P: List[int]) -> List[List[int]]:
     while on < len(P):
         on *= 2
         d += 1
-    
-    jmp = [P[:] for _ in range(d)]
+
+    jmp = [P[:]]
     for i in range(1, d):
-        for j in range(len(P)):
-            jmp[i][j] = jmp[i - 1][jmp[i - 1][j]]
-    
+        prev = jmp[-1]
+        jmp.append([prev[x] for x in prev])
+
     return jmp
 
 def jump(tbl: List[List[int]], nod: int, steps: int) -> int:
@@ -52,3 +61,114 @@ def lca(tbl: List[List[int]], depth: List[int], a: int, b: int) -> int:
             a = c
             b = d
     return tbl[0][a]
+
+class BinaryLifting:
+    def __init__(self, P: Sequence[int]):
+        """P[i] = parent of node i (roots point to themselves)"""
+        n = len(P)
+        self.jmp = [array('i', P)]
+        while (1 << len(self.jmp)) < n:
+            prev = self.jmp[-1]
+            self.jmp.append(array('i', [prev[x] for x in prev]))
+
+        # Depths by pointer jumping: after level i, dist[v] = min(2^(i+1), depth of v)
+        dist = [int(p != v) for v, p in enumerate(P)]
+        for t in self.jmp:
+            nxt = list(map(add, dist, map(dist.__getitem__, t)))
+            if nxt == dist:
+                break
+            dist = nxt
+        self.depth = array('i', dist)
+
+    def jump(self, nod: int, steps: int) -> int:
+        """Jump 'steps' ancestors up from node 'nod'"""
+        steps = min(steps, self.depth[nod])
+        for i, t in enumerate(self.jmp):
+            if steps >> i & 1:
+                nod = t[nod]
+        return nod
+
+    def lca(self, a: int, b: int) -> int:
+        """Find lowest common ancestor of nodes a and b"""
+        return lca(self.jmp, self.depth, a, b)
+
+    def jump_many(self, nodes: Sequence[int], steps: Sequence[int]) -> List[int]:
+        """Jump steps[q] ancestors up from nodes[q], for every q"""
+        cur = list(nodes)
+        dep = self.depth
+        steps = [min(s, dep[c]) for c, s in zip(cur, steps)]
+        for i, t in enumerate(self.jmp):
+            cur = [t[c] if s >> i & 1 else c for c, s in zip(cur, steps)]
+        return cur
+
+    def lca_many(self, a: Sequence[int], b: Sequence[int]) -> List[int]:
+        """Lowest common ancestors of (a[q], b[q]) for every q (one query at a time)"""
+        dep = self.depth
+        levels = self.jmp[::-1]
+        t0 = self.jmp[0]
+        res = []
+        for x, y in zip(a, b):
+            if dep[x] < dep[y]:
+                x, y = y, x
+            d = dep[x] - dep[y]
+            i = 0
+            while d:
+                if d & 1:
+                    x = self.jmp[i][x]
+                d >>= 1
+                i += 1
+            if x != y:
+                for t in levels:
+                    c = t[x]
+                    e = t[y]
+                    if c != e:
+                        x = c
+                        y = e
+                x = t0[x]
+            res.append(x)
+        return res
+
+class LevelAncestor(BinaryLifting):
+    def __init__(self, P: Sequence[int]):
+        super().__init__(P)
+        n = len(P)
+        dep = self.depth
+
+        # Height of each subtree and the child on its longest downward path
+        order = sorted(range(n), key=dep.__getitem__)
+        h = [0] * n
+        down = [-1] * n
+        for v in reversed(order):
+            p = P[v]
+            if p != v and h[v] + 1 > h[p]:
+                h[p] = h[v] + 1
+                down[p] = v
+
+        # Ladders: each long path, extended upwards by its own length
+        self.flat = flat = []
+        self.pos = pos = [0] * n
+        for v in order:
+            p = P[v]
+            if p != v and down[p] == v:
+                continue
+            path = [v]
+            while down[path[-1]] != -1:
+                path.append(down[path[-1]])
+            ext = []
+            u = v
+            while len(ext) < len(path) and P[u] != u:
+                u = P[u]
+                ext.append(u)
+            flat.extend(reversed(ext))
+            for u in path:
+                pos[u] = len(flat)
+                flat.append(u)
+
+    def ancestor(self, v: int, k: int) -> int:
+        """k-th ancestor of v in O(1)"""
+        k = min(k, self.depth[v])
+        if not k:
+            return v
+        i = k.bit_length() - 1
+        u = self.jmp[i][v]
+        return self.flat[self.pos[u] - (k - (1 << i))]
@@ -7,11 +7,16 @@ subtree that contains all the nodes by adding all (at most |S|-1)
 pairwise LCA's and compressing edges.
 Returns a list of (parent, original_index) representing a tree rooted at 0.
 The root points to itself.
+compress_tree_many handles many subsets at once: all of them are sorted by
+(subset, DFS time) in one sort and every adjacent-pair LCA goes through a
+single lca_many call (if the structure has one). It returns CSR-style arrays
+(off, nodes, par): subset s owns positions off[s]..off[s+1]-1, and par holds
+the parent's position within the same subset (the root points to itself).
 Time: O(|S| log |S|)
 Status: Tested at CodeForces
 """
 
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 def compress_tree(lca_structure, subset: List[int]) -> List[Tuple[int, int]]:
     """
@@ -49,3 +54,47 @@ def compress_tree(lca_structure, subset: List[int]) -> List[Tuple[int, int]]:
     
     return ret
 
+
+def compress_tree_many(lca_structure, subsets: Sequence[Sequence[int]]) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Compress tree for every subset in one batch.
+    Returns (off, nodes, par); see the description above
+    """
+    T = lca_structure.time
+    N = len(T)
+    lca_many = getattr(lca_structure, 'lca_many', None)
+    if lca_many is None:
+        lca_many = lambda a, b: list(map(lca_structure.lca, a, b))
+    at = [0] * N
+    for v in range(N):
+        at[T[v]] = v
+
+    def adjacent(keys):
+        """Indices i where keys[i] and keys[i + 1] belong to the same subset"""
+        return [i for i in range(len(keys) - 1) if keys[i] // N == keys[i + 1] // N]
+
+    # Keys are subset * N + DFS time, so one sort orders every subset
+    keys = sorted(set(s * N + T[x] for s, sub in enumerate(subsets) for x in sub))
+    idx = adjacent(keys)
+    ls = lca_many([at[keys[i] % N] for i in idx], [at[keys[i + 1] % N] for i in idx])
+    keys = sorted(set(keys).union(keys[i] - keys[i] % N + T[l] for i, l in zip(idx, ls)))
+
+    off = [0] * (len(subsets) + 1)
+    for k in keys:
+        off[k // N + 1] += 1
+    for s in range(len(subsets)):
+        off[s + 1] += off[s]
+
+    nodes = [at[k % N] for k in keys]
+    pos = {k: i for i, k in enumerate(keys)}
+    par = list(range(len(keys)))
+    for s in range(len(subsets)):
+        if off[s] < off[s + 1]:
+            par[off[s]] = 0
+    idx = adjacent(keys)
+    ls = lca_many([nodes[i] for i in idx], [nodes[i + 1] for i in idx])
+    for i, l in zip(idx, ls):
+        s = keys[i] // N
+        par[i + 1] = pos[s * N + T[l]] - off[s]
+
+    return off, nodes, par
@@ -0,0 +1,52 @@
+"""
+Author: Unknown
+Date: 2026-10-19
+License: CC0
+Source: folklore
+Description: Compressed sparse row (CSR) adjacency from parallel edge arrays.
+Edges out of node v are nbr[start[v]:start[v+1]], and eid[k] is the index of
+the input edge stored at position k (so weights are gathered as w[eid[k]]).
+Edges keep their input order within each row (counting sort).
+With a typecode the three outputs are array.array instead of lists, which
+needs 4 bytes per entry for 'i' (for graphs with tens of millions of edges).
+Usage: start, nbr, eid = to_csr(n, [a for a, b in eds], [b for a, b in eds])
+Time: O(V + E)
+Status: tested through shortest_paths
+"""
+
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+def to_csr(n: int, a: Sequence[int], b: Sequence[int],
+           typecode: Optional[str] = None) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Build CSR arrays for the directed edges a[i] -> b[i].
+    Returns (start, nbr, eid) with len(start) == n + 1
+    """
+    m = len(a)
+    if typecode is not None:
+        start = array(typecode, [0]) * (n + 1)
+        nbr = array(typecode, [0]) * m
+        eid = array(typecode, [0]) * m
+    else:
+        start = [0] * (n + 1)
+        nbr = [0] * m
+        eid = [0] * m
+    for x in a:
+        start[x + 1] += 1
+    for i in range(n):
+        start[i + 1] += start[i]
+
+    pos = start[:n]
+    for i in range(m):
+        x = a[i]
+        p = pos[x]
+        nbr[p] = b[i]
+        eid[p] = i
+        pos[x] = p + 1
+
+    return start, nbr, eid
+
+def gather(vals: Sequence, eid: Sequence[int]) -> List:
+    """Permute per-edge values into CSR order: out[k] = vals[eid[k]]"""
+    return [vals[e] for e in eid]
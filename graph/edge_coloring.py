@@ -5,13 +5,52 @@ License: CC0
 Source: https://en.wikipedia.org/wiki/Misra_%26_Gries_edge_coloring_algorithm
 Description: Given a simple, undirected graph with max degree D, computes a
 (D + 1)-coloring of the edges such that no neighboring edges share a color.
-(D-coloring is NP-hard, but can be done for bipartite graphs by repeated
-matchings of max-degree nodes.)
-Time: O(NM)
+(D-coloring is NP-hard, but can be done for bipartite graphs, see
+bipartite_edge_coloring.)
+Each vertex keeps a dict color -> neighbor and a bitmask of used colors, so
+its smallest free color is the lowest zero bit of the mask. Kempe chains are
+collected into a buffer first and then flipped in one pass.
+bipartite_edge_coloring colors a bipartite graph with exactly D colors: if the
+smallest free colors a at u and b at v differ, the a/b chain from v cannot end
+in u, so flipping it frees a at both endpoints.
+Time: O(NM) worst case, typically much faster
 Status: stress-tested, tested on kattis:gamescheduling
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+def _chain(adj: List[Dict[int, int]], x: int, c: int, d: int) -> List[int]:
+    """Vertices of the c/d alternating path leaving x along color c"""
+    path = [x]
+    x = adj[x].get(c)
+    while x is not None:
+        path.append(x)
+        c, d = d, c
+        x = adj[x].get(c)
+    return path
+
+def _flip(adj: List[Dict[int, int]], used: List[int], path: List[int], c: int, d: int):
+    """Swap colors c and d on all edges of a Kempe chain"""
+    both = 1 << c | 1 << d
+    for x in path:
+        ax = adj[x]
+        p = ax.pop(c, None)
+        q = ax.pop(d, None)
+        if p is not None:
+            ax[d] = p
+        if q is not None:
+            ax[c] = q
+        if (p is None) != (q is None):
+            used[x] ^= both
+
+def _colors(adj: List[Dict[int, int]], edges: List[Tuple[int, int]]) -> List[int]:
+    """Read off the color of every input edge"""
+    col = [{} for _ in adj]
+    for u, au in enumerate(adj):
+        cu = col[u]
+        for c, w in au.items():
+            cu[w] = c
+    return [col[u][v] for u, v in edges]
 
 def edge_coloring(N: int, edges: List[Tuple[int, int]]) -> List[int]:
     """
@@ -20,83 +59,78 @@ def edge_coloring(N: int, edges: List[Tuple[int, int]]) -> List[int]:
     edges = list of (u, v) edges
     Returns list of colors for each edge
     """
-    # Count degrees
-    cc = [0] * (N + 1)
+    # adj[u][c] = vertex adjacent to u with color c; bit c of used[u] is set iff c is taken
+    adj = [{} for _ in range(N)]
+    used = [0] * N
+
     for u, v in edges:
-        cc[u] += 1
-        cc[v] += 1
-    
-    ncols = max(cc) + 1
-    ret = [0] * len(edges)
-    
-    # adj[u][c] = vertex adjacent to u with color c (or -1)
-    adj = [[-1] * ncols for _ in range(N)]
-    free = [0] * N  # free[u] = smallest free color at u
-    
-    fan = [0] * N
-    cc_list = [0] * ncols
-    loc = [0] * ncols
-    
-    for edge_idx, (u, v) in enumerate(edges):
-        fan[0] = v
-        for i in range(ncols):
-            loc[i] = 0
-        
-        c = free[u]
-        ind = 0
-        
-        # Build fan
+        m = used[u]
+        c = ((m + 1) & ~m).bit_length() - 1
+
+        # Build fan: fan[i] is joined to u by color cc[i]
+        fan = [v]
+        cc = [c]
+        loc = {}
         while True:
-            d = free[v]
-            if loc[d]:
+            m = used[v]
+            d = ((m + 1) & ~m).bit_length() - 1
+            if d in loc:
                 break
-            if adj[u][d] == -1:
+            w = adj[u].get(d)
+            if w is None:
                 break
-            v = adj[u][d]
-            ind += 1
-            loc[d] = ind
-            cc_list[ind] = d
-            fan[ind] = v
-        
-        cc_list[loc[d]] = c
-        
-        # Invert path
-        cd = d
-        at = u
-        end = u
-        while at != -1:
-            next_at = adj[at][cd]
-            adj[at][cd], adj[end][cd ^ c ^ d] = adj[end][cd ^ c ^ d], adj[at][cd]
-            end = at
-            at = next_at
-            cd ^= c ^ d
-        
+            loc[d] = len(fan)
+            cc.append(d)
+            fan.append(w)
+            v = w
+        cc[loc.get(d, 0)] = c
+
+        # Invert the d/c path starting at u
+        if c != d:
+            _flip(adj, used, _chain(adj, u, d, c), c, d)
+
         # Rotate fan
+        au = adj[u]
         i = 0
-        while adj[fan[i]][d] != -1:
+        while d in adj[fan[i]]:
             left = fan[i]
             i += 1
             right = fan[i]
-            e = cc_list[i]
-            adj[u][e] = left
+            e = cc[i]
+            au[e] = left
             adj[left][e] = u
-            adj[right][e] = -1
-            free[right] = e
-        
-        adj[u][d] = fan[i]
-        adj[fan[i]][d] = u
-        
-        # Update free colors
-        for y in [fan[0], u, end]:
-            free[y] = 0
-            while adj[y][free[y]] != -1:
-                free[y] += 1
-    
-    # Determine colors
-    for i, (u, v) in enumerate(edges):
-        ret[i] = 0
-        while adj[u][ret[i]] != v:
-            ret[i] += 1
-    
-    return ret
+            used[left] |= 1 << e
+            del adj[right][e]
+            used[right] &= ~(1 << e)
+
+        w = fan[i]
+        au[d] = w
+        adj[w][d] = u
+        used[u] |= 1 << d
+        used[w] |= 1 << d
+
+    return _colors(adj, edges)
+
+def bipartite_edge_coloring(N: int, edges: List[Tuple[int, int]]) -> List[int]:
+    """
+    Edge coloring of a bipartite graph with D colors where D is max degree.
+    N = number of nodes
+    edges = list of (u, v) edges
+    Returns list of colors for each edge
+    """
+    adj = [{} for _ in range(N)]
+    used = [0] * N
+
+    for u, v in edges:
+        m = used[u]
+        a = ((m + 1) & ~m).bit_length() - 1
+        if a in adj[v]:
+            m = used[v]
+            b = ((m + 1) & ~m).bit_length() - 1
+            _flip(adj, used, _chain(adj, v, a, b), a, b)
+        adj[u][a] = v
+        adj[v][a] = u
+        used[u] |= 1 << a
+        used[v] |= 1 << a
 
+    return _colors(adj, edges)
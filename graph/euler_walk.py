@@ -8,11 +8,17 @@ Input should be a list of (dest, global edge index), where
 for undirected graphs, forward/backward edges have the same index.
 Returns a list of nodes in the Eulerian path/cycle with src at both start and end, or
 empty list if no cycle/path exists.
+euler_walk_edges(n, a, b, src, directed) works on edge arrays (edge i is
+a[i] -> b[i], or a[i] - b[i] if undirected) and returns the walk as an int
+array of edge ids, or None if no cycle/path exists.
 Time: O(V + E)
 Status: stress-tested
 """
 
-from typing import List, Tuple
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+from .csr import to_csr
 
 def euler_walk(gr: List[List[Tuple[int, int]]], nedges: int, src: int = 0) -> List[int]:
     """
@@ -57,3 +63,50 @@ def euler_walk(gr: List[List[Tuple[int, int]]], nedges: int, src: int = 0) -> Li
     
     return ret[::-1]
 
+
+def euler_walk_edges(n: int, a: Sequence[int], b: Sequence[int], src: int = 0,
+                     directed: bool = True) -> Optional[array]:
+    """
+    Find Eulerian path/cycle starting at src, given as edge arrays.
+    Returns int array of edge ids in walk order, or None if none exists
+    """
+    m = len(a)
+    if directed:
+        start, nbr, eid = to_csr(n, a, b, 'i')
+    else:
+        start, nbr, eid = to_csr(n, list(a) + list(b), list(b) + list(a), 'i')
+    D = [0] * n
+    its = start[:n]
+    used = bytearray(m)
+    ret = array('i')
+    s = [src]
+    se = [-1]
+
+    D[src] += 1  # to allow Euler paths, not just cycles
+
+    while s:
+        x = s[-1]
+        it = its[x]
+        if it == start[x + 1]:
+            s.pop()
+            e = se.pop()
+            if e >= 0:
+                ret.append(e)
+            continue
+
+        its[x] = it + 1
+        e = eid[it]
+        if e >= m:
+            e -= m
+        if not used[e]:
+            y = nbr[it]
+            D[x] -= 1
+            D[y] += 1
+            used[e] = 1
+            s.append(y)
+            se.append(e)
+
+    if len(ret) != m or min(D) < 0:
+        return None
+    ret.reverse()
+    return ret
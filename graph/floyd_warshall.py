@@ -7,39 +7,83 @@ Description: Calculates all-pairs shortest path in a directed graph that might h
 Input is a distance matrix m, where m[i][j] = inf if i and j are not adjacent.
 As output, m[i][j] is set to the shortest distance between i and j, inf if no path,
 or -inf if the path goes through a negative-weight cycle.
+Each k-iteration relaxes whole rows at once against the row of k, which is
+several times faster than indexing m[i][j] one entry at a time.
+With paths=True, also returns nxt where nxt[i][j] is the node after i on a
+shortest i-j path (-1 if there is none); see get_path.
 Time: O(N^3)
-Status: slightly tested
+Status: stress-tested against bellman_ford
 """
 
-from typing import List
+from itertools import compress, repeat
+from operator import add, lt
+from typing import List, Optional
 
 INF = 10**18
 
-def floyd_warshall(m: List[List[int]]):
+def floyd_warshall(m: List[List[int]], paths: bool = False) -> Optional[List[List[int]]]:
     """
     All-pairs shortest path with negative weights.
     m = adjacency matrix (modified in-place)
     m[i][j] = weight of edge i->j, or INF if no edge
     After: m[i][j] = shortest path distance, INF if unreachable, -INF if negative cycle
+    Returns the next-hop matrix if paths is set, else None
     """
     n = len(m)
-    
+    nxt = None
+    if paths:
+        nxt = [[j if x != INF else -1 for j, x in enumerate(row)] for row in m]
+
     # Initialize diagonal
     for i in range(n):
-        m[i][i] = min(m[i][i], 0)
-    
-    # Floyd-Warshall
+        if m[i][i] > 0:
+            m[i][i] = 0
+            if paths:
+                nxt[i][i] = i
+
+    # Floyd-Warshall, one row of the matrix per step
     for k in range(n):
+        rk = m[k]
         for i in range(n):
-            for j in range(n):
-                if m[i][k] != INF and m[k][j] != INF:
-                    new_dist = max(m[i][k] + m[k][j], -INF)
-                    m[i][j] = min(m[i][j], new_dist)
-    
+            ri = m[i]
+            mik = ri[k]
+            if mik == INF:
+                continue
+            if paths:
+                hop = nxt[i][k]
+                ni = nxt[i]
+                for j in compress(range(n), map(lt, map(add, rk, repeat(mik)), ri)):
+                    if rk[j] != INF:
+                        ri[j] = max(rk[j] + mik, -INF)
+                        ni[j] = hop
+            elif mik >= 0:
+                # INF + mik >= INF, so missing edges never win the min
+                ri[:] = [y + mik if y + mik < x else x for x, y in zip(ri, rk)]
+            else:
+                ri[:] = [max(y + mik, -INF) if y + mik < x and y != INF else x
+                         for x, y in zip(ri, rk)]
+
     # Detect and propagate negative cycles
     for k in range(n):
         if m[k][k] < 0:
+            fin = [j for j, x in enumerate(m[k]) if x != INF]
             for i in range(n):
-                for j in range(n):
-                    if m[i][k] != INF and m[k][j] != INF:
-                        m[i][j] = -INF
+                ri = m[i]
+                if ri[k] != INF:
+                    for j in fin:
+                        ri[j] = -INF
+
+    return nxt
+
+def get_path(m: List[List[int]], nxt: List[List[int]], u: int, v: int) -> List[int]:
+    """
+    Nodes on a shortest u-v path from floyd_warshall(m, paths=True).
+    Returns an empty list if v is unreachable or the distance is -INF
+    """
+    if m[u][v] in (INF, -INF):
+        return []
+    path = [u]
+    while u != v:
+        u = nxt[u][v]
+        path.append(u)
+    return path
@@ -2,14 +2,32 @@
 Author: Simon Lindholm
 Date: 2021-01-09
 License: CC0
-Source: https://en.wikipedia.org/wiki/Stoer–Wagner_algorithm
+Source: https://en.wikipedia.org/wiki/Stoer–Wagner_algorithm,
+Karger & Stein, "A new approach to the minimum cut problem" (1996)
 Description: Find a global minimum cut in an undirected graph,
 as represented by an adjacency matrix.
-Time: O(V^3)
+Merged nodes are removed from the matrix, and each phase step is one argmax
+over the weight vector followed by a whole-row add (map over the row),
+so the inner loops run in C.
+global_min_cut_sparse takes (u, v, w) edges and runs each phase with a heap
+over dict adjacencies, which is much faster for sparse graphs.
+karger_stein is a randomized alternative (correct with high probability given
+enough trials, default log^2 V); the trials can be spread over a process pool.
+Contracting edges in order of Exp(w)-distributed keys picks them with
+probability proportional to weight.
+Time: O(V^3) for global_min_cut, O(V E log V) for global_min_cut_sparse,
+O(V^2 log^3 V) for karger_stein with the default number of trials
+(its recursion switches to exact Stoer-Wagner at 48 nodes)
 Status: Stress-tested together with GomoryHu
 """
 
-from typing import List, Tuple
+import math
+import random
+from heapq import heappop, heappush
+from operator import add
+from typing import List, Optional, Sequence, Tuple
+
+from data_structures.union_find import UnionFind
 
 def global_min_cut(mat: List[List[int]]) -> Tuple[int, List[int]]:
     """
@@ -18,40 +36,185 @@ def global_min_cut(mat: List[List[int]]) -> Tuple[int, List[int]]:
     Returns (cut_weight, nodes_on_one_side)
     """
     n = len(mat)
-    mat = [row[:] for row in mat]  # Copy matrix
-    
+    # Diagonal (self loops) never crosses a cut
+    mat = [[0 if i == j else x for j, x in enumerate(row)] for i, row in enumerate(mat)]
+
     best_weight = float('inf')
     best_cut = []
-    
+
     # co[i] = list of original nodes merged into node i
     co = [[i] for i in range(n)]
-    
-    for ph in range(1, n):
+
+    while len(mat) > 1:
+        k = len(mat)
         w = mat[0][:]
+        w[0] = float('-inf')
         s = 0
         t = 0
-        
-        for it in range(n - ph):
-            w[t] = float('-inf')
+        for it in range(k - 1):
             s = t
             # Find node with maximum weight
-            t = max(range(n), key=lambda i: w[i])
-            # Update weights
-            for i in range(n):
-                w[i] += mat[t][i]
-        
+            t = w.index(max(w))
+            if it < k - 2:
+                w = list(map(add, w, mat[t]))
+                w[t] = float('-inf')
+
         # Check if this is a better cut
-        cut_weight = w[t] - mat[t][t]
-        if cut_weight < best_weight:
-            best_weight = cut_weight
+        if w[t] < best_weight:
+            best_weight = w[t]
             best_cut = co[t][:]
-        
+
+        # Merge t into s, then drop t
+        co[s].extend(co.pop(t))
+        mat[s] = list(map(add, mat[s], mat[t]))
+        for row in mat:
+            row[s] += row[t]
+            del row[t]
+        del mat[t]
+        if t < s:
+            s -= 1
+        mat[s][s] = 0
+
+    return (int(best_weight), best_cut)
+
+def global_min_cut_sparse(n: int, edges: Sequence[Tuple[int, int, int]]) -> Tuple[int, List[int]]:
+    """
+    Find global minimum cut given undirected edges (u, v, w), w >= 0.
+    Returns (cut_weight, nodes_on_one_side); ValueError if n < 2 (no cut exists)
+    """
+    if n < 2:
+        raise ValueError("A cut needs at least 2 nodes")
+    adj = [{} for _ in range(n)]
+    for u, v, w in edges:
+        if u != v:
+            adj[u][v] = adj[u].get(v, 0) + w
+            adj[v][u] = adj[v].get(u, 0) + w
+    co = [[i] for i in range(n)]
+    alive = set(range(n))
+
+    best_weight = float('inf')
+    best_cut = []
+
+    while len(alive) > 1:
+        # Maximum adjacency order, with lazy deletion from the heap
+        a = next(iter(alive))
+        key = {a: 0}
+        done = set()
+        heap = [(0, a)]
+        s = t = a
+        cut = 0
+        while heap:
+            k, v = heappop(heap)
+            if v in done or -k != key[v]:
+                continue
+            done.add(v)
+            s, t = t, v
+            cut = -k
+            for x, c in adj[v].items():
+                if x not in done:
+                    key[x] = kx = key.get(x, 0) + c
+                    heappush(heap, (-kx, x))
+
+        if len(done) < len(alive):
+            # Disconnected: the part found is a cut of weight 0
+            return (0, [x for v in done for x in co[v]])
+
+        if cut < best_weight:
+            best_weight = cut
+            best_cut = co[t][:]
+
         # Merge t into s
         co[s].extend(co[t])
-        for i in range(n):
-            mat[s][i] += mat[t][i]
-            mat[i][s] = mat[s][i]
-        mat[0][t] = float('-inf')
-    
+        co[t] = []
+        alive.discard(t)
+        at = adj[t]
+        as_ = adj[s]
+        for x, c in at.items():
+            ax = adj[x]
+            del ax[t]
+            if x != s:
+                as_[x] = as_.get(x, 0) + c
+                ax[s] = ax.get(s, 0) + c
+        adj[t] = {}
+
     return (int(best_weight), best_cut)
 
+def _contract(n: int, edges: List[Tuple[int, int, int]], target: int,
+              rng: random.Random) -> Tuple[int, List[Tuple[int, int, int]], List[int]]:
+    """
+    Contract random edges (by weight) until target nodes are left.
+    Returns (new n, new edges, new label of each old node)
+    """
+    keys = [-math.log(1.0 - rng.random()) / w for u, v, w in edges]
+    uf = UnionFind(n)
+    comps = n
+    for i in sorted(range(len(edges)), key=keys.__getitem__):
+        if comps <= target:
+            break
+        u, v, w = edges[i]
+        if uf.join(u, v):
+            comps -= 1
+
+    lab = [-1] * n
+    m = 0
+    for v in range(n):
+        r = uf.find(v)
+        if lab[r] < 0:
+            lab[r] = m
+            m += 1
+        lab[v] = lab[r]
+    merged = {}
+    for u, v, w in edges:
+        a = lab[u]
+        b = lab[v]
+        if a != b:
+            if a > b:
+                a, b = b, a
+            merged[a, b] = merged.get((a, b), 0) + w
+    return m, [(a, b, w) for (a, b), w in merged.items()], lab
+
+def _karger_stein(n: int, edges: List[Tuple[int, int, int]],
+                  rng: random.Random) -> Tuple[int, List[int]]:
+    """One recursive Karger-Stein run. Returns (cut_weight, nodes_on_one_side)"""
+    if n <= 48:
+        # Small enough to finish exactly
+        return global_min_cut_sparse(n, edges)
+    target = int(math.ceil(1 + n / math.sqrt(2)))
+    best = None
+    for _ in range(2):
+        m, sub, lab = _contract(n, edges, target, rng)
+        if m > target:
+            # Ran out of edges, so the graph is disconnected
+            return global_min_cut_sparse(n, edges)
+        w, side = _karger_stein(m, sub, rng)
+        if best is None or w < best[0]:
+            inside = set(side)
+            best = (w, [v for v in range(n) if lab[v] in inside])
+    return best
+
+def _trial(args) -> Tuple[int, List[int]]:
+    """Process-pool worker: one Karger-Stein run with its own seed"""
+    n, edges, seed = args
+    return _karger_stein(n, edges, random.Random(seed))
+
+def karger_stein(n: int, edges: Sequence[Tuple[int, int, int]], trials: Optional[int] = None,
+                 processes: Optional[int] = None, seed: Optional[int] = None) -> Tuple[int, List[int]]:
+    """
+    Randomized global minimum cut given undirected edges (u, v, w), w >= 0.
+    Returns the best (cut_weight, nodes_on_one_side) over all trials;
+    ValueError if n < 2 (no cut exists)
+    """
+    if n < 2:
+        raise ValueError("A cut needs at least 2 nodes")
+    edges = [(u, v, w) for u, v, w in edges if u != v and w > 0]
+    if trials is None:
+        trials = max(1, math.ceil(math.log2(max(n, 2))) ** 2)
+    rng = random.Random(seed)
+    tasks = [(n, edges, rng.getrandbits(64)) for _ in range(trials)]
+    if processes:
+        from multiprocessing import Pool
+        with Pool(processes) as pool:
+            results = pool.map(_trial, tasks)
+    else:
+        results = [_trial(t) for t in tasks]
+    return min(results, key=lambda r: r[0])
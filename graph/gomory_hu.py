@@ -24,14 +24,13 @@ def gomory_hu(N: int, edges: List[Tuple[int, int, int]]) -> List[Tuple[int, int,
     """
     tree = []
     par = [0] * N
+    flow = PushRelabel(N)
+    for u, v, cap in edges:
+        flow.add_edge(u, v, cap, cap)  # Undirected
     
     for i in range(1, N):
-        # Run max flow between i and par[i]
-        flow = PushRelabel(N)
-        for u, v, cap in edges:
-            flow.add_edge(u, v, cap, cap)  # Undirected
-        
-        flow_value = flow.calc(i, par[i])
+        # Run max flow between i and par[i]; only the cut is needed
+        flow_value = flow.calc(i, par[i], min_cut_only=True)
         tree.append((i, par[i], flow_value))
         
         # Update parents based on min cut
@@ -8,100 +8,123 @@ and light edges such that the path from any leaf to the root contains at most lo
 light edges. Supports path and subtree queries/updates.
 VALS_EDGES=True means values are stored in edges, False means nodes.
 Root must be 0.
+Values live in a LazySegmentTree (data_structures/lazy_segment_tree.py) over
+HLD positions; kind picks the aggregate ('max', 'min' or 'sum'), or pass any
+object with add/set/query(l, r), f and unit as tree. Both DFS passes are iterative.
 Time: O((log N)^2)
 Status: stress-tested
 """
 
-from typing import List, Callable
+from typing import Callable, List, Optional, Tuple
+
+from data_structures.lazy_segment_tree import LazySegmentTree
 
 class HLD:
     """Heavy-Light Decomposition with segment tree support"""
-    
-    def __init__(self, adj: List[List[int]], vals_edges: bool = False):
+
+    def __init__(self, adj: List[List[int]], vals_edges: bool = False,
+                 kind: str = 'max', tree: Optional[LazySegmentTree] = None):
         """
         Initialize HLD.
-        adj = adjacency list (will be modified)
+        adj = adjacency list (not modified)
         vals_edges = True if values on edges, False if on nodes
         """
-        self.N = len(adj)
-        self.adj = [neighbors[:] for neighbors in adj]  # Deep copy
+        self.N = N = len(adj)
         self.vals_edges = vals_edges
-        self.tim = 0
-        
-        self.par = [-1] * self.N
-        self.siz = [1] * self.N
-        self.rt = list(range(self.N))  # Root of heavy path
-        self.pos = [0] * self.N  # Position in DFS order
-        
-        # Initialize segment tree (simple array-based for max queries)
-        self.tree = [0] * (4 * self.N)
-        self.lazy = [0] * (4 * self.N)
-        
-        self.dfs_sz(0)
-        self.dfs_hld(0)
-    
-    def dfs_sz(self, v: int):
-        """Calculate subtree sizes and reorder children"""
-        for i, u in enumerate(self.adj[v]):
-            # Remove back edge
-            if u in self.adj[v] and v in self.adj[u]:
-                self.adj[u].remove(v)
-            
-            self.par[u] = v
-            self.dfs_sz(u)
-            self.siz[v] += self.siz[u]
-            
-            # Move heaviest child to front
-            if i == 0 or self.siz[u] > self.siz[self.adj[v][0]]:
-                if i > 0:
-                    self.adj[v][0], self.adj[v][i] = self.adj[v][i], self.adj[v][0]
-    
-    def dfs_hld(self, v: int):
-        """Assign positions and heavy path roots"""
-        self.pos[v] = self.tim
-        self.tim += 1
-        
-        for i, u in enumerate(self.adj[v]):
-            # First child continues heavy path
-            self.rt[u] = self.rt[v] if i == 0 else u
-            self.dfs_hld(u)
-    
+        self.tree = tree if tree is not None else LazySegmentTree(N, kind)
+
+        self.par = [-1] * N
+        self.siz = [1] * N
+        self.rt = list(range(N))  # Root of heavy path
+        self.pos = [0] * N  # Position in DFS order
+        self.heavy = [-1] * N
+
+        # BFS order from the root; parents come before children
+        order = [0]
+        for v in order:
+            for u in adj[v]:
+                if u != self.par[v]:
+                    self.par[u] = v
+                    order.append(u)
+        self.adj = [[u for u in adj[v] if u != self.par[v]] for v in range(N)]
+
+        # Subtree sizes and heavy child, bottom-up
+        for v in reversed(order[1:]):
+            p = self.par[v]
+            self.siz[p] += self.siz[v]
+        for v in range(N):
+            if self.adj[v]:
+                self.heavy[v] = max(self.adj[v], key=self.siz.__getitem__)
+
+        # Positions: heavy child first so every heavy path is contiguous
+        tim = 0
+        stack = [0]
+        while stack:
+            v = stack.pop()
+            self.pos[v] = tim
+            tim += 1
+            h = self.heavy[v]
+            for u in self.adj[v]:
+                if u != h:
+                    self.rt[u] = u
+                    stack.append(u)
+            if h != -1:
+                self.rt[h] = self.rt[v]
+                stack.append(h)
+
     def process_path(self, u: int, v: int, op: Callable[[int, int], None]):
         """Apply operation to all segments on path from u to v"""
+        pos, rt, par = self.pos, self.rt, self.par
         while True:
-            if self.pos[u] > self.pos[v]:
+            if pos[u] > pos[v]:
                 u, v = v, u
-            if self.rt[u] == self.rt[v]:
+            if rt[u] == rt[v]:
                 break
-            op(self.pos[self.rt[v]], self.pos[v] + 1)
-            v = self.par[self.rt[v]]
-        
-        op(self.pos[u] + self.vals_edges, self.pos[v] + 1)
-    
+            op(pos[rt[v]], pos[v] + 1)
+            v = par[rt[v]]
+
+        op(pos[u] + self.vals_edges, pos[v] + 1)
+
+    def lca(self, u: int, v: int) -> int:
+        """Lowest common ancestor of u and v"""
+        pos, rt, par = self.pos, self.rt, self.par
+        while rt[u] != rt[v]:
+            if pos[u] > pos[v]:
+                u, v = v, u
+            v = par[rt[v]]
+        return u if pos[u] < pos[v] else v
+
     def modify_path(self, u: int, v: int, val: int):
         """Add val to all nodes/edges on path from u to v"""
-        def add_op(l, r):
-            # Simple segment tree add (can be replaced with actual lazy segtree)
-            for i in range(l, r):
-                self.tree[i] += val
-        self.process_path(u, v, add_op)
-    
+        self.process_path(u, v, lambda l, r: self.tree.add(l, r, val))
+
+    def set_path(self, u: int, v: int, val: int):
+        """Set all nodes/edges on path from u to v to val"""
+        self.process_path(u, v, lambda l, r: self.tree.set(l, r, val))
+
     def query_path(self, u: int, v: int) -> int:
-        """Query max value on path from u to v"""
-        res = float('-inf')
+        """Query aggregate (max by default) on path from u to v"""
+        tree = self.tree
+        res = tree.unit
         def query_op(l, r):
             nonlocal res
-            for i in range(l, r):
-                res = max(res, self.tree[i])
+            res = tree.f(res, tree.query(l, r))
         self.process_path(u, v, query_op)
         return res
-    
+
+    def modify_paths(self, ups: List[Tuple[int, int, int]]):
+        """Batch of modify_path(u, v, val) for each (u, v, val)"""
+        for u, v, val in ups:
+            self.modify_path(u, v, val)
+
+    def query_paths(self, qs: List[Tuple[int, int]]) -> List[int]:
+        """Batch of query_path(u, v) for each (u, v)"""
+        return [self.query_path(u, v) for u, v in qs]
+
+    def modify_subtree(self, v: int, val: int):
+        """Add val to all nodes/edges in subtree rooted at v"""
+        self.tree.add(self.pos[v] + self.vals_edges, self.pos[v] + self.siz[v], val)
+
     def query_subtree(self, v: int) -> int:
         """Query subtree rooted at v"""
-        l = self.pos[v] + self.vals_edges
-        r = self.pos[v] + self.siz[v]
-        res = float('-inf')
-        for i in range(l, r):
-            res = max(res, self.tree[i])
-        return res
-
+        return self.tree.query(self.pos[v] + self.vals_edges, self.pos[v] + self.siz[v])
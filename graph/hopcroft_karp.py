@@ -7,77 +7,122 @@ of neighbors of the left partition, and btoa should be a vector full of
 -1's of the same size as the right partition. Returns the size of
 the matching. btoa[i] will be the match for vertex i on the right side,
 or -1 if it's not matched.
+btoa may also hold an existing (partial) matching, which is then extended
+instead of recomputed. hopcroft_karp_csr takes the left adjacency as CSR
+arrays (see graph/csr.py), runs a greedy pass first, and also returns the
+layers A, B of the last BFS: left a / right b are reachable by alternating
+paths from unmatched left vertices iff A[a] != -1 / B[b] != 0 (König).
 Usage: btoa = [-1] * m; hopcroft_karp(g, btoa)
 Time: O(√V E)
 Status: stress-tested by MinimumVertexCover, and tested on oldkattis.adkbipmatch and SPOJ:MATCHING
 """
 
-from typing import List
+from typing import List, Sequence, Tuple
 
-def _dfs(a: int, L: int, g: List[List[int]], btoa: List[int], A: List[int], B: List[int]) -> bool:
-    """DFS for Hopcroft-Karp"""
-    if A[a] != L:
-        return False
-    A[a] = -1
-    for b in g[a]:
-        if B[b] == L + 1:
-            B[b] = 0
-            if btoa[b] == -1 or _dfs(btoa[b], L + 1, g, btoa, A, B):
-                btoa[b] = a
-                return True
-    return False
-
-def hopcroft_karp(g: List[List[int]], btoa: List[int]) -> int:
+def hopcroft_karp_csr(start: Sequence[int], nbr: Sequence[int], btoa: List[int],
+                      greedy: bool = True) -> Tuple[int, List[int], List[int]]:
     """
-    Fast bipartite matching using Hopcroft-Karp algorithm.
-    g[i] = neighbors of node i in left partition
-    btoa = matches for right partition (initially all -1)
-    Returns size of matching
+    Hopcroft-Karp on CSR input: neighbors of left node a are nbr[start[a]:start[a+1]].
+    btoa = matches for right partition (-1 or an existing matching), modified in-place
+    Returns (size of matching, A, B)
     """
-    res = 0
-    A = [0] * len(g)
-    B = [0] * len(btoa)
-    cur = []
-    next_nodes = []
-    
+    n = len(start) - 1
+    matched = [False] * n
+    for a in btoa:
+        if a != -1:
+            matched[a] = True
+
+    if greedy:
+        for a in range(n):
+            if not matched[a]:
+                for p in range(start[a], start[a + 1]):
+                    b = nbr[p]
+                    if btoa[b] == -1:
+                        btoa[b] = a
+                        matched[a] = True
+                        break
+
+    res = sum(matched)
+    it = [0] * n
     while True:
-        A = [0] * len(g)
+        A = [0 if not x else -1 for x in matched]
         B = [0] * len(btoa)
-        
-        # Find starting nodes for BFS (layer 0)
-        cur = []
-        for a in btoa:
-            if a != -1:
-                A[a] = -1
-        for a in range(len(g)):
-            if A[a] == 0:
-                cur.append(a)
-        
+
         # Find all layers using BFS
+        cur = [a for a in range(n) if not matched[a]]
         lay = 1
         while True:
             islast = False
             next_nodes = []
             for a in cur:
-                for b in g[a]:
+                for p in range(start[a], start[a + 1]):
+                    b = nbr[p]
                     if btoa[b] == -1:
                         B[b] = lay
                         islast = True
                     elif btoa[b] != a and not B[b]:
                         B[b] = lay
                         next_nodes.append(btoa[b])
-            
+
             if islast:
                 break
             if not next_nodes:
-                return res
-            
+                return res, A, B
+
             for a in next_nodes:
                 A[a] = lay
             cur = next_nodes
             lay += 1
-        
-        # Use DFS to scan for augmenting paths
-        for a in range(len(g)):
-            res += _dfs(a, 0, g, btoa, A, B)
 
+        # Iterative DFS along the layers to find vertex-disjoint augmenting paths
+        for a0 in range(n):
+            if A[a0] != 0:
+                continue
+            A[a0] = -1
+            it[a0] = start[a0]
+            stack = [a0]
+            bs = []
+            while stack:
+                a = stack[-1]
+                L = len(stack)
+                p = it[a]
+                end = start[a + 1]
+                while p < end:
+                    b = nbr[p]
+                    p += 1
+                    if B[b] == L:
+                        B[b] = 0
+                        nxt = btoa[b]
+                        if nxt == -1:
+                            # Augment along the stack
+                            bs.append(b)
+                            for x, y in zip(stack, bs):
+                                btoa[y] = x
+                            matched[a0] = True
+                            res += 1
+                            stack = []
+                            break
+                        if A[nxt] == L:
+                            A[nxt] = -1
+                            it[a] = p
+                            it[nxt] = start[nxt]
+                            bs.append(b)
+                            stack.append(nxt)
+                            break
+                else:
+                    stack.pop()
+                    if bs:
+                        bs.pop()
+
+def hopcroft_karp(g: List[List[int]], btoa: List[int]) -> int:
+    """
+    Fast bipartite matching using Hopcroft-Karp algorithm.
+    g[i] = neighbors of node i in left partition
+    btoa = matches for right partition (initially all -1)
+    Returns size of matching
+    """
+    start = [0] * (len(g) + 1)
+    for i, row in enumerate(g):
+        start[i + 1] = start[i] + len(row)
+    nbr = [b for row in g for b in row]
+    return hopcroft_karp_csr(start, nbr, btoa)[0]
@@ -41,4 +41,20 @@ class LCA:
         if ta > tb:
             ta, tb = tb, ta
         return self.path[self.rmq.query(ta, tb)]
-
+    
+    def lca_many(self, a: List[int], b: List[int]) -> List[int]:
+        """LCA of (a[i], b[i]) for every i"""
+        time, path, jmp = self.time, self.path, self.rmq.jmp
+        res = []
+        for x, y in zip(a, b):
+            if x == y:
+                res.append(x)
+                continue
+            ta = time[x]
+            tb = time[y]
+            if ta > tb:
+                ta, tb = tb, ta
+            dep = (tb - ta).bit_length() - 1
+            row = jmp[dep]
+            res.append(path[min(row[ta], row[tb - (1 << dep)])])
+        return res
@@ -5,38 +5,66 @@ License: CC0
 Source: https://en.wikipedia.org/wiki/Bron%E2%80%93Kerbosch_algorithm
 Description: Runs a callback for all maximal cliques in a graph (given as a
 symmetric adjacency matrix). Callback is given a set representing the maximal clique.
+The search runs on bitmasks: maximal_cliques_bits takes adjacency (eds[i] = int with bit j
+set iff i-j is an edge), picking the pivot that covers the most of P (popcount),
+with an explicit stack instead of recursion. Its callback gets the clique as a bitmask.
 Time: O(3^{n/3}), much faster for sparse graphs
 Status: stress-tested
 """
 
 from typing import List, Set, Callable
 
-def maximal_cliques(eds: List[Set[int]], f: Callable[[Set[int]], None], 
-                    P: Set[int] = None, X: Set[int] = None, R: Set[int] = None):
+def maximal_cliques(eds: List[Set[int]], f: Callable[[Set[int]], None]):
     """
     Find all maximal cliques using Bron-Kerbosch algorithm.
     eds[i] = set of neighbors of node i
     f = callback function called with each maximal clique
     """
-    if P is None:
-        P = set(range(len(eds)))
-    if X is None:
-        X = set()
-    if R is None:
-        R = set()
-    
-    if not P:
-        if not X:
-            f(R)
-        return
-    
-    # Choose pivot from P ∪ X
-    pivot = next(iter(P | X))
-    
-    # Iterate through P \ N(pivot)
-    cands = P - eds[pivot]
-    for v in list(cands):
-        maximal_cliques(eds, f, P & eds[v], X & eds[v], R | {v})
-        P.remove(v)
-        X.add(v)
+    def to_set(R: int):
+        res = set()
+        while R:
+            b = R & -R
+            res.add(b.bit_length() - 1)
+            R ^= b
+        f(res)
 
+    masks = [sum(1 << j for j in nb if j != i) for i, nb in enumerate(eds)]
+    maximal_cliques_bits(masks, to_set)
+
+def maximal_cliques_bits(eds: List[int], f: Callable[[int], None]):
+    """
+    Bron-Kerbosch with pivoting on bitmasks.
+    eds[i] = bitmask of neighbors of node i (no self loops)
+    f = callback function called with each maximal clique as a bitmask
+    """
+    # Frames are [P, X, R, candidates left to branch on]
+    stack = [[(1 << len(eds)) - 1, 0, 0, -1]]
+    while stack:
+        fr = stack[-1]
+        P, X, R, cands = fr
+        if cands == -1:
+            if not P:
+                if not X:
+                    f(R)
+                stack.pop()
+                continue
+            # Pivot from P | X maximizing |P & N(u)|
+            best = -1
+            U = P | X
+            while U:
+                b = U & -U
+                U ^= b
+                c = bin(P & eds[b.bit_length() - 1]).count('1')
+                if c > best:
+                    best = c
+                    pivot = b.bit_length() - 1
+            cands = fr[3] = P & ~eds[pivot]
+        if not cands:
+            stack.pop()
+            continue
+        b = cands & -cands
+        v = b.bit_length() - 1
+        fr[3] = cands ^ b
+        fr[0] = P ^ b
+        fr[1] = X | b
+        stack.append([P & eds[v], X & eds[v], R | b, -1])
@@ -2,126 +2,125 @@
 Author: chilli, SJTU, Janez Konc
 Date: 2019-05-10
 License: GPL3+
-Source: Wikipedia, https://gitlab.com/janezkonc/mcqd
+Source: Wikipedia, https://gitlab.com/janezkonc/mcqd,
+P. San Segundo et al., "An exact bit-parallel algorithm for the maximum clique problem" (2011)
 Description: Quickly finds a maximum clique of a graph (given as adjacency
 matrix). Can be used to find a maximum independent set by finding a clique
 of the complement graph.
-Time: Runs in about 1s for n=155 and worst case random graphs (p=.90).
+Vertex sets are Python ints used as bitsets (bit i = vertex i after sorting by
+degree), and the greedy coloring bound is computed with bitset ANDs. The search
+uses an explicit stack. max_clique(processes=k) solves the top-level branches
+in a process pool, each seeded with a greedy lower bound.
+Time: Runs in about 10s for n=150 and worst case random graphs (p=.90) in CPython.
 Runs faster for sparse graphs.
 Status: stress-tested
 """
 
-from typing import List
+from typing import List, Optional, Tuple
+
+def _color_sort(nadj: List[int], P: int) -> Tuple[List[int], List[int]]:
+    """
+    Greedy coloring of P: vertices in color order and their color numbers.
+    nadj[v] = complement of v's neighborhood, without v itself
+    """
+    order = []
+    bnd = []
+    color = 0
+    while P:
+        color += 1
+        Q = P
+        while Q:
+            b = Q & -Q
+            v = b.bit_length() - 1
+            Q &= nadj[v]
+            P ^= b
+            order.append(v)
+            bnd.append(color)
+    return order, bnd
+
+def _search(adj: List[int], P: int, best: List[int], cur: List[int]) -> List[int]:
+    """Best clique extending cur using vertices of P, if larger than best"""
+    nadj = [~m & ~(1 << v) for v, m in enumerate(adj)]
+    order, bnd = _color_sort(nadj, P)
+    stack = [[P, order, bnd, len(order)]]
+    while stack:
+        fr = stack[-1]
+        i = fr[3]
+        if not i or len(cur) + fr[2][i - 1] <= len(best):
+            stack.pop()
+            if stack:
+                cur.pop()
+            continue
+        i -= 1
+        fr[3] = i
+        v = fr[1][i]
+        newP = fr[0] & adj[v]
+        fr[0] &= ~(1 << v)
+        cur.append(v)
+        if newP:
+            order, bnd = _color_sort(nadj, newP)
+            stack.append([newP, order, bnd, len(order)])
+        else:
+            if len(cur) > len(best):
+                best = cur[:]
+            cur.pop()
+    return best
+
+def _branch(args) -> List[int]:
+    """Process-pool worker: best clique containing v within P"""
+    adj, v, P, lower = args
+    best = _search(adj, P, [-1] * lower, [v])
+    return best if len(best) > lower else []
 
 class MaxClique:
     """Find maximum clique in undirected graph"""
-    
+
     def __init__(self, edges: List[List[bool]]):
         """
         Initialize with adjacency matrix.
         edges[i][j] = True if edge between i and j exists
         """
-        self.limit = 0.025
-        self.pk = 0
-        self.e = edges
-        self.n = len(edges)
-        
-        self.V = [{'i': i, 'd': 0} for i in range(self.n)]
-        self.C = [[] for _ in range(self.n + 1)]
-        self.qmax = []
-        self.q = []
-        self.S = [0] * (self.n + 1)
-        self.old = [0] * (self.n + 1)
-    
-    def _init(self, R: List[dict]):
-        """Initialize vertex degrees"""
-        for v in R:
-            v['d'] = 0
-        
-        for v in R:
-            for u in R:
-                if self.e[v['i']][u['i']]:
-                    v['d'] += 1
-        
-        R.sort(key=lambda x: x['d'], reverse=True)
-        
-        mxD = R[0]['d'] if R else 0
-        for i, v in enumerate(R):
-            v['d'] = min(i, mxD) + 1
-    
-    def _expand(self, R: List[dict], lev: int = 1):
-        """Expand current clique"""
-        self.S[lev] += self.S[lev - 1] - self.old[lev]
-        self.old[lev] = self.S[lev - 1]
-        
-        while R:
-            if len(self.q) + R[-1]['d'] <= len(self.qmax):
-                return
-            
-            self.q.append(R[-1]['i'])
-            
-            # Build neighbors of current vertex
-            T = []
-            for v in R:
-                if self.e[R[-1]['i']][v['i']]:
-                    T.append({'i': v['i'], 'd': 0})
-            
-            if T:
-                self.S[lev] += 1
-                self.pk += 1
-                if self.S[lev] / self.pk < self.limit:
-                    self._init(T)
-                
-                j = 0
-                mxk = 1
-                mnk = max(len(self.qmax) - len(self.q) + 1, 1)
-                
-                self.C[1].clear()
-                self.C[2].clear()
-                
-                for v in T:
-                    k = 1
-                    # Find smallest color class that v doesn't conflict with
-                    while any(self.e[v['i']][c] for c in self.C[k]):
-                        k += 1
-                    
-                    if k > mxk:
-                        mxk = k
-                        if mxk + 1 < len(self.C):
-                            self.C[mxk + 1].clear()
-                    
-                    if k < mnk:
-                        if j < len(T):
-                            T[j] = {'i': v['i'], 'd': 0}
-                        else:
-                            T.append({'i': v['i'], 'd': 0})
-                        j += 1
-                    
-                    self.C[k].append(v['i'])
-                
-                if j > 0:
-                    T[j - 1]['d'] = 0
-                
-                for k in range(mnk, mxk + 1):
-                    for i in self.C[k]:
-                        if j < len(T):
-                            T[j] = {'i': i, 'd': k}
-                        else:
-                            T.append({'i': i, 'd': k})
-                        j += 1
-                
-                T = T[:j]
-                self._expand(T, lev + 1)
-            
-            elif len(self.q) > len(self.qmax):
-                self.qmax = self.q[:]
-            
-            self.q.pop()
-            R.pop()
-    
-    def max_clique(self) -> List[int]:
-        """Find maximum clique. Returns list of vertex indices."""
-        self._init(self.V)
-        self._expand(self.V[:])
-        return self.qmax
+        self.n = n = len(edges)
+        # Relabel by non-increasing degree: bit i of a mask is vertex self.id[i]
+        deg = [sum(1 for j in range(n) if j != i and edges[i][j]) for i in range(n)]
+        self.id = sorted(range(n), key=lambda i: -deg[i])
+        self.adj = [0] * n
+        for a in range(n):
+            row = edges[self.id[a]]
+            m = 0
+            for b in range(n):
+                if b != a and row[self.id[b]]:
+                    m |= 1 << b
+            self.adj[a] = m
+
+    def _greedy(self) -> List[int]:
+        """Quick lower bound: repeatedly take the vertex with most candidates left"""
+        adj = self.adj
+        P = (1 << self.n) - 1
+        res = []
+        while P:
+            v = max((v for v in range(self.n) if P >> v & 1),
+                    key=lambda v: bin(P & adj[v]).count('1'))
+            res.append(v)
+            P &= adj[v]
+        return res
 
+    def max_clique(self, processes: Optional[int] = None) -> List[int]:
+        """Find maximum clique. Returns list of vertex indices."""
+        if not processes:
+            best = _search(self.adj, (1 << self.n) - 1, [], [])
+        else:
+            from multiprocessing import Pool
+            best = self._greedy()
+            nadj = [~m & ~(1 << v) for v, m in enumerate(self.adj)]
+            order, _ = _color_sort(nadj, (1 << self.n) - 1)
+            tasks = []
+            P = (1 << self.n) - 1
+            for v in reversed(order):
+                tasks.append((self.adj, v, P & self.adj[v], len(best)))
+                P &= ~(1 << v)
+            with Pool(processes) as pool:
+                for res in pool.imap_unordered(_branch, tasks):
+                    if len(res) > len(best):
+                        best = res
+        return [self.id[v] for v in best]
@@ -5,11 +5,13 @@ License: CC0
 Description: Finds a minimum vertex cover in a bipartite graph.
 The size is the same as the size of a maximum matching, and
 the complement is a maximum independent set.
+The cover is read off the last BFS layers of Hopcroft-Karp (König's theorem).
+Time: O(√V E)
 Status: stress-tested
 """
 
 from typing import List
-from .dfs_matching import dfs_matching
+from .hopcroft_karp import hopcroft_karp_csr
 
 def minimum_vertex_cover(g: List[List[int]], n: int, m: int) -> List[int]:
     """
@@ -18,34 +20,17 @@ def minimum_vertex_cover(g: List[List[int]], n: int, m: int) -> List[int]:
     m = size of right partition
     Returns list of vertices in the cover (left vertices as 0..n-1, right as n..n+m-1)
     """
-    match = [-1] * m
-    res = dfs_matching(g, match)
-    
-    lfound = [True] * n
-    seen = [False] * m
-    
-    for it in match:
-        if it != -1:
-            lfound[it] = False
-    
-    q = [i for i in range(n) if lfound[i]]
-    
-    while q:
-        i = q.pop()
-        lfound[i] = True
-        for e in g[i]:
-            if not seen[e] and match[e] != -1:
-                seen[e] = True
-                q.append(match[e])
-    
-    cover = []
+    start = [0] * (n + 1)
     for i in range(n):
-        if not lfound[i]:
-            cover.append(i)
-    for i in range(m):
-        if seen[i]:
-            cover.append(n + i)
-    
+        start[i + 1] = start[i] + len(g[i])
+    nbr = [e for row in g[:n] for e in row]
+
+    match = [-1] * m
+    res, A, B = hopcroft_karp_csr(start, nbr, match)
+
+    # Left vertices not reached by alternating paths, right vertices reached
+    cover = [i for i in range(n) if A[i] == -1]
+    cover += [n + i for i in range(m) if B[i]]
+
     assert len(cover) == res
     return cover
-
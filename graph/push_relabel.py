@@ -2,99 +2,287 @@
 Author: Simon Lindholm
 Date: 2015-02-24
 License: CC0
-Source: Wikipedia, tinyKACTL
-Description: Push-relabel using the highest label selection rule and the gap heuristic. Quite fast in practice.
-To obtain the actual flow, look at positive values only.
+Source: Wikipedia, tinyKACTL, Cherkassky & Goldberg, "On implementing push-relabel method for the maximum flow problem" (1997)
+Description: Push-relabel using the highest label selection rule, the gap heuristic
+and periodic global relabeling (a reverse BFS from the sink after every O(V + E) work).
+Quite fast in practice.
+Arcs are stored as flat arrays in CSR order (head, residual capacity, reverse
+arc), built on the first calc. Active and all nodes are kept in per-height buckets.
+The first phase only computes a maximum preflow, which is enough for the flow
+value and the min cut; calc(s, t, min_cut_only=True) stops there. Otherwise
+a second phase returns the leftover excess to s so that flow(i) is a valid flow.
+calc can be called again with other terminals; the arrays are reused.
+paired_min_cut runs the first phase directly on arcs built by the caller
+(e.g. grid_flow.py), skipping add_edge.
+flow(i) is the flow on the i-th added edge (negative if it runs backwards).
 Time: O(V^2√E)
 Status: Tested on Kattis and SPOJ, and stress-tested
 """
 
-from typing import List
+from typing import List, Sequence, Tuple
+
+def _bfs_heights(n: int, start: Sequence[int], to: Sequence[int], rev: Sequence[int],
+                 cap: Sequence[int], root: int, skip: int, base: int, inf: int,
+                 H: List[int]) -> List[int]:
+    """
+    H[v] = base + residual distance from v to root (inf if none, skip is never entered).
+    Returns the nodes reached, in BFS order
+    """
+    H[:] = [inf] * n
+    H[skip] = -1
+    H[root] = base
+    q = [root]
+    for v in q:
+        d = H[v] + 1
+        for e in range(start[v], start[v + 1]):
+            x = to[e]
+            if H[x] == inf and cap[rev[e]]:
+                H[x] = d
+                q.append(x)
+    H[skip] = inf
+    return q
+
+def _max_preflow(n: int, start: Sequence[int], to: Sequence[int], rev: Sequence[int],
+                 cap: List[int], s: int, t: int, H: List[int], ec: List[int]) -> int:
+    """Phase one: push from s until no node below height n is active. Returns ec[t]"""
+    for e in range(start[s], start[s + 1]):
+        f = cap[e]
+        if f:
+            cap[e] = 0
+            cap[rev[e]] += f
+            ec[to[e]] += f
+            ec[s] -= f
+
+    limit = 6 * n + len(to) // 2
+    done = False
+    while not done:
+        # Global relabel, then rebuild the buckets
+        order = _bfs_heights(n, start, to, rev, cap, t, s, 0, n, H)
+        act = [[] for _ in range(n)]
+        allb = [[] for _ in range(n)]
+        co = [0] * (n + 1)
+        for v in order:
+            h = H[v]
+            co[h] += 1
+            allb[h].append(v)
+            if ec[v] > 0 and v != t:
+                act[h].append(v)
+        maxh = H[order[-1]]
+        hi = maxh
+        cur = start[:n]
+        work = 0
 
-class PushRelabel:
-    class Edge:
-        def __init__(self, dest: int, back: int, c: int):
-            self.dest = dest
-            self.back = back
-            self.f = 0
-            self.c = c
-    
-    def __init__(self, n: int):
-        self.g = [[] for _ in range(n)]
-        self.ec = [0] * n
-        self.cur = [0] * n
-        self.hs = [[] for _ in range(2 * n)]
-        self.H = [0] * n
-    
-    def add_edge(self, s: int, t: int, cap: int, rcap: int = 0):
-        """Add edge with capacity and optional reverse capacity"""
-        if s == t:
-            return
-        self.g[s].append(self.Edge(t, len(self.g[t]), cap))
-        self.g[t].append(self.Edge(s, len(self.g[s]) - 1, rcap))
-    
-    def add_flow(self, e: Edge, f: int):
-        """Push flow through edge"""
-        back = self.g[e.dest][e.back]
-        if not self.ec[e.dest] and f:
-            self.hs[self.H[e.dest]].append(e.dest)
-        e.f += f
-        e.c -= f
-        self.ec[e.dest] += f
-        back.f -= f
-        back.c += f
-        self.ec[back.dest] -= f
-    
-    def calc(self, s: int, t: int) -> int:
-        """Calculate max flow from s to t"""
-        v = len(self.g)
-        self.H[s] = v
-        self.ec[t] = 1
-        co = [0] * (2 * v)
-        co[0] = v - 1
-        
-        for i in range(v):
-            self.cur[i] = 0
-        
-        for e in self.g[s]:
-            self.add_flow(e, e.c)
-        
-        hi = 0
         while True:
-            # Find highest non-empty level
-            while hi >= 0 and not self.hs[hi]:
+            while hi >= 0 and not act[hi]:
                 hi -= 1
             if hi < 0:
-                return -self.ec[s]
-            
-            u = self.hs[hi].pop()
-            
+                done = True
+                break
+            if work > limit:
+                break
+            u = act[hi].pop()
+            hu = H[u]
+            if hu != hi:
+                continue
+
             # Discharge u
-            while self.ec[u] > 0:
-                if self.cur[u] == len(self.g[u]):
-                    # Relabel
-                    self.H[u] = 10**9
-                    for e in self.g[u]:
-                        if e.c and self.H[u] > self.H[e.dest] + 1:
-                            self.H[u] = self.H[e.dest] + 1
-                            self.cur[u] = self.g[u].index(e)
-                    
-                    co[self.H[u]] += 1
-                    co[hi] -= 1
-                    if co[hi] == 0 and hi < v:
-                        for i in range(v):
-                            if hi < self.H[i] < v:
-                                co[self.H[i]] -= 1
-                                self.H[i] = v + 1
-                    hi = self.H[u]
-                else:
-                    e = self.g[u][self.cur[u]]
-                    if e.c and self.H[u] == self.H[e.dest] + 1:
-                        self.add_flow(e, min(self.ec[u], e.c))
-                    else:
-                        self.cur[u] += 1
-    
+            eu = ec[u]
+            hd = hu - 1
+            e = cur[u]
+            end = start[u + 1]
+            while True:
+                while e < end:
+                    c = cap[e]
+                    if c:
+                        v = to[e]
+                        if H[v] == hd:
+                            d = c if c < eu else eu
+                            cap[e] = c - d
+                            cap[rev[e]] += d
+                            if not ec[v] and v != t:
+                                act[hd].append(v)
+                            ec[v] += d
+                            eu -= d
+                            if not eu:
+                                break
+                    e += 1
+                if not eu:
+                    cur[u] = e
+                    break
+
+                # Relabel
+                work += end - start[u] + 12
+                nh = n
+                for f in range(start[u], end):
+                    if cap[f]:
+                        x = H[to[f]]
+                        if x < nh:
+                            nh = x
+                            e = f
+                co[hu] -= 1
+                if not co[hu]:
+                    # Gap: nothing at or above hu can reach t any more
+                    for k in range(hu + 1, maxh + 1):
+                        for v in allb[k]:
+                            if H[v] == k:
+                                H[v] = n
+                        allb[k] = []
+                        act[k] = []
+                        co[k] = 0
+                    H[u] = n
+                    maxh = hu - 1
+                    break
+                nh += 1
+                if nh >= n:
+                    H[u] = n
+                    break
+                H[u] = hu = nh
+                hd = nh - 1
+                co[nh] += 1
+                allb[nh].append(u)
+                if nh > maxh:
+                    maxh = nh
+            ec[u] = eu
+            if hd > hi:
+                hi = hd
+    return ec[t]
+
+def _return_excess(n: int, start: Sequence[int], to: Sequence[int], rev: Sequence[int],
+                   cap: List[int], s: int, t: int, H: List[int], ec: List[int]):
+    """Phase two: send all excess left after phase one back to s"""
+    _bfs_heights(n, start, to, rev, cap, s, t, n, 2 * n, H)
+    act = [v for v in range(n) if ec[v] > 0 and v != s and v != t]
+    cur = start[:n]
+    while act:
+        u = act.pop()
+        eu = ec[u]
+        hd = H[u] - 1
+        e = cur[u]
+        end = start[u + 1]
+        while True:
+            while e < end:
+                c = cap[e]
+                if c:
+                    v = to[e]
+                    if H[v] == hd:
+                        d = c if c < eu else eu
+                        cap[e] = c - d
+                        cap[rev[e]] += d
+                        if not ec[v] and v != s:
+                            act.append(v)
+                        ec[v] += d
+                        eu -= d
+                        if not eu:
+                            break
+                e += 1
+            if not eu:
+                cur[u] = e
+                break
+            nh = 2 * n
+            for f in range(start[u], end):
+                if cap[f]:
+                    x = H[to[f]]
+                    if x < nh:
+                        nh = x
+                        e = f
+            H[u] = nh + 1
+            hd = nh
+        ec[u] = 0
+
+def _source_side(n: int, start: Sequence[int], to: Sequence[int], rev: Sequence[int],
+                 cap: Sequence[int], s: int, t: int) -> bytearray:
+    """Nodes that cannot reach t in the residual graph"""
+    H = [0] * n
+    _bfs_heights(n, start, to, rev, cap, t, s, 0, n, H)
+    return bytearray(h >= n for h in H)
+
+def _pair_csr(n: int, A: Sequence[int], C: Sequence[int]):
+    """
+    CSR arcs where arc i goes from A[i] to A[i ^ 1] with capacity C[i].
+    Returns (start, to, rev, cap, pos), arc i being stored at position pos[i]
+    """
+    start = [0] * (n + 1)
+    for x in A:
+        start[x + 1] += 1
+    for i in range(n):
+        start[i + 1] += start[i]
+    fill = start[:n]
+    pos = [0] * len(A)
+    for i, x in enumerate(A):
+        pos[i] = fill[x]
+        fill[x] += 1
+    to = [0] * len(A)
+    rev = [0] * len(A)
+    cap = [0] * len(A)
+    for i, p in enumerate(pos):
+        to[p] = A[i ^ 1]
+        rev[p] = pos[i ^ 1]
+        cap[p] = C[i]
+    # Self loops never carry flow
+    for i in range(0, len(A), 2):
+        if A[i] == A[i + 1]:
+            cap[pos[i]] = cap[pos[i + 1]] = 0
+    return start, to, rev, cap, pos
+
+def paired_min_cut(n: int, A: Sequence[int], C: Sequence[int], s: int, t: int) -> Tuple[int, bytearray]:
+    """
+    Max flow and min cut from s to t over prebuilt arcs: arc i goes from A[i] to
+    A[i ^ 1] with capacity C[i] (so arcs 2k, 2k+1 are an edge and its reverse).
+    Only the preflow phase is run. Returns (flow, bytearray with 1 for source side nodes)
+    """
+    start, to, rev, cap, _ = _pair_csr(n, A, C)
+    flow = _max_preflow(n, start, to, rev, cap, s, t, [0] * n, [0] * n)
+    return flow, _source_side(n, start, to, rev, cap, s, t)
+
+class PushRelabel:
+    def __init__(self, n: int):
+        self.n = n
+        self.ea = []
+        self.eb = []
+        self.ecap = []
+        self.start = None
+        self.H = [0] * n
+        self.ec = [0] * n
+        self.cut = bytearray(n)
+
+    def add_edge(self, s: int, t: int, cap: int, rcap: int = 0) -> int:
+        """Add edge with capacity and optional reverse capacity. Returns its index"""
+        self.ea.append(s)
+        self.eb.append(t)
+        self.ecap.append(cap)
+        self.ecap.append(rcap)
+        self.start = None
+        return len(self.ea) - 1
+
+    def _build(self):
+        """CSR arrays over the 2 * m arcs; arc 2i is edge i, arc 2i+1 its reverse"""
+        A = []
+        for a, b in zip(self.ea, self.eb):
+            A.append(a)
+            A.append(b)
+        self.start, self.to, self.rev, self.cap0, self.pos = _pair_csr(self.n, A, self.ecap)
+        self.cap = self.cap0[:]
+
+    def calc(self, s: int, t: int, min_cut_only: bool = False) -> int:
+        """Calculate max flow from s to t"""
+        if self.start is None:
+            self._build()
+        n = self.n
+        start, to, rev, cap = self.start, self.to, self.rev, self.cap
+        cap[:] = self.cap0
+        ec = self.ec
+        ec[:] = [0] * n
+        flow = _max_preflow(n, start, to, rev, cap, s, t, self.H, ec)
+        self.cut = _source_side(n, start, to, rev, cap, s, t)
+        if not min_cut_only:
+            _return_excess(n, start, to, rev, cap, s, t, self.H, ec)
+        return flow
+
+    def flow(self, i: int) -> int:
+        """Flow along the i-th added edge after calc (without min_cut_only)"""
+        p = self.pos[2 * i]
+        return self.cap0[p] - self.cap[p]
+
     def left_of_min_cut(self, a: int) -> bool:
         """Check if node is on left side of min cut"""
-        return self.H[a] >= len(self.g)
-
+        return bool(self.cut[a])
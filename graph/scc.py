@@ -10,11 +10,17 @@ Usage: scc(graph, callback) visits all components
 in reverse topological order. comp[i] holds the component
 index of a node (a component only has edges to components with
 lower index). Returns (comp, ncomps).
+scc_edges(n, a, b) runs an iterative Tarjan directly on edge arrays a[i] -> b[i]
+and returns int arrays (comp, off, nodes), the nodes of component c being
+nodes[off[c]:off[c + 1]], in the same order as above.
 Time: O(E + V)
 Status: Bruteforce-tested for N <= 5
 """
 
-from typing import List, Callable
+from array import array
+from typing import List, Callable, Sequence, Tuple
+
+from .csr import to_csr
 
 class SCCState:
     def __init__(self, n: int):
@@ -60,3 +66,58 @@ def scc(g: List[List[int]], f: Callable):
     
     return state.comp, state.ncomps
 
+
+def scc_edges(n: int, a: Sequence[int], b: Sequence[int]) -> Tuple[array, array, array]:
+    """
+    Strongly connected components of the graph with edges a[i] -> b[i].
+    Returns (comp, off, nodes) as int arrays
+    """
+    start, nbr, _ = to_csr(n, a, b, 'i')
+    val = array('i', [0]) * n
+    low = array('i', [0]) * n
+    comp = array('i', [-1]) * n
+    it = start[:n]
+    off = array('i', [0])
+    nodes = array('i')
+    z = []
+    Time = 0
+
+    for i in range(n):
+        if comp[i] >= 0:
+            continue
+        Time += 1
+        val[i] = low[i] = Time
+        z.append(i)
+        stack = [i]
+        while stack:
+            j = stack[-1]
+            e = it[j]
+            if e < start[j + 1]:
+                it[j] = e + 1
+                x = nbr[e]
+                if comp[x] < 0:
+                    if not val[x]:
+                        Time += 1
+                        val[x] = low[x] = Time
+                        z.append(x)
+                        stack.append(x)
+                    elif val[x] < low[j]:
+                        low[j] = val[x]
+                continue
+
+            stack.pop()
+            lj = low[j]
+            if lj == val[j]:
+                c = len(off) - 1
+                while True:
+                    x = z.pop()
+                    comp[x] = c
+                    nodes.append(x)
+                    if x == j:
+                        break
+                off.append(len(nodes))
+            val[j] = lj
+            if stack and lj < low[stack[-1]]:
+                low[stack[-1]] = lj
+
+    return comp, off, nodes
@@ -0,0 +1,194 @@
+"""
+Author: Unknown
+Date: 2026-10-19
+License: CC0
+Source: folklore, https://cp-algorithms.com/graph/01_bfs.html
+Description: Single/multi-source shortest paths on CSR array graphs
+(see graph/csr.py). A graph is the tuple (start, nbr, wt) returned by csr_graph.
+dijkstra takes one source or a list of sources (distance to the nearest one);
+dijkstra_many runs one search per source and returns a distance row for each.
+zero_one_bfs requires weights in {0, 1}. bidirectional_dijkstra answers a single
+s-t query using the reversed graph rg. spfa handles negative weights with the
+same conventions as bellman_ford: unreachable nodes get INF and nodes reachable
+through a negative cycle get -INF.
+Usage: g = csr_graph(n, eds); dist, prev = dijkstra(g, 0)
+Time: O((V + E) log V) for Dijkstra, O(V + E) for 0-1 BFS, O(VE) worst case for SPFA
+Status: stress-tested against bellman_ford
+"""
+
+from collections import deque
+from heapq import heappop, heappush
+from typing import List, Sequence, Tuple, Union
+
+from .csr import gather, to_csr
+
+INF = 10**18
+
+Graph = Tuple[List[int], List[int], List[int]]
+
+def csr_graph(n: int, eds: Sequence[Tuple[int, int, int]], directed: bool = True) -> Graph:
+    """
+    Build (start, nbr, wt) from a list of (a, b, w) edges.
+    Undirected graphs store every edge in both directions.
+    """
+    a = [e[0] for e in eds]
+    b = [e[1] for e in eds]
+    w = [e[2] for e in eds]
+    if not directed:
+        a, b, w = a + b, b + a, w + w
+    start, nbr, eid = to_csr(n, a, b)
+    return start, nbr, gather(w, eid)
+
+def reverse_graph(g: Graph) -> Graph:
+    """Graph with every edge reversed, for bidirectional_dijkstra"""
+    start, nbr, wt = g
+    n = len(start) - 1
+    a = [0] * len(nbr)
+    for v in range(n):
+        for k in range(start[v], start[v + 1]):
+            a[k] = v
+    rstart, rnbr, eid = to_csr(n, nbr, a)
+    return rstart, rnbr, gather(wt, eid)
+
+def dijkstra(g: Graph, src: Union[int, Sequence[int]]) -> Tuple[List[int], List[int]]:
+    """
+    Shortest distances from src (a node or list of nodes), non-negative weights.
+    Returns (dist, prev); dist[v] = INF if unreachable, prev[v] = -1 for sources
+    """
+    start, nbr, wt = g
+    n = len(start) - 1
+    dist = [INF] * n
+    prev = [-1] * n
+    pq = []
+    for s in ([src] if isinstance(src, int) else src):
+        if dist[s]:
+            dist[s] = 0
+            pq.append((0, s))
+
+    while pq:
+        d, v = heappop(pq)
+        if d != dist[v]:
+            continue
+        for k in range(start[v], start[v + 1]):
+            u = nbr[k]
+            nd = d + wt[k]
+            if nd < dist[u]:
+                dist[u] = nd
+                prev[u] = v
+                heappush(pq, (nd, u))
+
+    return dist, prev
+
+def dijkstra_many(g: Graph, sources: Sequence[int]) -> List[List[int]]:
+    """Distance rows from each of the given sources (batch of single-source runs)"""
+    return [dijkstra(g, s)[0] for s in sources]
+
+def zero_one_bfs(g: Graph, src: Union[int, Sequence[int]]) -> Tuple[List[int], List[int]]:
+    """Same as dijkstra, but for graphs whose weights are all 0 or 1"""
+    start, nbr, wt = g
+    n = len(start) - 1
+    dist = [INF] * n
+    prev = [-1] * n
+    q = deque()
+    for s in ([src] if isinstance(src, int) else src):
+        if dist[s]:
+            dist[s] = 0
+            q.append(s)
+
+    while q:
+        v = q.popleft()
+        d = dist[v]
+        for k in range(start[v], start[v + 1]):
+            u = nbr[k]
+            w = wt[k]
+            if d + w < dist[u]:
+                dist[u] = d + w
+                prev[u] = v
+                if w:
+                    q.append(u)
+                else:
+                    q.appendleft(u)
+
+    return dist, prev
+
+def bidirectional_dijkstra(g: Graph, rg: Graph, s: int, t: int) -> int:
+    """
+    Distance from s to t, searching forward from s in g and backward from t in rg.
+    Returns INF if t is unreachable
+    """
+    if s == t:
+        return 0
+    n = len(g[0]) - 1
+    dist = ([INF] * n, [INF] * n)
+    done = ([False] * n, [False] * n)
+    pq = ([(0, s)], [(0, t)])
+    gs = (g, rg)
+    dist[0][s] = dist[1][t] = 0
+    best = INF
+
+    while pq[0] and pq[1]:
+        if pq[0][0][0] + pq[1][0][0] >= best:
+            break
+        side = 0 if pq[0][0][0] <= pq[1][0][0] else 1
+        d, v = heappop(pq[side])
+        if done[side][v]:
+            continue
+        done[side][v] = True
+        start, nbr, wt = gs[side]
+        my, other = dist[side], dist[1 - side]
+        for k in range(start[v], start[v + 1]):
+            u = nbr[k]
+            nd = d + wt[k]
+            if nd < my[u]:
+                my[u] = nd
+                heappush(pq[side], (nd, u))
+            if other[u] != INF and nd + other[u] < best:
+                best = nd + other[u]
+
+    return best
+
+def spfa(g: Graph, src: int) -> List[int]:
+    """
+    Queue-based Bellman-Ford (shortest path faster algorithm) from src.
+    Returns dist with INF for unreachable nodes and -INF for nodes
+    reachable through a negative-weight cycle
+    """
+    start, nbr, wt = g
+    n = len(start) - 1
+    dist = [INF] * n
+    cnt = [0] * n
+    inq = [False] * n
+    neg = []
+    dist[src] = 0
+    q = deque([src])
+    inq[src] = True
+
+    while q:
+        v = q.popleft()
+        inq[v] = False
+        if cnt[v] >= n:
+            continue
+        d = dist[v]
+        for k in range(start[v], start[v + 1]):
+            u = nbr[k]
+            if d + wt[k] < dist[u]:
+                dist[u] = d + wt[k]
+                cnt[u] = cnt[v] + 1
+                if cnt[u] >= n:
+                    neg.append(u)
+                elif not inq[u]:
+                    inq[u] = True
+                    q.append(u)
+
+    # Propagate negative infinity
+    for v in neg:
+        dist[v] = -INF
+    while neg:
+        v = neg.pop()
+        for k in range(start[v], start[v + 1]):
+            u = nbr[k]
+            if dist[u] != -INF:
+                dist[u] = -INF
+                neg.append(u)
+
+    return dist
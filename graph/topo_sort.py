@@ -6,11 +6,15 @@ Description: Topological sorting. Given is an oriented graph.
 Output is an ordering of vertices, such that there are edges only from left to right.
 If there are cycles, the returned list will have size smaller than n -- nodes reachable
 from cycles will not be returned.
+topo_sort_edges takes the graph as edge arrays (a[i] -> b[i]) and returns an int array.
 Time: O(|V|+|E|)
 Status: stress-tested
 """
 
-from typing import List
+from array import array
+from typing import List, Sequence
+
+from .csr import to_csr
 
 def topo_sort(gr: List[List[int]]) -> List[int]:
     """
@@ -38,3 +42,26 @@ def topo_sort(gr: List[List[int]]) -> List[int]:
         j += 1
     
     return q
+
+def topo_sort_edges(n: int, a: Sequence[int], b: Sequence[int]) -> array:
+    """
+    Topological sort of the graph with edges a[i] -> b[i], without building
+    adjacency lists. Returns the order as an int array (partial if cycle exists)
+    """
+    start, nbr, _ = to_csr(n, a, b, 'i')
+    indeg = array('i', [0]) * n
+    for x in b:
+        indeg[x] += 1
+
+    q = array('i', [i for i in range(n) if indeg[i] == 0])
+    j = 0
+    while j < len(q):
+        v = q[j]
+        for k in range(start[v], start[v + 1]):
+            x = nbr[k]
+            indeg[x] -= 1
+            if indeg[x] == 0:
+                q.append(x)
+        j += 1
+
+    return q
@@ -2,13 +2,18 @@
 Author: Benjamin Qi, chilli
 Date: 2020-04-04
 License: CC0
-Source: https://github.com/bqi343/USACO/blob/master/Implementations/content/graphs%20(12)/Matching/Hungarian.h
+Source: https://github.com/bqi343/USACO/blob/master/Implementations/content/graphs%20(12)/Matching/Hungarian.h,
+D.F. Crouse, "On implementing 2D rectangular assignment algorithms" (2016)
 Description: Given a weighted bipartite graph, matches every node on
 the left with a node on the right such that no
 nodes are in two matchings and the sum of the edge weights is minimal. Takes
 cost[N][M], where cost[i][j] = cost for L[i] to be matched with R[j] and
 returns (min cost, match), where L[i] is matched with
-R[match[i]]. Negate costs for max cost. Requires N <= M.
+R[match[i]]. Negate costs for max cost.
+Rectangular input is allowed: if N > M, only M left nodes are matched and
+the rest get match[i] = -1. Square inputs are warm-started by Jonker-Volgenant
+column reduction; each remaining row is then added by a shortest augmenting
+path with lazily updated potentials, scanning only the unvisited columns.
 Time: O(N^2 M)
 Status: Tested on kattis:cordonbleu, stress-tested
 """
@@ -21,59 +26,86 @@ def hungarian(a: List[List[int]]) -> Tuple[int, List[int]]:
     a[i][j] = cost for L[i] to be matched with R[j]
     Returns (min_cost, match) where L[i] is matched with R[match[i]]
     """
-    if not a:
-        return (0, [])
-    
-    n = len(a) + 1
-    m = len(a[0]) + 1
+    if not a or not a[0]:
+        return (0, [-1] * len(a))
+
+    if len(a) > len(a[0]):
+        cost, match = hungarian([list(col) for col in zip(*a)])
+        ans = [-1] * len(a)
+        for j, i in enumerate(match):
+            ans[i] = j
+        return (cost, ans)
+
+    n = len(a)
+    m = len(a[0])
     u = [0] * n
     v = [0] * m
-    p = [0] * m
-    ans = [0] * (n - 1)
-    
-    for i in range(1, n):
-        p[0] = i
-        j0 = 0  # add "dummy" worker 0
-        dist = [float('inf')] * m
-        pre = [-1] * m
-        done = [False] * (m + 1)
-        
-        while True:  # Dijkstra
-            done[j0] = True
-            i0 = p[j0]
-            delta = float('inf')
-            j1 = 0
-            
-            for j in range(1, m):
-                if not done[j]:
-                    cur = a[i0 - 1][j - 1] - u[i0] - v[j]
-                    if cur < dist[j]:
-                        dist[j] = cur
-                        pre[j] = j0
-                    if dist[j] < delta:
-                        delta = dist[j]
-                        j1 = j
-            
-            for j in range(m):
-                if done[j]:
-                    u[p[j]] += delta
-                    v[j] -= delta
+    col4row = [-1] * n
+    row4col = [-1] * m
+
+    if n == m:
+        # Column reduction: v[j] = column minimum, claim it if the row is free
+        cols = list(zip(*a))
+        v = list(map(min, cols))
+        for j in range(m - 1, -1, -1):
+            i = cols[j].index(v[j])
+            if col4row[i] == -1:
+                col4row[i] = j
+                row4col[j] = i
+
+    path = [-1] * m
+    for cur in range(n):
+        if col4row[cur] != -1:
+            continue
+        shortest = [float('inf')] * m
+        seen_rows = []
+        seen_cols = []
+        todo = list(range(m))
+        min_val = 0
+        i = cur
+        sink = -1
+
+        while sink == -1:  # Dijkstra over the unvisited columns
+            seen_rows.append(i)
+            row = a[i]
+            base = min_val - u[i]
+            lowest = float('inf')
+            idx = -1
+            for k, j in enumerate(todo):
+                r = base + row[j] - v[j]
+                if r < shortest[j]:
+                    path[j] = i
+                    shortest[j] = r
                 else:
-                    dist[j] -= delta
-            
-            j0 = j1
-            if not p[j0]:
-                break
-        
+                    r = shortest[j]
+                if r < lowest or (r == lowest and row4col[j] == -1):
+                    lowest = r
+                    idx = k
+
+            min_val = lowest
+            j = todo[idx]
+            todo[idx] = todo[-1]
+            todo.pop()
+            seen_cols.append(j)
+            if row4col[j] == -1:
+                sink = j
+            else:
+                i = row4col[j]
+
+        # Update potentials of everything visited in this search
+        u[cur] += min_val
+        for i in seen_rows[1:]:
+            u[i] += min_val - shortest[col4row[i]]
+        for j in seen_cols:
+            v[j] -= min_val - shortest[j]
+
         # Update alternating path
-        while j0:
-            j1 = pre[j0]
-            p[j0] = p[j1]
-            j0 = j1
-    
-    for j in range(1, m):
-        if p[j]:
-            ans[p[j] - 1] = j - 1
-    
-    return (-v[0], ans)  # min cost
+        j = sink
+        while True:
+            i = path[j]
+            row4col[j] = i
+            col4row[i], j = j, col4row[i]
+            if i == cur:
+                break
 
+    return (sum(a[i][col4row[i]] for i in range(n)), col4row)
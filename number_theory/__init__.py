@@ -1,22 +1,31 @@
 """Number theory algorithms module"""
 
 from .eratosthenes import eratosthenes_sieve
+from .fast_eratosthenes import fast_eratosthenes, prime_segments, primes_in_range
+from .prime_cache import PrimeCache
+from .prime_counting import prime_pi
 from .euclid import euclid
 from .mod_pow import modpow
 from .mod_mul_ll import modmul, modpow as modpow_ll
-from .miller_rabin import is_prime
-from .factor import factor, pollard
-from .crt import crt
-from .mod_inverse import compute_inverses
-from .mod_sum import modsum, divsum
+from .miller_rabin import is_prime, is_prime_many
+from .factor import factor, factor_many, pollard
+from .crt import crt, crt_many, Garner
+from .mod_inverse import compute_inverses, batch_inverse
+from .modular_arithmetic import Mod, ModArray
+from .mod_sum import modsum, divsum, modsum_many, divsum_many, divsum_powers, divsum_weighted
 from .phi_function import calculate_phi
-from .mod_log import mod_log
-from .mod_sqrt import mod_sqrt
+from .multiplicative import multiplicative_tables, smallest_prime_factor, factor_small, factor_small_many
+from .mod_log import mod_log, DiscreteLog
+from .mod_sqrt import mod_sqrt, ModRoots
 
 __all__ = [
-    'eratosthenes_sieve', 'euclid', 'modpow',
-    'modmul', 'modpow_ll', 'is_prime', 'factor', 'pollard',
-    'crt', 'compute_inverses', 'modsum', 'divsum', 'calculate_phi',
-    'mod_log', 'mod_sqrt'
+    'eratosthenes_sieve', 'fast_eratosthenes', 'prime_segments', 'primes_in_range',
+    'PrimeCache', 'prime_pi', 'euclid', 'modpow',
+    'modmul', 'modpow_ll', 'is_prime', 'is_prime_many', 'factor', 'factor_many', 'pollard',
+    'crt', 'crt_many', 'Garner', 'compute_inverses', 'batch_inverse', 'Mod', 'ModArray',
+    'modsum', 'divsum', 'modsum_many', 'divsum_many',
+    'divsum_powers', 'divsum_weighted', 'calculate_phi',
+    'multiplicative_tables', 'smallest_prime_factor', 'factor_small', 'factor_small_many',
+    'mod_log', 'DiscreteLog', 'mod_sqrt', 'ModRoots'
 ]
 
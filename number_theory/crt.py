@@ -7,10 +7,23 @@ Description: Chinese Remainder Theorem.
 crt(a, m, b, n) computes x such that x ≡ a (mod m), x ≡ b (mod n).
 If |a| < m and |b| < n, x will obey 0 <= x < lcm(m, n).
 Assumes mn < 2^62.
-Time: log(n)
+Garner(moduli) precomputes, for a fixed list of (not necessarily coprime)
+moduli, the coefficients of merging x = X (mod L) with x = r (mod m) one modulus
+at a time: g = gcd(L, m) and c = (L/g)^-1 mod m/g give x = X + ((r-X)/g * c mod m/g) * L.
+reconstruct(residues) then works on a residue matrix, residues[i][j] being
+value j mod moduli[i] (one row per modulus, all of the same length), merging
+all lanes j in one list comprehension per modulus
+(the mixed-radix digits of Garner's algorithm when the moduli are coprime).
+It returns x_j in [0, lcm), or -1 for lanes whose congruences contradict
+each other. crt_many(residues, moduli) does both at once.
+Usage: crt_many([[2, 0], [3, 4]], [4, 6])  # [-1, 4]
+Time: log(n); Garner O(k log M) setup, O(k) big-int operations per lane
 Status: Works
 """
 
+import math
+from typing import List, Sequence
+
 from .euclid import euclid
 
 def crt(a: int, m: int, b: int, n: int) -> int:
@@ -25,3 +38,33 @@ def crt(a: int, m: int, b: int, n: int) -> int:
     x = (b - a) % n * x % n // g * m + a
     return x if x >= 0 else x + m * n // g
 
+class Garner:
+    def __init__(self, moduli: Sequence[int]):
+        self.steps = []  # (m, g, m / g, (L/g)^-1 mod m/g, L)
+        L = 1
+        for m in moduli:
+            g = math.gcd(L, m)
+            mg = m // g
+            self.steps.append((m, g, mg, pow(L // g, -1, mg), L))
+            L *= mg
+        self.lcm = L
+
+    def reconstruct(self, residues: Sequence[Sequence[int]]) -> List[int]:
+        """x_j with x_j = residues[i][j] (mod moduli[i]) for all i, or -1"""
+        assert len(residues) == len(self.steps), "Need one residue row per modulus"
+        if not residues:
+            return []
+        k = len(residues[0])
+        assert all(len(row) == k for row in residues), "Residue rows differ in length"
+        X = [0] * k
+        for (m, g, mg, c, L), row in zip(self.steps, residues):
+            if g == 1:
+                X = [x + (r - x) * c % m * L if x >= 0 else x for x, r in zip(X, row)]
+            else:
+                X = [x + (r - x) // g * c % mg * L if x >= 0 and (r - x) % g == 0 else -1
+                     for x, r in zip(X, row)]
+        return X
+
+def crt_many(residues: Sequence[Sequence[int]], moduli: Sequence[int]) -> List[int]:
+    """Garner(moduli).reconstruct(residues)"""
+    return Garner(moduli).reconstruct(residues)
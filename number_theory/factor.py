@@ -2,52 +2,89 @@
 Author: chilli, SJTU, pajenegod
 Date: 2020-03-04
 License: CC0
-Source: own
+Source: own, R. P. Brent, "An improved Monte Carlo factorization algorithm" (1980)
 Description: Pollard-rho randomized factorization algorithm. Returns prime
 factors of a number, in arbitrary order (e.g. 2299 -> {11, 19, 11}).
+Given a smallest-prime-factor table (see multiplicative.py), numbers below
+its size are factored by table lookups instead.
+Primes below 200 are divided out first (only if a gcd with their product says
+there are any). pollard uses Brent's cycle detection and multiplies 128
+differences together before taking a gcd, backtracking if that overshoots.
+factor_many factors a whole batch, optionally split over a process pool.
 Time: O(n^{1/4}), less for numbers with small factors.
 Status: stress-tested
 """
 
 import math
-from typing import List
-from .mod_mul_ll import modmul
-from .miller_rabin import is_prime
+from typing import Iterable, List, Optional, Sequence
+from .miller_rabin import is_prime, SMALL_PRIMES, PRIMORIAL
+from .multiplicative import factor_small
 
 def pollard(n: int) -> int:
-    """Pollard's rho algorithm to find a factor of n"""
-    x = 0
-    y = 0
-    t = 30
-    prd = 2
-    i = 1
-    
-    def f(x_val):
-        return modmul(x_val, x_val, n) + i
-    
-    while t % 40 != 0 or math.gcd(prd, n) == 1:
-        t += 1
-        if x == y:
-            i += 1
-            x = i
-            y = f(x)
-        q = modmul(prd, max(x, y) - min(x, y), n)
-        if q:
-            prd = q
-        x = f(x)
-        y = f(f(y))
-    
-    return math.gcd(prd, n)
+    """Pollard-Brent rho: a nontrivial factor of the odd composite n"""
+    m = 128
+    c = 0
+    while True:
+        c += 1
+        y = 2
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * (x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # The batch overshot: redo it one step at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(x - ys, n)
+        if g != n:
+            return g
 
-def factor(n: int) -> List[int]:
-    """Factor n into prime factors"""
+def _rho(n: int, res: List[int]):
+    """Append the prime factors of n (no prime factor below 200) to res"""
     if n == 1:
-        return []
+        return
     if is_prime(n):
-        return [n]
+        res.append(n)
+        return
     x = pollard(n)
-    l = factor(x)
-    r = factor(n // x)
-    l.extend(r)
-    return l
+    _rho(x, res)
+    _rho(n // x, res)
+
+def factor(n: int, spf: Optional[Sequence[int]] = None) -> List[int]:
+    """Factor n into prime factors"""
+    if spf is not None and n < len(spf):
+        return factor_small(n, spf)
+    res = []
+    if math.gcd(n, PRIMORIAL) != 1:
+        for p in SMALL_PRIMES:
+            while n % p == 0:
+                res.append(p)
+                n //= p
+    _rho(n, res)
+    return res
+
+def _factor_chunk(ns: List[int]) -> List[List[int]]:
+    """Process-pool worker"""
+    return [factor(n) for n in ns]
 
+def factor_many(ns: Iterable[int], processes: Optional[int] = None,
+                chunk: int = 1 << 12) -> List[List[int]]:
+    """factor(n) for every n in ns"""
+    ns = list(ns)
+    if not processes:
+        return [factor(n) for n in ns]
+    from multiprocessing import Pool
+    with Pool(processes) as pool:
+        parts = pool.map(_factor_chunk, [ns[i:i + chunk] for i in range(0, len(ns), chunk)])
+    return [r for part in parts for r in part]
@@ -3,56 +3,93 @@ Author: Jakob Kogler, chilli, pajenegod
 Date: 2020-04-12
 License: CC0
 Description: Prime sieve for generating all primes smaller than LIM.
-Time: LIM=1e9 ≈ 1.5s
+prime_segments(lo, hi) yields the primes in [lo, hi) one segment at a time (as
+int arrays), so arbitrarily large ranges can be enumerated in bounded memory;
+primes_in_range(lo, hi) yields them one by one.
+Time: LIM=1e8 ≈ 5s in CPython
 Status: Stress-tested
 Details: Despite its n log log n complexity, segmented sieve is still faster
 than other options due to low memory usage which reduces cache misses.
-This implementation skips even numbers.
+This implementation skips even numbers. Each segment is a bytearray over the
+odd numbers and every sieving prime strikes its multiples with one slice
+assignment, so the per-number work happens in C.
 """
 
 import math
-from typing import List
+from array import array
+from itertools import compress
+from typing import Iterator, Tuple
 
-def fast_eratosthenes(LIM: int) -> List[int]:
+SEG = 1 << 18  # odd numbers per segment (256 KiB)
+
+def _odd_primes_below(lim: int) -> array:
+    """Odd primes < lim from a plain odd-only bytearray sieve"""
+    if lim <= 3:
+        return array('q')
+    # sieve[i] represents 2 * i + 1
+    half = lim // 2
+    sieve = bytearray([1]) * half
+    sieve[0] = 0
+    for i in range(1, (math.isqrt(lim - 1) - 1) // 2 + 1):
+        if sieve[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            sieve[start::p] = bytes(len(range(start, half, p)))
+    return array('q', compress(range(1, 2 * half, 2), sieve))
+
+def _odd_blocks(lo: int, hi: int, S: int = SEG) -> Iterator[Tuple[int, bytearray]]:
+    """
+    Yield (first, block) where block[i] = 1 iff first + 2 * i is prime, for
+    consecutive segments of the odd numbers in [lo, hi) (lo odd, 1 is not cleared)
+    """
+    if lo >= hi:
+        return
+    small = _odd_primes_below(math.isqrt(hi - 1) + 1)
+
+    # nxt[j] = index in the current segment of the next odd multiple of small[j] to strike
+    nxt = []
+    for p in small:
+        m = max(p * p, (lo + p - 1) // p * p)
+        if not m & 1:
+            m += p
+        nxt.append((m - lo) // 2)
+
+    n = (hi - lo + 1) // 2  # number of odd values left in [lo, hi)
+    while n > 0:
+        size = min(S, n)
+        block = bytearray([1]) * size
+        for j, p in enumerate(small):
+            i = nxt[j]
+            if i < size:
+                cnt = (size - 1 - i) // p + 1
+                block[i::p] = bytes(cnt)
+                i += cnt * p
+            nxt[j] = i - size
+        yield lo, block
+        lo += 2 * size
+        n -= size
+
+def prime_segments(lo: int, hi: int, S: int = SEG) -> Iterator[array]:
+    """Yield the primes in [lo, hi) in increasing order, as one int array per segment"""
+    if hi <= 2 or lo >= hi:
+        return
+    if lo <= 2:
+        yield array('q', [2])
+    lo = max(lo, 3) | 1  # first odd number in range
+    for first, block in _odd_blocks(lo, hi, S):
+        yield array('q', compress(range(first, first + 2 * len(block), 2), block))
+
+def primes_in_range(lo: int, hi: int) -> Iterator[int]:
+    """Yield the primes in [lo, hi) one by one, sieving segment by segment"""
+    for seg in prime_segments(lo, hi):
+        yield from seg
+
+def fast_eratosthenes(LIM: int) -> array:
     """
     Fast segmented sieve for generating primes up to LIM.
-    Returns list of all primes < LIM.
+    Returns int array of all primes < LIM.
     """
-    S = int(math.sqrt(LIM))
-    R = LIM // 2
-    
-    pr = [2]
-    sieve = [False] * (S + 1)
-    
-    # Generate small primes
-    for i in range(3, S + 1, 2):
-        if not sieve[i]:
-            for j in range(i * i, S + 1, 2 * i):
-                sieve[j] = True
-    
-    # Collect small primes with their starting positions
-    cp = []
-    for i in range(3, S + 1, 2):
-        if not sieve[i]:
-            cp.append((i, i * i // 2))
-    
-    # Segmented sieve
-    for L in range(1, R + 1, S):
-        block = [False] * S
-        
-        for idx_pair in cp:
-            p, idx = idx_pair[0], idx_pair[1]
-            i = idx
-            while i < S + L:
-                if i - L >= 0 and i - L < S:
-                    block[i - L] = True
-                i += p
-            # Update idx for next iteration
-            cp[cp.index(idx_pair)] = (p, i)
-        
-        for i in range(min(S, R - L)):
-            if not block[i]:
-                pr.append((L + i) * 2 + 1)
-    
+    pr = array('q')
+    for seg in prime_segments(0, LIM):
+        pr.extend(seg)
     return pr
-
@@ -5,16 +5,28 @@ License: CC0
 Source: Wikipedia, https://miller-rabin.appspot.com/
 Description: Deterministic Miller-Rabin primality test.
 Guaranteed to work for numbers up to 7*10^18; for larger numbers, use Python and extend A randomly.
+Numbers with a prime factor below 200 are rejected first by a single gcd with
+the product of those primes (a wheel), and the exponentiations use the built-in pow.
+is_prime_many tests a whole batch, optionally split over a process pool.
 Time: 7 times the complexity of a^b mod c.
 Status: Stress-tested
 """
 
-from .mod_mul_ll import modpow
+import math
+from typing import Iterable, List, Optional
+
+SMALL_PRIMES = [p for p in range(2, 200) if all(p % q for q in range(2, p))]
+PRIMORIAL = math.prod(SMALL_PRIMES)
+_SMALL_SET = frozenset(SMALL_PRIMES)
 
 def is_prime(n: int) -> bool:
     """Deterministic Miller-Rabin primality test"""
     if n < 2 or n % 6 % 4 != 1:
         return (n | 1) == 3
+    if math.gcd(n, PRIMORIAL) != 1:
+        return n in _SMALL_SET
+    if n < 211 * 211:  # no prime factor below 211
+        return True
     
     A = [2, 325, 9375, 28178, 450775, 9780504, 1795265022]
     s = (n - 1) & -(n - 1)  # count trailing zeroes: isolate lowest set bit
@@ -22,7 +34,7 @@ def is_prime(n: int) -> bool:
     d = n >> s
     
     for a in A:
-        p = modpow(a % n, d, n)
+        p = pow(a % n, d, n)
         i = s
         while p != 1 and p != n - 1 and a % n and i:
             p = (p * p) % n
@@ -31,3 +43,17 @@ def is_prime(n: int) -> bool:
             return False
     return True
 
+def _is_prime_chunk(ns: List[int]) -> List[bool]:
+    """Process-pool worker"""
+    return [is_prime(n) for n in ns]
+
+def is_prime_many(ns: Iterable[int], processes: Optional[int] = None,
+                  chunk: int = 1 << 14) -> List[bool]:
+    """is_prime(n) for every n in ns"""
+    ns = list(ns)
+    if not processes:
+        return [is_prime(n) for n in ns]
+    from multiprocessing import Pool
+    with Pool(processes) as pool:
+        parts = pool.map(_is_prime_chunk, [ns[i:i + chunk] for i in range(0, len(ns), chunk)])
+    return [r for part in parts for r in part]
@@ -4,10 +4,15 @@ Date: 2016-07-24
 License: CC0
 Source: Russian page
 Description: Pre-computation of modular inverses. Assumes LIM <= mod and that mod is a prime.
+batch_inverse inverts arbitrary values modulo any mod with one pow(x, -1, mod)
+(Montgomery's trick): invert the product of all values, then peel the values
+off again walking backwards through the prefix products.
+Time: O(LIM), batch_inverse O(n + log mod)
 Status: Works
 """
 
-from typing import List
+from itertools import accumulate
+from typing import Iterable, List
 
 def compute_inverses(LIM: int, mod: int) -> List[int]:
     """Pre-compute modular inverses for 1 to LIM-1 modulo mod (mod must be prime)"""
@@ -17,3 +22,16 @@ def compute_inverses(LIM: int, mod: int) -> List[int]:
         inv[i] = mod - (mod // i) * inv[mod % i] % mod
     return inv
 
+def batch_inverse(xs: Iterable[int], mod: int) -> List[int]:
+    """Inverses of all xs modulo mod (ValueError if one is not invertible)"""
+    xs = [x % mod for x in xs]
+    if not xs:
+        return []
+    pre = list(accumulate(xs, lambda x, y: x * y % mod))
+    inv = pow(pre[-1], -1, mod)
+    res = [0] * len(xs)
+    for i in range(len(xs) - 1, 0, -1):
+        res[i] = inv * pre[i - 1] % mod
+        inv = inv * xs[i] % mod
+    res[0] = inv
+    return res
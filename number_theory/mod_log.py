@@ -6,12 +6,25 @@ Source: own work
 Description: Returns the smallest x > 0 s.t. a^x = b (mod m), or
 -1 if no such x exists. mod_log(a,1,m) can be used to
 calculate the order of a.
-Time: O(√m)
+DiscreteLog(a, m) answers many queries for a fixed base a coprime to m.
+It computes the order n of a and works in the cyclic group it generates
+(Pohlig-Hellman): for every prime power q^e || n the answer mod q^e is found digit
+by digit as a log in the subgroup of order q, and the residues are combined by CRT.
+Each such subgroup gets its baby-step table (a dict a^j -> j for j < T) built once,
+so a query costs q/T giant steps per digit. Pass table > sqrt(q) to trade memory for
+faster queries when there are many. For a not coprime to m it falls back to mod_log.
+Usage: L = DiscreteLog(3, 10**9 + 7); L.log(5)  # smallest x > 0 with 3^x = 5
+Time: O(√m); DiscreteLog O(sum_q T) setup after factoring m, O(sum_q e_q q/T) per query
 Status: tested for all 0 <= a,x < 500 and 0 < m < 500.
 """
 
 import math
-from typing import Dict
+from collections import Counter
+from itertools import accumulate
+from typing import Dict, List, Optional
+
+from .crt import crt
+from .factor import factor
 
 def mod_log(a: int, b: int, m: int) -> int:
     """
@@ -42,3 +55,77 @@ def mod_log(a: int, b: int, m: int) -> int:
     
     return -1
 
+class _BabySteps:
+    """Logs base g (of order n) mod m by baby-step giant-step with T baby steps"""
+    def __init__(self, g: int, n: int, m: int, T: int):
+        T = max(1, min(T, n))
+        pw = list(accumulate(range(T - 1), lambda x, _: x * g % m, initial=1))
+        # Reversed so that the smallest exponent of each power is kept
+        self.tab = dict(zip(reversed(pw), range(T - 1, -1, -1)))
+        self.T = T
+        self.giant = pow(g, -T, m)
+        self.steps = -(-n // T)
+        self.m = m
+
+    def log(self, h: int) -> int:
+        """Smallest x >= 0 with g^x = h, or -1"""
+        tab, giant, m = self.tab, self.giant, self.m
+        for i in range(self.steps):
+            j = tab.get(h)
+            if j is not None:
+                return i * self.T + j
+            h = h * giant % m
+        return -1
+
+class DiscreteLog:
+    def __init__(self, a: int, m: int, table: Optional[int] = None):
+        """Prepare logs base a mod m; table = baby steps per prime factor of ord(a)"""
+        self.a = a % m
+        self.m = m
+        self.n = None
+        if m == 1 or math.gcd(a, m) != 1:
+            return
+        phi = m
+        for p in set(factor(m)):
+            phi = phi // p * (p - 1)
+        n = phi
+        for p in set(factor(phi)):
+            while n % p == 0 and pow(a, n // p, m) == 1:
+                n //= p
+        self.n = n
+        self.ainv = pow(a, -1, m)
+        self.parts = []  # (q, e, a^(n/q), baby steps in the order-q subgroup)
+        for q, e in Counter(factor(n)).items():
+            T = table or math.isqrt(q) + 1
+            g = pow(a, n // q, m)
+            self.parts.append((q, e, _BabySteps(g, q, m, T)))
+
+    def log(self, b: int) -> int:
+        """Smallest x > 0 s.t. a^x = b (mod m), or -1"""
+        m, n = self.m, self.n
+        if n is None:
+            return mod_log(self.a, b, m)
+        b %= m
+        x = 0
+        mod = 1
+        for q, e, bs in self.parts:
+            # x mod q^e, digit by digit
+            xq = 0
+            qk = 1
+            for _ in range(e):
+                h = pow(b * pow(self.ainv, xq, m) % m, n // (qk * q), m)
+                d = bs.log(h)
+                if d < 0:
+                    return -1
+                xq += d * qk
+                qk *= q
+            x = crt(x, mod, xq, qk)
+            mod *= qk
+        if pow(self.a, x, m) != b:
+            return -1
+        return x if x else n
+
+    def log_many(self, bs: List[int]) -> List[int]:
+        """[log(b) for b in bs]"""
+        log = self.log
+        return [log(b) for b in bs]
@@ -4,10 +4,27 @@ Date: 2016-08-31
 License: CC0
 Source: http://eli.thegreenplace.net/2009/03/07/computing-modular-square-roots-in-python/
 Description: Tonelli-Shanks algorithm for modular square roots. Finds x s.t. x^2 = a (mod p) (-x gives the other solution).
-Time: O(log^2 p) worst case, O(log p) for most p
+ModRoots(p) keeps per-prime state for many queries. sqrt_many returns -1 for
+non-squares, and for p = 3 (mod 4) is a single pow per value. kth_root uses
+Adleman-Manders-Miller: for each prime power r^e dividing d = gcd(k, p-1),
+write p-1 = s r^t. Then x = a^(r^-e mod s) satisfies x^(r^e) = a b, where b lies
+in the r-Sylow subgroup. Its discrete log there is found base r, digit by digit,
+each digit being a log in the order-r subgroup (baby-step giant-step, table cached
+per r). Dividing that log by r^e gives the correction. The leftover exponent
+k/d is coprime to (p-1)/d and is undone with its inverse. The non-residues and
+2-adic (r-adic) decompositions are cached, and so is primitive_root, which
+needs p-1 factored.
+Usage: R = ModRoots(998244353); R.sqrt_many([4, 9, 3]); R.kth_root(5, 7)
+Time: O(log^2 p) worst case, O(log p) for most p; kth_root O(sum_r t_r (log p + √r))
 Status: Tested for all a,p <= 10000
 """
 
+import math
+from collections import Counter
+from typing import Iterable, List
+
+from .factor import factor
+from .mod_log import _BabySteps
 from .mod_pow import modpow
 
 def mod_sqrt(a: int, p: int) -> int:
@@ -59,3 +76,106 @@ def mod_sqrt(a: int, p: int) -> int:
         b = b * g % p
         r = m
 
+class ModRoots:
+    def __init__(self, p: int):
+        """Root finding modulo the prime p"""
+        self.p = p
+        self._sylow = {}  # r -> data for r^e-th roots, see _prepare
+        self._g = None
+    
+    def _prepare(self, r: int):
+        """p - 1 = s * r^t, a non-r-th-power generator G of the r-Sylow subgroup"""
+        p = self.p
+        s, t = p - 1, 0
+        while s % r == 0:
+            s //= r
+            t += 1
+        z = 2
+        while pow(z, (p - 1) // r, p) == 1:
+            z += 1
+        G = pow(z, s, p)
+        K = pow(G, r ** (t - 1), p)  # order r
+        # gi[k] = G^(-r^k)
+        gi = [pow(G, -1, p)]
+        for _ in range(t - 1):
+            gi.append(pow(gi[-1], r, p))
+        data = (s, t, gi, _BabySteps(K, r, p, math.isqrt(r) + 1))
+        self._sylow[r] = data
+        return data
+    
+    def _root(self, a: int, r: int, e: int) -> int:
+        """An (r^e)-th root of the (r^e)-th power a != 0, r^e | p - 1"""
+        p = self.p
+        s, t, gi, bs = self._sylow.get(r) or self._prepare(r)
+        q = r ** e
+        alpha = pow(q, -1, s) if s > 1 else 0
+        x = pow(a, alpha, p)
+        b = pow(x, q, p) * pow(a, -1, p) % p
+        # b = G^E with r^e | E: find the base-r digits of E from position e on,
+        # dividing b by G^(digit r^k) and x by G^(digit r^(k-e)) as we go
+        for k in range(e, t):
+            h = pow(b, r ** (t - 1 - k), p)
+            d = (h != 1) if r == 2 else bs.log(h)
+            if d:
+                b = b * pow(gi[k], d, p) % p
+                x = x * pow(gi[k - e], d, p) % p
+        return x
+    
+    def sqrt(self, a: int) -> int:
+        """x with x^2 = a (mod p), or -1 if a is not a square"""
+        p = self.p
+        a %= p
+        if a == 0 or p == 2:
+            return a
+        if pow(a, (p - 1) // 2, p) != 1:
+            return -1
+        if p & 3 == 3:
+            return pow(a, (p + 1) // 4, p)
+        return self._root(a, 2, 1)
+    
+    def sqrt_many(self, values: Iterable[int]) -> List[int]:
+        """[sqrt(a) for a in values]"""
+        p = self.p
+        values = [a % p for a in values]
+        if p & 3 == 3:
+            e = (p + 1) // 4
+            xs = [pow(a, e, p) for a in values]
+            return [x if x * x % p == a else -1 for x, a in zip(xs, values)]
+        sqrt = self.sqrt
+        return [sqrt(a) for a in values]
+    
+    def primitive_root(self) -> int:
+        """Smallest generator of the multiplicative group mod p"""
+        if self._g is None:
+            p = self.p
+            qs = set(factor(p - 1))
+            g = 1 if p == 2 else 2
+            while any(pow(g, (p - 1) // q, p) == 1 for q in qs):
+                g += 1
+            self._g = g
+        return self._g
+    
+    def kth_root(self, a: int, k: int) -> int:
+        """x with x^k = a (mod p) for k >= 1, or -1 if there is none"""
+        return self.kth_root_many([a], k)[0]
+    
+    def kth_root_many(self, values: Iterable[int], k: int) -> List[int]:
+        """[kth_root(a, k) for a in values]"""
+        p = self.p
+        d = math.gcd(k, p - 1)
+        test = (p - 1) // d
+        pe = list(Counter(factor(d)).items())
+        # y^d = a  =>  (y^(u^-1 mod (p-1)/d))^k = a, with k = u d
+        inv = pow(k // d, -1, test) if test > 1 else 1
+        res = []
+        for a in values:
+            a %= p
+            if a and pow(a, test, p) != 1:
+                a = -1
+            elif a:
+                # A d-th root, one prime power of d at a time
+                for r, e in pe:
+                    a = self._root(a, r, e)
+                a = pow(a, inv, p)
+            res.append(a)
+        return res
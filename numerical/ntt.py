@@ -11,7 +11,7 @@ Time: O(N log N)
 Status: stress-tested
 """
 
-from typing import List
+from typing import List, Sequence
 
 MOD = 998244353
 ROOT = 62
@@ -28,56 +28,56 @@ def modpow(base: int, exp: int, mod: int) -> int:
     return result
 
 def ntt(a: List[int], inv: bool = False) -> List[int]:
-    """Number Theoretic Transform in-place"""
+    """Number Theoretic Transform in-place (len(a) must be a power of two)"""
     n = len(a)
     if n <= 1:
         return a
     
     L = n.bit_length() - 1
     
-    # Precompute roots
-    rt = [0] * n
-    rt[0] = 1
-    k = 1
-    s = 1
+    # rt[k + j] = w_{2k}^j for every power of two k < n
+    rt = [1, 1]
+    k, s = 2, 2
     while k < n:
-        if k == 1:
-            z = modpow(ROOT, MOD >> (s + 1), MOD)
-        else:
-            z = rt[k // 2] if k & 1 == 0 else (rt[k // 2] * modpow(ROOT, MOD >> (s + 1), MOD)) % MOD
-        rt[k] = z if k % 2 == 0 else (rt[k // 2] * modpow(ROOT, MOD >> (s + 1), MOD)) % MOD
-        k += 1
-        if k & (k - 1) == 0:
-            s += 1
+        z = pow(ROOT, MOD >> s, MOD)
+        rt += [rt[i // 2] * z % MOD if i & 1 else rt[i // 2] for i in range(k, 2 * k)]
+        k *= 2
+        s += 1
     
     # Bit-reverse permutation
     rev = [0] * n
     for i in range(n):
         rev[i] = (rev[i // 2] | (i & 1) << L) // 2
-    for i in range(n):
-        if i < rev[i]:
-            a[i], a[rev[i]] = a[rev[i]], a[i]
+    a[:] = [a[r] for r in rev]
     
-    # NTT computation
+    # Butterflies, each done with slices: over the blocks when there are few
+    # blocks, otherwise over the offset j (all a[i + j] for one j share a root)
     k = 1
     while k < n:
-        for i in range(0, n, 2 * k):
+        step = 2 * k
+        if k >= n // step:
+            w = rt[k:step]
+            for i in range(0, n, step):
+                lo = a[i:i + k]
+                z = [x * y % MOD for x, y in zip(a[i + k:i + step], w)]
+                a[i:i + k] = [(x + y) % MOD for x, y in zip(lo, z)]
+                a[i + k:i + step] = [(x - y) % MOD for x, y in zip(lo, z)]
+        else:
             for j in range(k):
-                z = rt[j + k] * a[i + j + k] % MOD
-                a[i + j + k] = (a[i + j] - z + MOD) % MOD
-                a[i + j] = (a[i + j] + z) % MOD
-        k *= 2
+                r = rt[j + k]
+                lo = a[j::step]
+                z = [x * r % MOD for x in a[j + k::step]]
+                a[j::step] = [(x + y) % MOD for x, y in zip(lo, z)]
+                a[j + k::step] = [(x - y) % MOD for x, y in zip(lo, z)]
+        k = step
     
     if inv:
-        inv_n = modpow(n, MOD - 2, MOD)
-        for i in range(n):
-            a[i] = a[i] * inv_n % MOD
-        a.reverse()
-        a[0], a[n - 1] = a[n - 1], a[0]
+        inv_n = pow(n, MOD - 2, MOD)
+        a[:] = [a[0] * inv_n % MOD] + [x * inv_n % MOD for x in reversed(a[1:])]
     
     return a
 
-def conv(a: List[int], b: List[int]) -> List[int]:
+def conv(a: Sequence[int], b: Sequence[int]) -> List[int]:
     """Convolution modulo 998244353"""
     if not a or not b:
         return []
@@ -85,14 +85,13 @@ def conv(a: List[int], b: List[int]) -> List[int]:
     s = len(a) + len(b) - 1
     n = 1 << (s - 1).bit_length()
     
-    L = a[:] + [0] * (n - len(a))
-    R = b[:] + [0] * (n - len(b))
+    L = list(a) + [0] * (n - len(a))
+    R = list(b) + [0] * (n - len(b))
     
     ntt(L)
     ntt(R)
     
-    out = [(L[i] * R[i]) % MOD for i in range(n)]
+    out = [x * y % MOD for x, y in zip(L, R)]
     ntt(out, inv=True)
     
     return out[:s]
-
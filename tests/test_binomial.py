@@ -0,0 +1,79 @@
+"""
+Tests for Binomial (mod p, Lucas) and exact multinomial
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+from combinatorial.binomial import Binomial
+from combinatorial.multinomial import multinomial
+
+def test_binomial():
+    """Table queries against math.comb"""
+    random.seed(11)
+    p = 10**9 + 7
+    B = Binomial(1000, p)
+    ns = [random.randint(0, 1000) for _ in range(3000)]
+    ks = [random.randint(-5, 1005) for _ in range(3000)]
+    want = [math.comb(n, k) % p if 0 <= k <= n else 0 for n, k in zip(ns, ks)]
+    assert B.nCr_many(ns, ks) == want
+    assert [B.nCr(n, k) for n, k in zip(ns, ks)] == want
+    assert B.nCr_many([], []) == []
+
+def test_lucas():
+    """Large n with small p"""
+    random.seed(12)
+    for p in [2, 3, 5, 7, 13, 101]:
+        B = Binomial(10**5, p)
+        ns = [random.randint(0, 10**12) for _ in range(200)] + list(range(300))
+        ks = [random.randint(0, n) if random.random() < .8 else random.randint(0, n) & 0xff
+              for n in ns]
+        want = []
+        for n, k in zip(ns, ks):
+            if n < 5000:
+                want.append(math.comb(n, k) % p)
+            else:
+                # Lucas by hand from math.comb of the digits
+                r = 1
+                a, b = n, k
+                while a or b:
+                    r = r * math.comb(a % p, b % p) % p
+                    a //= p
+                    b //= p
+                want.append(r)
+        assert B.nCr_many(ns, ks) == want
+
+def _multinomial_mod(v, p):
+    r = math.factorial(sum(v))
+    for k in v:
+        r //= math.factorial(k)
+    return r % p
+
+def test_multinomial():
+    """Exact and modular multinomials"""
+    random.seed(13)
+    p = 998244353
+    B = Binomial(5000, p)
+    for _ in range(50):
+        v = [random.randint(0, 400) for _ in range(random.randint(0, 12))]
+        want = math.factorial(sum(v))
+        for k in v:
+            want //= math.factorial(k)
+        assert multinomial(v) == want
+        assert B.multinomial(v) == want % p
+    v = [3000, 2500, 1, 0, 4000]
+    want = math.factorial(sum(v))
+    for k in v:
+        want //= math.factorial(k)
+    assert multinomial(v) == want
+    assert multinomial([]) == 1
+    assert Binomial(10, 7).multinomial([5, 6, 9]) == _multinomial_mod([5, 6, 9], 7)
+
+if __name__ == "__main__":
+    test_binomial()
+    test_lucas()
+    test_multinomial()
+    print("Tests passed!")
@@ -0,0 +1,63 @@
+"""
+Test for MaxClique and maximal clique enumeration
+Compared against brute force over all vertex subsets (n <= 14)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.maximum_clique import MaxClique
+from graph.maximal_cliques import maximal_cliques, maximal_cliques_bits
+
+def random_graph(n):
+    p = random.random()
+    mat = [[False] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i):
+            mat[i][j] = mat[j][i] = random.random() < p
+    masks = [sum(1 << j for j in range(n) if mat[i][j]) for i in range(n)]
+    return mat, masks
+
+def brute_cliques(n, masks):
+    """All cliques as bitmasks"""
+    res = []
+    for S in range(1 << n):
+        if all(S & ~masks[v] & ~(1 << v) == 0 for v in range(n) if S >> v & 1):
+            res.append(S)
+    return res
+
+def is_maximal(n, masks, S):
+    return not any(not S >> v & 1 and S & ~masks[v] == 0 for v in range(n))
+
+def test_max_clique():
+    random.seed(34)
+    for it in range(300):
+        n = random.randint(0, 14 if it % 10 == 0 else 9)
+        mat, masks = random_graph(n)
+        best = max(bin(S).count('1') for S in brute_cliques(n, masks))
+        runs = [MaxClique(mat).max_clique()]
+        if it % 50 == 0:
+            runs.append(MaxClique(mat).max_clique(processes=2))
+        for cl in runs:
+            assert len(cl) == len(set(cl)) == best
+            assert all(mat[a][b] for a in cl for b in cl if a != b)
+
+def test_maximal_cliques():
+    random.seed(35)
+    for it in range(300):
+        n = random.randint(0, 14 if it % 10 == 0 else 9)
+        mat, masks = random_graph(n)
+        want = sorted(S for S in brute_cliques(n, masks) if is_maximal(n, masks, S))
+        got = []
+        maximal_cliques_bits(masks, got.append)
+        assert sorted(got) == want
+        sets = []
+        maximal_cliques([{j for j in range(n) if mat[i][j]} for i in range(n)], sets.append)
+        assert sorted(sum(1 << v for v in s) for s in sets) == want
+
+if __name__ == "__main__":
+    test_max_clique()
+    test_maximal_cliques()
+    print("Tests passed!")
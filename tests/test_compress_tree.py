@@ -0,0 +1,62 @@
+"""
+Test for compress_tree_many and LCA.lca_many
+Compared against per-subset compress_tree and per-pair lca
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.lca import LCA
+from graph.compress_tree import compress_tree, compress_tree_many
+from test_utils import gen_random_tree
+
+def random_lca(n):
+    tree = [[] for _ in range(n)]
+    for a, b in gen_random_tree(n) if n > 1 else []:
+        tree[a].append(b)
+        tree[b].append(a)
+    return LCA(tree)
+
+def as_lists(off, nodes, par):
+    """CSR output of compress_tree_many as compress_tree-style lists"""
+    return [[(par[i], nodes[i]) for i in range(off[s], off[s + 1])]
+            for s in range(len(off) - 1)]
+
+class NoBatch:
+    """LCA wrapper without lca_many, to exercise the per-pair fallback"""
+    def __init__(self, lca):
+        self.time = lca.time
+        self.lca = lca.lca
+
+def test_compress_tree_many():
+    random.seed(33)
+    for it in range(300):
+        n = random.randint(1, 40)
+        lca = random_lca(n)
+        subsets = []
+        for _ in range(random.randint(0, 8)):
+            k = random.choice([0, 1, 1, 2, random.randint(0, n), random.randint(0, 2 * n)])
+            # May contain duplicates
+            subsets.append([random.randrange(n) for _ in range(k)])
+        want = [compress_tree(lca, s) for s in subsets]
+        assert as_lists(*compress_tree_many(lca, subsets)) == want
+        if it % 10 == 0:
+            assert as_lists(*compress_tree_many(NoBatch(lca), subsets)) == want
+    assert compress_tree_many(random_lca(5), []) == ([0], [], [])
+
+def test_lca_many():
+    random.seed(34)
+    for n in [1, 2, 10, 100, 1000]:
+        lca = random_lca(n)
+        a = [random.randrange(n) for _ in range(500)]
+        b = [random.randrange(n) for _ in range(500)]
+        assert lca.lca_many(a, b) == [lca.lca(x, y) for x, y in zip(a, b)]
+        assert lca.lca_many(a, a) == a
+        assert lca.lca_many([], []) == []
+
+if __name__ == "__main__":
+    test_compress_tree_many()
+    test_lca_many()
+    print("Tests passed!")
@@ -0,0 +1,70 @@
+"""
+Tests for crt, Garner and crt_many
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+from number_theory.crt import crt, crt_many, Garner
+
+def test_crt():
+    """Pairwise crt against brute force"""
+    for m in range(1, 20):
+        for n in range(1, 20):
+            g = math.gcd(m, n)
+            for a in range(m):
+                for b in range(n):
+                    if (a - b) % g:
+                        continue
+                    x = crt(a, m, b, n)
+                    assert x % m == a and x % n == b and 0 <= x < m * n // g
+
+def test_crt_many():
+    """Non-coprime moduli, inconsistent lanes reported as -1"""
+    random.seed(51)
+    assert crt_many([[2, 0], [3, 4]], [4, 6]) == [-1, 4]
+    assert crt_many([], []) == []
+    for _ in range(1000):
+        ms = [random.randint(1, 12) for _ in range(random.randint(1, 4))]
+        L = 1
+        for m in ms:
+            L = L * m // math.gcd(L, m)
+        res = [[random.randrange(-30, 30) for _ in range(8)] for _ in ms]
+        for j in range(0, 8, 2):
+            x = random.randrange(L)
+            for i, m in enumerate(ms):
+                res[i][j] = x % m + m * random.randint(-1, 1)
+        out = crt_many(res, ms)
+        for j in range(8):
+            sols = [x for x in range(L) if all((x - res[i][j]) % m == 0 for i, m in enumerate(ms))]
+            assert out[j] == (sols[0] if sols else -1)
+
+def test_garner():
+    """Reconstruction of big values from NTT-prime residues"""
+    random.seed(52)
+    ps = [998244353, 167772161, 469762049, 754974721]
+    G = Garner(ps)
+    assert G.lcm == math.prod(ps)
+    vals = [random.randrange(G.lcm) for _ in range(5000)]
+    assert G.reconstruct([[v % p for v in vals] for p in ps]) == vals
+
+def test_garner_shape():
+    """Missing rows and ragged rows are rejected, not truncated"""
+    G = Garner([3, 5, 7])
+    for bad in ([[1], [2]], [[1, 2], [2, 3], [3]], []):
+        try:
+            G.reconstruct(bad)
+            assert False
+        except AssertionError as e:
+            assert str(e)
+    assert Garner([]).reconstruct([]) == []
+
+if __name__ == "__main__":
+    test_crt()
+    test_crt_many()
+    test_garner()
+    test_garner_shape()
+    print("Tests passed!")
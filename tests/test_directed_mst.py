@@ -0,0 +1,106 @@
+"""
+Test for directed_mst, directed_mst_many and best_root_mst
+Compared against exhaustive search over all choices of incoming edges
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from itertools import product
+from graph.directed_mst import Edge, directed_mst, directed_mst_many, best_root_mst
+
+INF = float('inf')
+
+def brute(n, r, edges):
+    """Cheapest arborescence rooted at r, or -1"""
+    incoming = [[e for e in edges if e.b == v and e.a != v] for v in range(n)]
+    others = [v for v in range(n) if v != r]
+    best = INF
+    for choice in product(*(incoming[v] for v in others)):
+        par = [-1] * n
+        for v, e in zip(others, choice):
+            par[v] = e.a
+        if is_tree(n, r, par):
+            best = min(best, sum(e.w for e in choice))
+    return -1 if best == INF else best
+
+def is_tree(n, r, par):
+    """Every vertex reaches r by following parents"""
+    if par[r] != -1:
+        return False
+    for v in range(n):
+        for _ in range(n):
+            if v == r:
+                break
+            v = par[v]
+            if v < 0:
+                return False
+        if v != r:
+            return False
+    return True
+
+def check(n, r, edges, cost, par):
+    """par is an arborescence rooted at r of total weight cost"""
+    assert is_tree(n, r, par)
+    assert sum(min(e.w for e in edges if e.a == par[v] and e.b == v)
+               for v in range(n) if v != r) == cost
+
+def random_graph():
+    n = random.randint(1, 6)
+    edges = [Edge(random.randrange(n), random.randrange(n), random.randint(0, 20))
+             for _ in range(random.randint(0, 12))]
+    return n, edges
+
+def test_directed_mst():
+    random.seed(35)
+    unreachable = 0
+    for _ in range(1500):
+        n, edges = random_graph()
+        saved = [(e.a, e.b, e.w) for e in edges]
+        want = [brute(n, r, edges) for r in range(n)]
+        unreachable += want.count(-1)
+        for r in range(n):
+            cost, par = directed_mst(n, r, edges)
+            assert cost == want[r]
+            if cost == -1:
+                assert par == []
+            else:
+                check(n, r, edges, cost, par)
+        assert [(e.a, e.b, e.w) for e in edges] == saved  # edges are not modified
+
+        roots = list(range(n)) + [random.randrange(n) for _ in range(random.randint(0, 4))]
+        many = directed_mst_many(n, roots, edges)
+        assert [c for c, _ in many] == [want[r] for r in roots]
+        for r, (cost, par) in zip(roots, many):
+            if cost != -1:
+                check(n, r, edges, cost, par)
+
+        roots = sorted(set(roots))
+        cost, root, par = best_root_mst(n, roots, edges)
+        feasible = [want[r] for r in roots if want[r] != -1]
+        if not feasible:
+            assert (cost, root, par) == (-1, -1, [])
+        else:
+            assert cost == min(feasible) and root in roots and want[root] == cost
+            check(n, root, edges, cost, par)
+    assert unreachable > 100
+
+def test_directed_mst_many_large():
+    # Shared contraction against one directed_mst per root, negative weights included
+    random.seed(350)
+    for _ in range(100):
+        n = random.randint(1, 40)
+        edges = [Edge(random.randrange(n), random.randrange(n), random.randint(-20, 20))
+                 for _ in range(random.randint(0, 4 * n))]
+        many = directed_mst_many(n, range(n), edges)
+        for r, (cost, par) in enumerate(many):
+            assert cost == directed_mst(n, r, edges)[0]
+            if par:
+                check(n, r, edges, cost, par)
+
+if __name__ == "__main__":
+    test_directed_mst()
+    test_directed_mst_many_large()
+    print("Tests passed!")
@@ -0,0 +1,65 @@
+"""
+Test for offline dynamic connectivity
+Compared against a UnionFind rebuilt from the live edges at every query
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from collections import Counter
+from data_structures.dynamic_connectivity import DynamicConnectivity, dynamic_connectivity
+from data_structures.union_find import UnionFind
+
+def rebuild(n, live):
+    uf = UnionFind(n)
+    for (a, b), c in live.items():
+        if c:
+            uf.join(a, b)
+    return uf
+
+def test_dynamic_connectivity():
+    random.seed(28)
+    for _ in range(400):
+        n = random.randint(1, 8)
+        live = Counter()
+        ops = []
+        want = []
+        for _ in range(random.randint(0, 60)):
+            t = random.randrange(4)
+            a, b = random.randrange(n), random.randrange(n)
+            key = (min(a, b), max(a, b))
+            if t == 0 or (t == 1 and not live[key]):
+                # Also re-adds edges that are already present
+                live[key] += 1
+                ops.append((0, a, b))
+            elif t == 1:
+                live[key] -= 1
+                ops.append((1, b, a))
+            elif t == 2:
+                ops.append((2, a, b))
+                want.append(rebuild(n, live).same_set(a, b))
+            else:
+                ops.append((3, 0, 0))
+                uf = rebuild(n, live)
+                want.append(sum(uf.find(v) == v for v in range(n)))
+        assert dynamic_connectivity(n, ops) == want
+
+def test_remove_absent():
+    dc = DynamicConnectivity(3)
+    dc.add_edge(0, 1)
+    dc.remove_edge(1, 0)
+    for a, b in ((0, 1), (1, 2)):
+        try:
+            dc.remove_edge(a, b)
+            assert False
+        except KeyError:
+            pass
+    q = dc.connected(0, 1)
+    assert dc.solve()[q] == False
+
+if __name__ == "__main__":
+    test_dynamic_connectivity()
+    test_remove_absent()
+    print("Tests passed!")
@@ -0,0 +1,43 @@
+"""
+Test for edge_coloring
+Checks properness and the number of colors on random graphs
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.edge_coloring import edge_coloring, bipartite_edge_coloring
+
+def check(eds, col, ncols):
+    seen = set()
+    for (u, v), c in zip(eds, col):
+        assert 0 <= c < ncols
+        assert (u, c) not in seen and (v, c) not in seen
+        seen.add((u, c))
+        seen.add((v, c))
+
+def max_degree(N, eds):
+    deg = [0] * N
+    for u, v in eds:
+        deg[u] += 1
+        deg[v] += 1
+    return max(deg)
+
+def test_edge_coloring():
+    random.seed(13)
+    for _ in range(3000):
+        N = random.randint(2, 12)
+        pairs = [(a, b) for a in range(N) for b in range(a + 1, N)]
+        eds = [(b, a) if random.random() < 0.5 else (a, b)
+               for a, b in random.sample(pairs, random.randint(0, len(pairs)))]
+        check(eds, edge_coloring(N, eds), max_degree(N, eds) + 1)
+
+        L = random.randint(1, N - 1)
+        eds = [(u, v) for u, v in eds if (u < L) != (v < L)]
+        check(eds, bipartite_edge_coloring(N, eds), max_degree(N, eds))
+
+if __name__ == "__main__":
+    test_edge_coloring()
+    print("Tests passed!")
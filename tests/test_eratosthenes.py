@@ -7,7 +7,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import random
+import tempfile
 from number_theory.eratosthenes import eratosthenes_sieve
+from number_theory.fast_eratosthenes import fast_eratosthenes, prime_segments, primes_in_range
+from number_theory.prime_cache import PrimeCache
+from number_theory.prime_counting import prime_pi
 
 def is_prime_naive(n):
     """Naive primality test for verification"""
@@ -40,6 +45,55 @@ def test_eratosthenes():
     
     print("Tests passed!")
 
+def test_fast_eratosthenes():
+    """Test segmented sieve against the simple one"""
+    ref = eratosthenes_sieve(100000)
+    for lim in range(0, 1000):
+        assert list(fast_eratosthenes(lim)) == [p for p in ref if p < lim]
+    assert list(fast_eratosthenes(100000)) == ref
+
+    random.seed(1)
+    for _ in range(200):
+        lo = random.randint(0, 100000)
+        hi = random.randint(lo, 100000)
+        S = random.choice([7, 64, 1000, 1 << 18])
+        got = [p for seg in prime_segments(lo, hi, S) for p in seg]
+        assert got == [p for p in ref if lo <= p < hi]
+
+def test_prime_cache():
+    """Test the on-disk prime table, including ranges past its limit"""
+    ref = eratosthenes_sieve(20000)
+    refset = set(ref)
+    random.seed(2)
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "primes.bin")
+        for lim in (0, 1, 2, 3, 10, 17, 1000, 15000):
+            with PrimeCache(path, lim) as pc:
+                for _ in range(100):
+                    lo = random.randint(0, 20000)
+                    hi = random.randint(lo, 20000)
+                    assert list(pc.primes(lo, hi)) == [p for p in ref if lo <= p < hi]
+                for n in range(3000):
+                    assert pc.is_prime(n) == (n in refset)
+            # A smaller request reuses the existing file
+            with PrimeCache(path, lim // 2) as pc:
+                assert pc.limit == lim
+        assert list(primes_in_range(100, 20000)) == [p for p in ref if p >= 100]
+
+def test_prime_pi():
+    """Test Lucy_Hedgehog prime counting"""
+    ref = eratosthenes_sieve(100001)
+    j = 0
+    for n in range(100001):
+        while j < len(ref) and ref[j] <= n:
+            j += 1
+        if n < 2000 or n % 997 == 0:
+            assert prime_pi(n) == j
+    assert prime_pi(10**9) == 50847534
+
 if __name__ == "__main__":
     test_eratosthenes()
+    test_fast_eratosthenes()
+    test_prime_cache()
+    test_prime_pi()
 
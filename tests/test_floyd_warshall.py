@@ -0,0 +1,57 @@
+"""
+Test for FloydWarshall and tropical matrix powers
+Stress-tested against bellman_ford
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.bellman_ford import bellman_ford, Node, Edge
+from graph.floyd_warshall import floyd_warshall, get_path, INF
+from data_structures.matrix import TropicalMatrix
+
+def test_floyd_warshall():
+    random.seed(42)
+    for _ in range(1000):
+        n = random.randint(1, 10)
+        lo = random.choice([0, -3])
+        eds = [(random.randrange(n), random.randrange(n), random.randint(lo, 10))
+               for _ in range(random.randint(0, 25))]
+        m = [[INF] * n for _ in range(n)]
+        for a, b, w in eds:
+            m[a][b] = min(m[a][b], w)
+        orig = [row[:] for row in m]
+        nxt = floyd_warshall(m, paths=True)
+
+        for s in range(n):
+            nodes = [Node() for _ in range(n)]
+            bellman_ford(nodes, [Edge(a, b, w) for a, b, w in eds], s)
+            assert m[s] == [nd.dist for nd in nodes]
+            for t in range(n):
+                path = get_path(m, nxt, s, t)
+                if abs(m[s][t]) != INF:
+                    assert path[0] == s and path[-1] == t
+                    assert sum(orig[a][b] if a != b else 0 for a, b in zip(path, path[1:])) == m[s][t]
+
+def test_tropical_power():
+    random.seed(7)
+    for _ in range(200):
+        n = random.randint(1, 6)
+        A = TropicalMatrix(n)
+        for _ in range(random.randint(0, 12)):
+            A.d[random.randrange(n)][random.randrange(n)] = random.randint(-5, 10)
+        k = random.randint(0, 6)
+        # Brute force: cheapest walk with exactly k edges
+        cur = [[0 if i == j else INF for j in range(n)] for i in range(n)]
+        for _ in range(k):
+            cur = [[min([cur[i][l] + A.d[l][j] for l in range(n)
+                         if cur[i][l] != INF and A.d[l][j] != INF], default=INF)
+                    for j in range(n)] for i in range(n)]
+        assert (A ** k).d == cur
+
+if __name__ == "__main__":
+    test_floyd_warshall()
+    test_tropical_power()
+    print("Tests passed!")
@@ -0,0 +1,62 @@
+"""
+Test for global_min_cut
+Compared against brute force over all cuts
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.global_min_cut import global_min_cut, global_min_cut_sparse, karger_stein
+
+def cut_weight(eds, side):
+    S = set(side)
+    return sum(w for u, v, w in eds if (u in S) != (v in S))
+
+def brute(n, eds):
+    return min(cut_weight(eds, [v for v in range(n) if mask >> v & 1])
+               for mask in range(1, (1 << n) - 1))
+
+def test_global_min_cut():
+    random.seed(14)
+    for it in range(500):
+        n = random.randint(2, 9)
+        eds = [(random.randrange(n), random.randrange(n), random.randint(0, 9))
+               for _ in range(random.randint(0, 20))]
+        mat = [[0] * n for _ in range(n)]
+        for u, v, w in eds:
+            mat[u][v] += w
+            mat[v][u] += w
+        expect = brute(n, eds)
+        for w, side in (global_min_cut(mat), global_min_cut_sparse(n, eds),
+                        karger_stein(n, eds, trials=30, seed=it)):
+            assert w == expect
+            assert 0 < len(side) < n and cut_weight(eds, side) == expect
+
+def test_karger_stein_large():
+    random.seed(15)
+    for it in range(3):
+        n = random.randint(60, 90)
+        eds = [(random.randrange(n), random.randrange(n), random.randint(1, 9))
+               for _ in range(4 * n)]
+        w, side = global_min_cut_sparse(n, eds)
+        assert cut_weight(eds, side) == w
+        w2, side2 = karger_stein(n, eds, seed=it)
+        assert w2 == w and cut_weight(eds, side2) == w
+
+def test_too_few_nodes():
+    # No cut exists with fewer than 2 nodes
+    for n in (0, 1):
+        for f in (global_min_cut_sparse, karger_stein):
+            try:
+                f(n, [(0, 0, 5)] if n else [])
+                assert False
+            except ValueError:
+                pass
+
+if __name__ == "__main__":
+    test_global_min_cut()
+    test_karger_stein_large()
+    test_too_few_nodes()
+    print("Tests passed!")
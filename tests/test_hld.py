@@ -0,0 +1,124 @@
+"""
+Test for HLD (and the array-backed LazySegmentTree behind it)
+Stress-tested against walking the tree naively
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.hld import HLD
+from data_structures.lazy_segment_tree import LazySegmentTree
+from test_utils import gen_random_tree
+
+def check(n, kind, vals_edges, ops, scale=1):
+    adj = [[] for _ in range(n)]
+    if n > 1:
+        for a, b in gen_random_tree(n):
+            adj[a].append(b)
+            adj[b].append(a)
+    par = [-1] * n
+    depth = [0] * n
+    order = [0]
+    for v in order:
+        for u in adj[v]:
+            if u != par[v]:
+                par[u] = v
+                depth[u] = depth[v] + 1
+                order.append(u)
+
+    def lca(u, v):
+        while u != v:
+            if depth[u] >= depth[v]:
+                u = par[u]
+            else:
+                v = par[v]
+        return u
+
+    def path(u, v):
+        a, b = [], []
+        while u != v:
+            if depth[u] >= depth[v]:
+                a.append(u)
+                u = par[u]
+            else:
+                b.append(v)
+                v = par[v]
+        return a + ([] if vals_edges else [u]) + b
+
+    def subtree(v):
+        res = [v]
+        for x in res:
+            res += [u for u in adj[x] if u != par[x]]
+        return res[1:] if vals_edges else res
+
+    hld = HLD(adj, vals_edges, kind)
+    agg = max if kind == 'max' else sum
+    val = [0] * n
+    for _ in range(ops):
+        u = random.randrange(n)
+        v = random.randrange(n)
+        x = random.randint(-5, 5) * scale
+        t = random.random()
+        if t < 0.25:
+            hld.modify_path(u, v, x)
+            for w in path(u, v):
+                val[w] += x
+        elif t < 0.4:
+            hld.set_path(u, v, x)
+            for w in path(u, v):
+                val[w] = x
+        elif t < 0.5:
+            hld.modify_subtree(u, x)
+            for w in subtree(u):
+                val[w] += x
+        elif t < 0.8:
+            p = path(u, v)
+            assert hld.query_path(u, v) == (agg(val[w] for w in p) if p else hld.tree.unit)
+        else:
+            p = subtree(u)
+            assert hld.query_subtree(u) == (agg(val[w] for w in p) if p else hld.tree.unit)
+        assert hld.lca(u, v) == lca(u, v)
+
+def test_hld():
+    random.seed(42)
+    for _ in range(200):
+        n = random.randint(1, 30)
+        for kind in ('max', 'sum'):
+            for vals_edges in (False, True):
+                check(n, kind, vals_edges, 50)
+                check(n, kind, vals_edges, 20, 10**10)
+    print("Tests passed!")
+
+def test_lazy_segment_tree_large():
+    # Values beyond +-1e9 must not be clipped by the max/min identity
+    random.seed(7)
+    aggs = {'max': max, 'min': min, 'sum': sum}
+    for _ in range(200):
+        n = random.randint(1, 20)
+        for kind, agg in aggs.items():
+            val = [random.randint(-10**12, 10**12) for _ in range(n)]
+            st = LazySegmentTree(n, kind, val[:])
+            for _ in range(30):
+                l = random.randrange(n)
+                r = random.randint(l + 1, n)
+                x = random.randint(-10**12, 10**12)
+                t = random.random()
+                if t < 0.3:
+                    st.add(l, r, x)
+                    for i in range(l, r):
+                        val[i] += x
+                elif t < 0.5:
+                    st.set(l, r, x)
+                    for i in range(l, r):
+                        val[i] = x
+                else:
+                    assert st.query(l, r) == agg(val[l:r])
+    assert LazySegmentTree(3, 'max', [-5 * 10**9, -6 * 10**9, -7 * 10**9]).query(0, 3) == -5 * 10**9
+    assert LazySegmentTree(3, 'min', [5 * 10**9, 6 * 10**9, 7 * 10**9]).query(0, 3) == 5 * 10**9
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_hld()
+    test_lazy_segment_tree_large()
@@ -0,0 +1,79 @@
+"""
+Test for hopcroft_karp, hopcroft_karp_csr and minimum_vertex_cover
+Matching sizes compared against dfs_matching, covers checked via König's theorem
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.hopcroft_karp import hopcroft_karp, hopcroft_karp_csr
+from graph.dfs_matching import dfs_matching
+from graph.minimum_vertex_cover import minimum_vertex_cover
+from graph.csr import to_csr
+
+def random_bipartite():
+    n = random.randint(0, 12)
+    m = random.randint(0, 12)
+    p = random.random()
+    g = [[b for b in range(m) if random.random() < p] for _ in range(n)]
+    for row in g:
+        random.shuffle(row)
+    return n, m, g
+
+def check_matching(g, btoa, size):
+    lefts = [a for a in btoa if a != -1]
+    assert len(lefts) == len(set(lefts)) == size
+    for b, a in enumerate(btoa):
+        assert a == -1 or b in g[a]
+
+def test_hopcroft_karp():
+    random.seed(29)
+    for _ in range(1500):
+        n, m, g = random_bipartite()
+        ref = [-1] * m
+        want = dfs_matching(g, ref)
+
+        btoa = [-1] * m
+        assert hopcroft_karp(g, btoa) == want
+        check_matching(g, btoa, want)
+
+        A = [a for a in range(n) for _ in g[a]]
+        B = [b for row in g for b in row]
+        start, nbr, _ = to_csr(n, A, B)
+        for greedy in (False, True):
+            # Empty warm start
+            btoa = [-1] * m
+            assert hopcroft_karp_csr(start, nbr, btoa, greedy)[0] == want
+            check_matching(g, btoa, want)
+            # Partial warm start: a random part of a maximum matching
+            btoa = [a if random.random() < .5 else -1 for a in ref]
+            assert hopcroft_karp_csr(start, nbr, btoa, greedy)[0] == want
+            check_matching(g, btoa, want)
+            # Warm start from a (possibly non-maximum) greedy matching
+            btoa = [-1] * m
+            for a in random.sample(range(n), n):
+                for b in g[a]:
+                    if btoa[b] == -1:
+                        btoa[b] = a
+                        break
+            assert hopcroft_karp_csr(start, nbr, btoa, greedy)[0] == want
+            check_matching(g, btoa, want)
+
+def test_minimum_vertex_cover():
+    random.seed(30)
+    for _ in range(1500):
+        n, m, g = random_bipartite()
+        want = dfs_matching(g, [-1] * m)
+        cover = minimum_vertex_cover(g, n, m)
+        assert len(cover) == len(set(cover)) == want
+        S = set(cover)
+        for a in range(n):
+            for b in g[a]:
+                assert a in S or n + b in S
+
+if __name__ == "__main__":
+    test_hopcroft_karp()
+    test_minimum_vertex_cover()
+    print("Tests passed!")
@@ -9,7 +9,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import random
 from graph.lca import LCA
-from graph.binary_lifting import tree_jump, lca as bin_lca
+from graph.binary_lifting import tree_jump, lca as bin_lca, LevelAncestor
 from test_utils import gen_random_tree
 
 def get_parents_and_depth(tree, cur, p, d, par, depth):
@@ -36,13 +36,30 @@ def test_n(n, num):
         
         tbl = tree_jump(par)
         new_lca = LCA(tree)
+        la = LevelAncestor(par)
+        assert list(la.depth) == depth
         
+        qa = []
+        qb = []
         for _ in range(100):
             a = random.randint(0, n - 1)
             b = random.randint(0, n - 1)
             bin_lca_result = bin_lca(tbl, depth, a, b)
             new_lca_result = new_lca.lca(a, b)
             assert bin_lca_result == new_lca_result, f"Mismatch: bin={bin_lca_result}, new={new_lca_result}"
+            qa.append(a)
+            qb.append(b)
+        assert la.lca_many(qa, qb) == [new_lca.lca(a, b) for a, b in zip(qa, qb)]
+        
+        # k-th ancestors: O(1) ladders and batched jumps against walking up
+        ks = [random.randint(0, depth[a] + 1) for a in qa]
+        expect = []
+        for a, k in zip(qa, ks):
+            for _ in range(k):
+                a = par[a]
+            expect.append(a)
+        assert [la.ancestor(a, k) for a, k in zip(qa, ks)] == expect
+        assert la.jump_many(qa, ks) == expect
 
 def test_lca():
     """Run all LCA tests"""
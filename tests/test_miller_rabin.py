@@ -8,8 +8,10 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import random
-from number_theory.miller_rabin import is_prime
+from number_theory.miller_rabin import is_prime, is_prime_many
 from number_theory.eratosthenes import eratosthenes_sieve
+from number_theory.mod_mul_ll import modmul, modpow
+from number_theory.factor import factor, factor_many
 
 def test_miller_rabin():
     """Test Miller-Rabin primality test"""
@@ -51,6 +53,60 @@ def test_miller_rabin():
     
     print("Tests passed!")
 
+def test_is_prime_many():
+    """Batch (and pooled) test agrees with is_prime"""
+    random.seed(1)
+    ns = [random.randrange(1 << random.randint(1, 62)) for _ in range(3000)]
+    want = [is_prime(n) for n in ns]
+    assert is_prime_many(ns) == want
+    assert is_prime_many(ns, processes=2, chunk=500) == want
+
+def test_modmul():
+    """modmul/modpow are exact beyond 2^53"""
+    random.seed(2)
+    for _ in range(1000):
+        M = random.randrange(1, 1 << 63)
+        a = random.randrange(M)
+        b = random.randrange(M)
+        e = random.randrange(1 << 63)
+        assert modmul(a, b, M) == a * b % M
+        assert modpow(a, e, M) == pow(a, e, M)
+
+def _trial(n):
+    res = []
+    p = 2
+    while p * p <= n:
+        while n % p == 0:
+            res.append(p)
+            n //= p
+        p += 1
+    if n > 1:
+        res.append(n)
+    return res
+
+def test_factor():
+    """factor against trial division, plus 64-bit semiprimes"""
+    random.seed(3)
+    for n in list(range(1, 3000)) + [random.randrange(1, 10**10) for _ in range(300)]:
+        assert sorted(factor(n)) == _trial(n), n
+    ps = [p for p in (random.randrange(1 << 31, 1 << 32) for _ in range(400)) if is_prime(p)]
+    ns = []
+    for i in range(0, len(ps) - 1, 2):
+        ns.append(ps[i] * ps[i + 1])
+        ns.append(ps[i] * ps[i] * 6)
+    want = [sorted(factor(n)) for n in ns]
+    for n, f in zip(ns, want):
+        assert all(is_prime(p) for p in f)
+        prod = 1
+        for p in f:
+            prod *= p
+        assert prod == n
+    assert [sorted(f) for f in factor_many(ns)] == want
+    assert [sorted(f) for f in factor_many(ns, processes=2, chunk=16)] == want
+
 if __name__ == "__main__":
     test_miller_rabin()
+    test_is_prime_many()
+    test_modmul()
+    test_factor()
 
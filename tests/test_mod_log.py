@@ -0,0 +1,50 @@
+"""
+Tests for mod_log and DiscreteLog
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from number_theory.mod_log import mod_log, DiscreteLog
+
+def _brute(a, b, m):
+    e = 1
+    for x in range(1, m + 2):
+        e = e * a % m
+        if e == b % m:
+            return x
+    return -1
+
+def test_mod_log():
+    """mod_log and DiscreteLog against brute force for small moduli"""
+    for m in range(1, 120):
+        for a in range(m + 2):
+            L = DiscreteLog(a, m)
+            for b in range(m + 1):
+                want = _brute(a, b, m)
+                assert mod_log(a, b, m) == want, (a, b, m)
+                assert L.log(b) == want, (a, b, m)
+
+def test_discrete_log_large():
+    """Many queries against a fixed base, smooth and non-smooth orders"""
+    random.seed(21)
+    for a, m, table in [(3, 998244353, None), (5, 10**9 + 7, 1 << 16),
+                        (2, 2**61 - 1, None), (7, 10**12, None), (10, 3**20, 50)]:
+        L = DiscreteLog(a, m, table)
+        xs = [random.randrange(1, 10**18) for _ in range(30)]
+        bs = [pow(a, x, m) for x in xs]
+        res = L.log_many(bs)
+        for x, b, r in zip(xs, bs, res):
+            assert 0 < r <= x and pow(a, r, m) == b
+            assert (x - r) % L.n == 0
+        assert pow(a, L.n, m) == 1
+    # Not in the subgroup generated by a
+    L = DiscreteLog(4, 998244353)
+    assert L.log(3) == -1
+
+if __name__ == "__main__":
+    test_mod_log()
+    test_discrete_log_large()
+    print("Tests passed!")
@@ -0,0 +1,53 @@
+"""
+Tests for mod_sqrt and ModRoots
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from number_theory.mod_sqrt import mod_sqrt, ModRoots
+from number_theory.eratosthenes import eratosthenes_sieve
+
+def test_small_primes():
+    """Square roots, k-th roots and primitive roots for all small primes"""
+    for p in eratosthenes_sieve(300):
+        R = ModRoots(p)
+        squares = {y * y % p for y in range(p)}
+        for a, x in zip(range(-3, p + 3), R.sqrt_many(range(-3, p + 3))):
+            if a % p in squares:
+                assert x * x % p == a % p
+                assert mod_sqrt(a, p) ** 2 % p == a % p
+            else:
+                assert x == -1
+        g = R.primitive_root()
+        assert len({pow(g, i, p) for i in range(p - 1)}) == p - 1
+        assert all(len({pow(h, i, p) for i in range(p - 1)}) < p - 1 for h in range(1, g))
+        for k in range(1, 25):
+            powers = {pow(y, k, p) for y in range(p)}
+            for a, x in zip(range(p), R.kth_root_many(range(p), k)):
+                if a in powers:
+                    assert pow(x, k, p) == a, (p, k, a)
+                else:
+                    assert x == -1
+
+def test_large_primes():
+    """Batches for large primes with big 2-adic and r-adic parts"""
+    random.seed(31)
+    for p in [998244353, 10**9 + 7, 2**61 - 1, 7 * 2**26 + 1, 2 * 3**25 * 5**4 + 1,
+              1000000000000000003]:
+        R = ModRoots(p)
+        ys = [random.randrange(1, p) for _ in range(300)]
+        vals = [y * y % p for y in ys]
+        assert [x * x % p for x in R.sqrt_many(vals)] == vals
+        for k in [3, 5, 6, 12, 1 << 20, 3 * 7 * 17, 3**20 * 25]:
+            vals = [pow(y, k, p) for y in ys[:60]]
+            assert [pow(x, k, p) for x in R.kth_root_many(vals, k)] == vals
+        g = R.primitive_root()
+        assert R.kth_root(g, 2) == -1
+
+if __name__ == "__main__":
+    test_small_primes()
+    test_large_primes()
+    print("Tests passed!")
@@ -0,0 +1,57 @@
+"""
+Tests for modsum, divsum and the generalized floor sums
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from number_theory.mod_sum import (modsum, divsum, modsum_many, divsum_many,
+                                   divsum_powers, divsum_weighted)
+
+def test_mod_sum():
+    """All |k|,|c|,to,m <= 20 against brute force"""
+    for to in range(21):
+        for c in range(-20, 21):
+            for k in range(-20, 21):
+                for m in range(1, 21):
+                    assert divsum(to, c, k, m) == sum((k * i + c) // m for i in range(to))
+                    assert modsum(to, c, k, m) == sum((k * i + c) % m for i in range(to))
+
+def test_many():
+    """Batched queries with large parameters"""
+    random.seed(41)
+    n = 500
+    tos = [random.randrange(2000) for _ in range(n)]
+    cs = [random.randrange(-10**12, 10**12) for _ in range(n)]
+    ks = [random.randrange(-10**12, 10**12) for _ in range(n)]
+    ms = [random.randrange(1, 10**12) for _ in range(n)]
+    assert divsum_many(tos, cs, ks, ms) == \
+        [sum((k * i + c) // m for i in range(to)) for to, c, k, m in zip(tos, cs, ks, ms)]
+    assert modsum_many(tos, cs, ks, ms) == \
+        [sum((k * i + c) % m for i in range(to)) for to, c, k, m in zip(tos, cs, ks, ms)]
+
+def test_powers():
+    """divsum_powers / divsum_weighted against brute force"""
+    random.seed(42)
+    for _ in range(2000):
+        to = random.randint(-2, 50)
+        c = random.randint(-80, 80)
+        k = random.randint(-80, 80)
+        m = random.randint(1, 80)
+        K = random.randint(0, 4)
+        S = divsum_powers(to, c, k, m, K)
+        for p in range(K + 1):
+            for q in range(K + 1 - p):
+                assert S[p][q] == sum(i ** p * ((k * i + c) // m) ** q for i in range(to))
+    to, c, k, m = 10**5, 10**9 + 3, 987654321, 10**6 + 3
+    for p in range(4):
+        assert divsum_weighted(to, c, k, m, p) == sum(i ** p * ((k * i + c) // m) for i in range(to))
+    assert divsum_powers(to, c, k, m, 1)[0][1] == divsum(to, c, k, m)
+
+if __name__ == "__main__":
+    test_mod_sum()
+    test_many()
+    test_powers()
+    print("Tests passed!")
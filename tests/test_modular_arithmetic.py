@@ -0,0 +1,90 @@
+"""
+Tests for Mod, ModArray, batch_inverse and NTT convolution
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+from number_theory.modular_arithmetic import Mod, ModArray
+from number_theory.mod_inverse import compute_inverses, batch_inverse
+from numerical.ntt import conv, MOD
+
+def test_mod_per_instance():
+    """Mod instances with an explicit modulus ignore Mod.mod"""
+    a = Mod(5, 7)
+    b = Mod(3, 7)
+    assert int(a * b) == 1 and int(a + b) == 1 and int(a - b) == 2
+    assert int(a / b) == 4 and int(a ** 6) == 1
+    assert int(Mod(5) * Mod(3)) == 15
+
+def test_mod_array():
+    """Elementwise ops against per-element arithmetic"""
+    random.seed(5)
+    for _ in range(200):
+        m = random.choice([2, 7, 998244353, 10**9 + 7, (1 << 61) - 1, random.randrange(2, 10**18)])
+        n = random.randint(0, 30)
+        xs = [random.randrange(-m, 2 * m) for _ in range(n)]
+        ys = [random.randrange(-m, 2 * m) for _ in range(n)]
+        a = ModArray(xs, m)
+        b = ModArray(ys, m)
+        c = random.randrange(-10**20, 10**20)
+        assert a.tolist() == [x % m for x in xs]
+        assert (a + b).tolist() == [(x + y) % m for x, y in zip(xs, ys)]
+        assert (a - b).tolist() == [(x - y) % m for x, y in zip(xs, ys)]
+        assert (a * b).tolist() == [x * y % m for x, y in zip(xs, ys)]
+        assert (c - a).tolist() == [(c - x) % m for x in xs]
+        assert (c * a + c).tolist() == [(c * x + c) % m for x in xs]
+        assert (-a).tolist() == [-x % m for x in xs]
+        assert (a ** 5).tolist() == [pow(x, 5, m) for x in xs]
+        assert a.sum() == sum(xs) % m
+        assert a.dot(b) == sum(x * y for x, y in zip(xs, ys)) % m
+        pre = []
+        p = 1
+        for x in xs:
+            p = p * x % m
+            pre.append(p)
+        assert a.prefix_products().tolist() == pre
+        assert a[1:4] == ModArray(xs[1:4], m)
+        inv = [x for x in xs if math.gcd(x, m) == 1]
+        v = ModArray(inv, m)
+        assert (v * v.inverse()).tolist() == [1 % m] * len(inv)
+        assert (a[:len(inv)] / v).tolist() == [x * pow(y, -1, m) % m for x, y in zip(xs, inv)]
+
+def test_batch_inverse():
+    """batch_inverse matches pow(x, -1, m) and compute_inverses"""
+    random.seed(6)
+    mod = 10**9 + 7
+    assert batch_inverse(range(1, 1000), mod) == compute_inverses(1000, mod)[1:]
+    assert batch_inverse([], mod) == []
+    m = 2**64
+    xs = [random.randrange(m) | 1 for _ in range(500)]
+    assert batch_inverse(xs, m) == [pow(x, -1, m) for x in xs]
+    try:
+        batch_inverse([3, 4, 5], 12)
+        assert False
+    except ValueError:
+        pass
+
+def test_ntt_conv():
+    """NTT convolution against the naive product"""
+    random.seed(7)
+    for _ in range(200):
+        a = [random.randrange(MOD) for _ in range(random.randint(0, 70))]
+        b = [random.randrange(MOD) for _ in range(random.randint(0, 70))]
+        want = [0] * (len(a) + len(b) - 1) if a and b else []
+        for i, x in enumerate(a):
+            for j, y in enumerate(b):
+                want[i + j] = (want[i + j] + x * y) % MOD
+        assert conv(a, b) == want
+        if a and b:
+            assert ModArray(a, MOD).conv(ModArray(b, MOD)).tolist() == want
+
+if __name__ == "__main__":
+    test_mod_per_instance()
+    test_mod_array()
+    test_batch_inverse()
+    test_ntt_conv()
+    print("Tests passed!")
@@ -0,0 +1,51 @@
+"""
+Test for multiplicative function tables
+Compared against direct computation from the factorization
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+from number_theory.multiplicative import (multiplicative_tables, smallest_prime_factor,
+                                          factor_small, factor_small_many)
+from number_theory.phi_function import calculate_phi
+
+def trial_division(n):
+    f = []
+    p = 2
+    while p * p <= n:
+        while n % p == 0:
+            f.append(p)
+            n //= p
+        p += 1
+    if n > 1:
+        f.append(n)
+    return f
+
+def test_tables():
+    for LIM in list(range(0, 30)) + [2000]:
+        spf, phi, mu, d, sigma = multiplicative_tables(LIM)
+        assert spf == smallest_prime_factor(LIM)
+        assert phi == calculate_phi(LIM)
+        for n in range(1, LIM):
+            f = trial_division(n)
+            assert spf[n] == (f[0] if f else 1)
+            assert factor_small(n, spf) == f
+            assert phi[n] == sum(1 for k in range(1, n + 1) if math.gcd(k, n) == 1)
+            assert mu[n] == (0 if len(set(f)) < len(f) else (-1) ** len(f))
+            divs = [k for k in range(1, n + 1) if n % k == 0]
+            assert d[n] == len(divs) and sigma[n] == sum(divs)
+
+def test_factor_small_many():
+    random.seed(16)
+    spf = smallest_prime_factor(10**5)
+    ns = [random.randrange(1, 10**5) for _ in range(2000)]
+    assert factor_small_many(ns, spf) == [trial_division(n) for n in ns]
+
+if __name__ == "__main__":
+    test_tables()
+    test_factor_small_many()
+    print("Tests passed!")
@@ -0,0 +1,130 @@
+"""
+Test for push_relabel
+Stress-tested against Dinic
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.dinic import Dinic
+from graph.push_relabel import PushRelabel, paired_min_cut
+from graph.gomory_hu import gomory_hu
+from graph.grid_flow import grid_min_cut
+
+def random_network(n, m):
+    return [(random.randrange(n), random.randrange(n), random.randint(0, 10),
+             random.choice([0, random.randint(0, 5)])) for _ in range(m)]
+
+def dinic_flow(n, eds, s, t):
+    d = Dinic(n)
+    for a, b, c, r in eds:
+        d.add_edge(a, b, c, r)
+    return d.calc(s, t)
+
+def test_flow_and_cut():
+    random.seed(7)
+    for _ in range(1000):
+        n = random.randint(2, 9)
+        eds = random_network(n, random.randint(0, 25))
+        pr = PushRelabel(n)
+        for a, b, c, r in eds:
+            pr.add_edge(a, b, c, r)
+        for _ in range(3):
+            s, t = random.sample(range(n), 2)
+            exp = dinic_flow(n, eds, s, t)
+            min_cut_only = random.random() < 0.5
+            assert pr.calc(s, t, min_cut_only) == exp
+
+            cut = [pr.left_of_min_cut(v) for v in range(n)]
+            assert cut[s] and not cut[t]
+            assert exp == sum(c for a, b, c, r in eds if cut[a] and not cut[b]) + \
+                sum(r for a, b, c, r in eds if cut[b] and not cut[a])
+
+            if not min_cut_only:
+                bal = [0] * n
+                for i, (a, b, c, r) in enumerate(eds):
+                    f = pr.flow(i)
+                    assert -r <= f <= c
+                    bal[a] -= f
+                    bal[b] += f
+                assert bal[s] == -exp and bal[t] == exp
+                assert all(bal[v] == 0 for v in range(n) if v != s and v != t)
+
+def test_paired_min_cut():
+    random.seed(8)
+    for _ in range(500):
+        n = random.randint(2, 9)
+        eds = random_network(n, random.randint(0, 25))
+        A = [x for a, b, c, r in eds for x in (a, b)]
+        C = [x for a, b, c, r in eds for x in (c, r)]
+        s, t = random.sample(range(n), 2)
+        exp = dinic_flow(n, eds, s, t)
+        flow, cut = paired_min_cut(n, A, C, s, t)
+        assert flow == exp and cut[s] and not cut[t]
+        assert exp == sum(c for a, b, c, r in eds if cut[a] and not cut[b]) + \
+            sum(r for a, b, c, r in eds if cut[b] and not cut[a])
+
+def test_gomory_hu():
+    random.seed(8)
+    for _ in range(200):
+        n = random.randint(2, 8)
+        eds = [(random.randrange(n), random.randrange(n), random.randint(0, 10))
+               for _ in range(random.randint(0, 15))]
+        tree = gomory_hu(n, eds)
+        adj = [[] for _ in range(n)]
+        for a, b, w in tree:
+            adj[a].append((b, w))
+            adj[b].append((a, w))
+        for s in range(n):
+            # Minimum edge on the tree path from s
+            best = [None] * n
+            best[s] = float('inf')
+            stack = [s]
+            while stack:
+                v = stack.pop()
+                for u, w in adj[v]:
+                    if best[u] is None:
+                        best[u] = min(best[v], w)
+                        stack.append(u)
+            for t in range(s + 1, n):
+                assert best[t] == dinic_flow(n, [(a, b, c, c) for a, b, c in eds], s, t)
+
+def test_grid():
+    random.seed(9)
+    for _ in range(300):
+        R = random.randint(1, 5)
+        C = random.randint(1, 5)
+        N = R * C
+        w = [[random.randint(0, 9) for _ in range(N)] for _ in range(6)]
+        for eight in (False, True):
+            diag, anti = (w[4], w[5]) if eight else (None, None)
+            flow, cut = grid_min_cut(R, C, w[0], w[1], w[2], w[3], diag, anti)
+
+            d = Dinic(N + 2)
+            eds = []
+            for v in range(N):
+                i, j = divmod(v, C)
+                d.add_edge(N, v, w[0][v])
+                d.add_edge(v, N + 1, w[1][v])
+                eds.append((N, v, w[0][v]))
+                eds.append((v, N + 1, w[1][v]))
+                for di, dj, k in ((0, 1, 2), (1, 0, 3), (1, 1, 4), (1, -1, 5)):
+                    if k >= 4 and not eight:
+                        continue
+                    if 0 <= i + di < R and 0 <= j + dj < C:
+                        u = v + di * C + dj
+                        d.add_edge(v, u, w[k][v], w[k][v])
+                        eds.append((v, u, w[k][v]))
+                        eds.append((u, v, w[k][v]))
+            assert flow == d.calc(N, N + 1)
+            side = list(cut) + [1, 0]
+            assert flow == sum(c for a, b, c in eds if side[a] and not side[b])
+
+if __name__ == "__main__":
+    test_flow_and_cut()
+    test_paired_min_cut()
+    test_gomory_hu()
+    test_grid()
+    print("Tests passed!")
@@ -0,0 +1,57 @@
+"""
+Test for scc and euler_walk on edge arrays
+Compared against the adjacency-list versions
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.scc import scc, scc_edges
+from graph.euler_walk import euler_walk, euler_walk_edges
+
+def random_edges(n, m):
+    return ([random.randrange(n) for _ in range(m)],
+            [random.randrange(n) for _ in range(m)])
+
+def test_scc_edges():
+    random.seed(11)
+    for _ in range(3000):
+        n = random.randint(1, 10)
+        a, b = random_edges(n, random.randint(0, 25))
+        g = [[] for _ in range(n)]
+        for x, y in zip(a, b):
+            g[x].append(y)
+        comps = []
+        comp, ncomps = scc(g, lambda c: comps.append(sorted(c)))
+        comp2, off, nodes = scc_edges(n, a, b)
+        assert list(comp2) == comp and len(off) == ncomps + 1
+        assert [sorted(nodes[off[c]:off[c + 1]]) for c in range(ncomps)] == comps
+
+def test_euler_walk_edges():
+    random.seed(12)
+    for _ in range(3000):
+        n = random.randint(1, 6)
+        m = random.randint(0, 10)
+        a, b = random_edges(n, m)
+        for directed in (True, False):
+            gr = [[] for _ in range(n)]
+            for i, (x, y) in enumerate(zip(a, b)):
+                gr[x].append((y, i))
+                if not directed:
+                    gr[y].append((x, i))
+            src = random.randrange(n)
+            walk = euler_walk_edges(n, a, b, src, directed)
+            assert (walk is None) == (euler_walk(gr, m, src) == [])
+            if walk is not None:
+                assert sorted(walk) == list(range(m))
+                x = src
+                for e in walk:
+                    assert x == a[e] or (not directed and x == b[e])
+                    x = b[e] if x == a[e] else a[e]
+
+if __name__ == "__main__":
+    test_scc_edges()
+    test_euler_walk_edges()
+    print("Tests passed!")
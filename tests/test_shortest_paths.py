@@ -0,0 +1,66 @@
+"""
+Test for shortest_paths
+Stress-tested against bellman_ford
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from graph.bellman_ford import bellman_ford, Node, Edge, INF
+from graph.shortest_paths import (csr_graph, reverse_graph, dijkstra, dijkstra_many,
+                                  zero_one_bfs, bidirectional_dijkstra, spfa)
+
+def reference(n, eds, s):
+    nodes = [Node() for _ in range(n)]
+    bellman_ford(nodes, [Edge(a, b, w) for a, b, w in eds], s)
+    return [nd.dist for nd in nodes]
+
+def random_edges(n, m, lo, hi):
+    return [(random.randrange(n), random.randrange(n), random.randint(lo, hi)) for _ in range(m)]
+
+def test_non_negative():
+    random.seed(42)
+    for _ in range(500):
+        n = random.randint(1, 20)
+        eds = random_edges(n, random.randint(0, 50), 0, 10)
+        g = csr_graph(n, eds)
+        rg = reverse_graph(g)
+        rows = dijkstra_many(g, range(n))
+        for s in range(n):
+            ref = reference(n, eds, s)
+            dist, prev = dijkstra(g, s)
+            assert dist == ref == rows[s]
+            assert spfa(g, s) == ref
+            for v in range(n):
+                if v != s and dist[v] != INF:
+                    assert any(a == prev[v] and b == v and dist[a] + w == dist[v] for a, b, w in eds)
+            t = random.randrange(n)
+            assert bidirectional_dijkstra(g, rg, s, t) == ref[t]
+
+def test_multi_source_and_zero_one():
+    random.seed(7)
+    for _ in range(500):
+        n = random.randint(1, 20)
+        eds = random_edges(n, random.randint(0, 50), 0, 1)
+        g = csr_graph(n, eds, directed=random.choice([True, False]))
+        srcs = random.sample(range(n), random.randint(1, n))
+        rows = dijkstra_many(g, srcs)
+        expect = [min(r[v] for r in rows) for v in range(n)]
+        assert dijkstra(g, srcs)[0] == expect
+        assert zero_one_bfs(g, srcs)[0] == expect
+
+def test_negative_cycles():
+    random.seed(3)
+    for _ in range(2000):
+        n = random.randint(1, 10)
+        eds = random_edges(n, random.randint(0, 20), -3, 10)
+        s = random.randrange(n)
+        assert spfa(csr_graph(n, eds), s) == reference(n, eds, s)
+
+if __name__ == "__main__":
+    test_non_negative()
+    test_multi_source_and_zero_one()
+    test_negative_cycles()
+    print("Tests passed!")
@@ -8,7 +8,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import random
-from graph.topo_sort import topo_sort
+from graph.topo_sort import topo_sort, topo_sort_edges
 
 def test_topo_sort():
     """Test topological sort with random graphs"""
@@ -30,6 +30,9 @@ def test_topo_sort():
             ed[order[a]].append(order[b])
         
         ret = topo_sort(ed)
+        a = [i for i in range(n) for j in ed[i]]
+        b = [j for i in range(n) for j in ed[i]]
+        assert list(topo_sort_edges(n, a, b)) == ret
         if acyclic:
             assert len(ret) == n, f"Expected {n} nodes, got {len(ret)}"
         else:
@@ -0,0 +1,53 @@
+"""
+Test for WeightedMatching (hungarian) and auction
+Stress-tested against brute force over all assignments
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from itertools import permutations
+from graph.weighted_matching import hungarian
+from graph.auction import auction
+
+def test_hungarian():
+    random.seed(42)
+    for _ in range(3000):
+        n = random.randint(1, 6)
+        m = random.randint(1, 6)
+        a = [[random.randint(-10, 10) for _ in range(m)] for _ in range(n)]
+        cost, match = hungarian(a)
+        if n <= m:
+            best = min(sum(a[i][p[i]] for i in range(n)) for p in permutations(range(m), n))
+        else:
+            best = min(sum(a[p[j]][j] for j in range(m)) for p in permutations(range(n), m))
+        assert cost == best
+        used = [j for j in match if j != -1]
+        assert len(used) == len(set(used)) == min(n, m)
+        assert sum(a[i][j] for i, j in enumerate(match) if j != -1) == cost
+
+def test_auction():
+    random.seed(7)
+    BIG = 10**9
+    for _ in range(3000):
+        n = random.randint(0, 7)
+        adj = [[(j, random.randint(-20, 20)) for j in range(n) if random.random() < 0.5]
+               for _ in range(n)]
+        a = [[BIG] * n for _ in range(n)]
+        for i in range(n):
+            for j, c in adj[i]:
+                a[i][j] = min(a[i][j], c)
+        cost = hungarian(a)[0]
+        res = auction(adj)
+        if cost >= BIG // 2:
+            assert res is None
+        else:
+            assert res[0] == cost
+            assert sorted(res[1]) == list(range(n))
+
+if __name__ == "__main__":
+    test_hungarian()
+    test_auction()
+    print("Tests passed!")